@@ -8,13 +8,26 @@
 
 """
 
+import os
+import re
 import sys
-from jedi import settings, Script
+from jedi import settings, Script, preload_module
 
 from hydratk.extensions.client.core.tkimport import tk, ttk
+from hydratk.extensions.client.core.tooltip import CallTip
+from hydratk.extensions.client.core.colorizer import Colorizer
+from hydratk.extensions.client.core.worker import Worker
+from hydratk.extensions.client.core.symbolindex import SymbolIndex
 
 class AutoCompleter(object):
     """Class AutoCompleter
+
+    Jedi is called in dedicated background worker, newer request supersedes
+    older one and result is dropped if completion context was changed meanwhile.
+    Popup stays open while typing, candidates are filtered without jedi until
+    context is changed by new identifier or attribute access.
+    Call tips are served from signature cache filled in background.
+
     """
 
     _instance = None
@@ -24,6 +37,33 @@ class AutoCompleter(object):
     _root = None
     _config = None
     _tab = None
+    _worker = None
+    _index = None
+
+    # completion
+    _pythonpath = None
+    _modules = None
+    _preamble = None
+    _key = ('autocompleter', 'completion')
+    _ident_re = re.compile(r'\w*$', re.UNICODE)
+    _module_re = re.compile(r'([\w.]+)\.$', re.UNICODE)
+
+    # completion session
+    _context = None
+    _prefix = None
+    _candidates = None
+    _filtered = None
+    _loading = False
+    _top = 0
+    _selected = 0
+    _height = 10
+
+    # call tip
+    _calltip = None
+    _call = None
+    _signatures = None
+    _callee_re = re.compile(r'([\w.]+)\s*$', re.UNICODE)
+    _calltip_key = ('autocompleter', 'calltip')
 
     # gui elements
     _win = None
@@ -51,6 +91,11 @@ class AutoCompleter(object):
         from hydratk.extensions.client.core.gui import Gui
         self._root = Gui.get_instance()
         self._config = self.root.cfg
+        self._worker = Worker(self.root)
+        self._index = SymbolIndex.get_instance()
+        self._pythonpath = []
+        self._modules = []
+        self._signatures = {}
 
         self._parse_config()
 
@@ -90,6 +135,18 @@ class AutoCompleter(object):
 
         return self._tab
 
+    @property
+    def worker(self):
+        """ worker property getter, jedi is not thread safe so all calls share single thread """
+
+        return self._worker
+
+    @property
+    def index(self):
+        """ index property getter """
+
+        return self._index
+
     def _parse_config(self):
         """Method parses configuration
 
@@ -107,6 +164,8 @@ class AutoCompleter(object):
     def update_pythonpath(self):
         """Method updates Python path
 
+        Project libraries are preloaded and indexed in background
+
         Args:
             none
 
@@ -120,12 +179,148 @@ class AutoCompleter(object):
                 for p in project['pythonpath']:
                     if (p not in sys.path):
                         sys.path.append(p)
+                    if (p not in self._pythonpath):
+                        self._pythonpath.append(p)
+
+        self._modules = self._get_project_modules()
+        self._preamble = None
+        self.preload()
+        self.index.update(self._pythonpath)
+
+    def _get_project_modules(self):
+        """Method gets top level modules of project libraries
+
+        Args:
+            none
+
+        Returns:
+            list
+
+        """
+
+        modules = []
+        for path in self._pythonpath:
+            if (os.path.isdir(path)):
+                for name in sorted(os.listdir(path)):
+                    if (name.endswith('.py') and name != '__init__.py'):
+                        modules.append(name[:-3])
+                    elif (os.path.isfile(os.path.join(path, name, '__init__.py'))):
+                        modules.append(name)
+
+        return modules
+
+    def preload(self):
+        """Method warms up jedi cache with project libraries in background
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        if (len(self._modules) > 0):
+            self.worker.submit(preload_module, self._modules, key=('autocompleter', 'preload'))
+
+    def _get_preamble(self):
+        """Method gets virtual preamble prepended to Python code of test
+
+        Preamble imports project libraries, it is cached until Python path is updated
+
+        Args:
+            none
+
+        Returns:
+            str
+
+        """
+
+        if (self._preamble is None):
+            self._preamble = ''.join(['import {0}\n'.format(module) for module in self._modules])
+
+        return self._preamble
+
+    def _get_block(self, tab, row):
+        """Method gets Python block of test containing row
+
+        Args:
+            tab (obj): tab reference
+            row (int): row
+
+        Returns:
+            tuple: first row (int), lines (list), indent (int), None if row is not in Python code
+
+        """
+
+        rows = tab.lexer.get_block(tab.document, row)
+        if (rows is None):
+            return None
+
+        lines = tab.document.get_lines(*rows)
+        indent = min([len(line) - len(line.lstrip()) for line in lines if (len(line.strip()) > 0)] or [0])
+
+        return rows[0], lines, indent
+
+    def get_source(self, tab, row, col):
+        """Method gets source code for jedi
+
+        For test file only Python block containing cursor is used, it is dedented
+        and preamble is prepended. Cursor position is mapped into source.
+
+        Args:
+            tab (obj): tab reference
+            row (int): row
+            col (int): column
+
+        Returns:
+            tuple: source (str), row (int), column (int), None if cursor is not in Python code
+
+        """
+
+        if (tab.lexer is None or tab.lexer.lexer_id != 'yoda'):
+            return tab.get_content(), row, col
+
+        block = self._get_block(tab, row)
+        if (block is None):
+            return None
+
+        first, lines, indent = block
+        preamble = self._get_preamble()
+
+        return preamble + '\n'.join([line[indent:] for line in lines]), row - first + 1 + preamble.count('\n'), max(col - indent, 0)
+
+    def get_tab_position(self, tab, row, source_row, source_col):
+        """Method maps position in source got by get_source back to tab
+
+        Args:
+            tab (obj): tab reference
+            row (int): row passed to get_source
+            source_row (int): row in source
+            source_col (int): column in source
+
+        Returns:
+            tuple: row (int), column (int), None if position is in preamble
 
-    def _set_gui(self, completions):
+        """
+
+        if (tab.lexer is None or tab.lexer.lexer_id != 'yoda'):
+            return source_row, source_col
+
+        block = self._get_block(tab, row)
+        source_row -= self._get_preamble().count('\n')
+        if (block is None or source_row < 1):
+            return None
+
+        return block[0] + source_row - 1, source_col + block[2]
+
+    def _set_gui(self):
         """Method sets graphical interface
 
+        Window is created once and reused, it does not take focus
+
         Args:
-            completions (list): code completions
+            none
 
         Returns:
             void
@@ -133,37 +328,88 @@ class AutoCompleter(object):
         """
         
         self._win = tk.Toplevel(self.root)
-        self._win.title('')
-        self._win.geometry('+%d+%d' % (self.root.winfo_screenwidth() / 3, self.root.winfo_screenheight() / 3))
-        self._win.tk.call('wm', 'iconphoto', self._win._w, self.root.images['logo'])
-
-        self._vbar = ttk.Scrollbar(self._win, orient=tk.VERTICAL)
-        self._tree = ttk.Treeview(self._win, columns=('complete', 'type', 'params'), show='tree', displaycolumns=(), height=10, selectmode='browse',
-                                  yscrollcommand=self._vbar.set)
-        self._vbar.config(command=self._tree.yview)
+        self._win.withdraw()
+        self._win.overrideredirect(True)
+
+        self._vbar = ttk.Scrollbar(self._win, orient=tk.VERTICAL, command=self._scroll)
+        self._tree = ttk.Treeview(self._win, show='tree', height=self._height, selectmode='browse', takefocus=0)
         self._vbar.pack(side=tk.RIGHT, fill=tk.Y)
         self._tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        self._win.bind('<Escape>', lambda f: self._win.destroy())
+        self._tree.bind('<ButtonRelease-1>', self._on_click)
         self._tree.bind('<Double-1>', self._complete)
-        self._tree.bind('<Return>', self._complete)
 
-        for c in completions:
-            try:
-                params = []
-                for p in c.params:
-                    params.append(p.name)
-                params = ','.join(params)
-                self._tree.insert('', 'end', text=c.name, values=(c.complete, c.type, params))
-            except (AttributeError, NotImplementedError):
-                self._tree.insert('', 'end', text=c.name, values=(c.complete, c.type, ''))
+    @property
+    def active(self):
+        """ active property getter, completion session is open """
+
+        return self._context is not None
+
+    def _show(self, tab):
+        """Method shows window below cursor
+
+        Args:
+            tab (obj): tab reference
+
+        Returns:
+            void
+
+        """
+
+        if (self._win is None):
+            self._set_gui()
 
-        self._tree.focus(self._tree.get_children()[0])
-        self._tree.focus_set()
+        bbox = tab.text.bbox(tk.INSERT)
+        if (bbox is not None):
+            x, y = tab.text.winfo_rootx() + bbox[0], tab.text.winfo_rooty() + bbox[1] + bbox[3]
+        else:
+            x, y = self.root.winfo_screenwidth() / 3, self.root.winfo_screenheight() / 3
+        self._win.geometry('+%d+%d' % (x, y))
+        self._win.deiconify()
+        self._win.lift()
+
+    def close(self, event=None):
+        """Method closes completion session and hides window
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        self._context, self._prefix, self._candidates, self._filtered = None, None, None, None
+        self._loading = False
+        self.worker.cancel(self._key)
+        if (self._win is not None):
+            self._win.withdraw()
+
+    def _get_context(self, tab):
+        """Method gets completion context at cursor
+
+        Context is given by identifier start and text before it
+
+        Args:
+            tab (obj): tab reference
+
+        Returns:
+            tuple: context (row, column, line start), identifier prefix (str)
+
+        """
+
+        row, col = [int(i) for i in tab.text.index(tk.INSERT).split('.')]
+        line = tab.document.get_line(row)[:col]
+        start = col - len(self._ident_re.search(line).group(0))
+
+        return (row, start, line[:start]), line[start:]
 
     def show_completion(self, tab):
         """Method shows code completion window
 
+        Completions are searched in background for completion context,
+        only Python code around cursor is passed to jedi for test file
+
         Args:
             tab (obj): tab reference
 
@@ -172,58 +418,373 @@ class AutoCompleter(object):
 
         """
 
-        if (self._win is not None):
-            self._win.destroy()
+        if (tab.path is None or tab.path.split('.')[-1] not in ['py', 'jedi', 'padawan']):
+            return
 
-        suffix = tab.path.split('.')[-1]
-        if (suffix in ['py', 'jedi', 'padawan']):
-            self._tab = tab
-            row, col = tab.text.index(tk.INSERT).split('.')
+        context, prefix = self._get_context(tab)
+        if (tab is self._tab and context == self._context and self._candidates is not None):
+            self._update_list(prefix)
+        else:
+            self._request(tab, context, prefix, True)
+
+    def _request(self, tab, context, prefix, complete_single=False):
+        """Method requests completions for context
+
+        Args:
+            tab (obj): tab reference
+            context (tuple): completion context
+            prefix (str): identifier prefix
+            complete_single (bool): complete directly if single completion is found
+
+        Returns:
+            void
+
+        """
+
+        row, col = context[0], context[1] + len(prefix)
+        source = self.get_source(tab, row, col)
+        if (source is None):
+            self.close()
+            return
+
+        self._tab, self._context, self._prefix, self._loading = tab, context, prefix, True
+        self._candidates = self._get_index_candidates(context)
+        self._show(tab)
+        if (self._candidates is not None):
+            self._update_list(prefix)
+        else:
+            self._render_loading()
+
+        self.worker.submit(self._get_completions, source,
+                           lambda completions: self._show_completions(tab, context, complete_single, completions), key=self._key)
+
+    @staticmethod
+    def _get_completions(content, row, col):
+        """Method gets code completions, executed in background thread
+
+        Args:
+            content (str): text content
+            row (int): row
+            col (int): column
 
+        Returns:
+            list: completions (name, type, params)
+
+        """
+
+        try:
+            completions = Script(content, row, col).completions()
+        except ValueError:
+            return []
+
+        result = []
+        for c in completions:
             try:
-                script = Script(tab.text.get('1.0', 'end-1c'), int(row), int(col))
-                completions = script.completions()
-            except ValueError:
-                return
+                params = ','.join([p.name for p in c.params])
+            except (AttributeError, NotImplementedError):
+                params = ''
+            result.append((c.name, c.type, params))
+
+        return result
+
+    def _show_completions(self, tab, context, complete_single, completions):
+        """Method shows found completions
+
+        Completions are dropped if session was closed or completion context was changed
+
+        Args:
+            tab (obj): tab reference
+            context (tuple): completion context of request
+            complete_single (bool): complete directly if single completion is found
+            completions (list): code completions
+
+        Returns:
+            void
+
+        """
+
+        if (tab is not self._tab or context != self._context):
+            return
+        elif (not tab.winfo_exists() or self._get_context(tab)[0] != context):
+            self.close()
+            return
+
+        self._candidates, self._loading = completions, False
+        self._update_list(self._get_context(tab)[1], complete_single)
+
+    def _get_index_candidates(self, context):
+        """Method gets candidates from symbol index
+
+        Symbols of indexed module are served instantly for attribute access
+        until jedi completions are found
+
+        Args:
+            context (tuple): completion context
+
+        Returns:
+            list: candidates (name, type, params), None if module is not indexed
+
+        """
+
+        match = self._module_re.search(context[2])
+        symbols = self.index.get_module_symbols(match.group(1)) if (match is not None) else []
+        if (len(symbols) == 0):
+            return None
+
+        return [(symbol[0], symbol[1], ','.join([p.split('=')[0].lstrip('*') for p in symbol[5] if (p != '*')]))
+                for symbol in symbols]
 
-            cnt = len(completions)
-            if (cnt == 0):
-                return
+    def _filter(self, prefix):
+        """Method filters candidates by prefix
 
-            if (cnt == 1):
-                self._complete(completion=completions[0])
+        Prefix matches are followed by fuzzy matches containing prefix characters in order
+
+        Args:
+            prefix (str): identifier prefix
+
+        Returns:
+            list
+
+        """
+
+        prefix = prefix.lower()
+        matches, fuzzy = [], []
+        for candidate in self._candidates:
+            name = candidate[0].lower()
+            if (name.startswith(prefix)):
+                matches.append(candidate)
             else:
-                self._set_gui(completions)
+                chars = iter(name)
+                if (all(c in chars for c in prefix)):
+                    fuzzy.append(candidate)
+
+        return matches + fuzzy
+
+    def _update_list(self, prefix, complete_single=False):
+        """Method updates list of filtered candidates
+
+        Args:
+            prefix (str): identifier prefix
+            complete_single (bool): complete directly if single candidate is found
+
+        Returns:
+            void
+
+        """
+
+        self._prefix = prefix
+        self._filtered = self._filter(prefix)
+        self._top, self._selected = 0, 0
+        if (len(self._filtered) == 0 and self._loading):
+            self._render_loading()
+        elif (len(self._filtered) == 0):
+            self.close()
+        elif (len(self._filtered) == 1 and complete_single and not self._loading):
+            self._complete()
+        else:
+            self._show(self._tab)
+            self._render()
 
-    def _complete(self, event=None, completion=None):
-        """Method completes code
+    def _render_loading(self):
+        """Method displays loading state
 
         Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._tree.delete(*self._tree.get_children())
+        self._tree.insert('', 'end', text=self.root.trn.msg('htk_gui_autocompleter_loading'))
+        self._vbar.set(0.0, 1.0)
+
+    def _render(self):
+        """Method populates visible rows only
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._tree.delete(*self._tree.get_children())
+        cnt = len(self._filtered)
+        for i in range(self._top, min(self._top + self._height, cnt)):
+            self._tree.insert('', 'end', iid=str(i), text=self._filtered[i][0])
+        self._tree.selection_set(str(self._selected))
+        self._vbar.set(float(self._top) / cnt, float(min(self._top + self._height, cnt)) / cnt)
+
+    def _move(self, delta):
+        """Method moves selection
+
+        Args:
+            delta (int): count of rows
+
+        Returns:
+            void
+
+        """
+
+        self._selected = min(max(self._selected + delta, 0), len(self._filtered) - 1)
+        if (self._selected < self._top):
+            self._top = self._selected
+        elif (self._selected >= self._top + self._height):
+            self._top = self._selected - self._height + 1
+        self._render()
+
+    def _scroll(self, *args):
+        """Method handles scrollbar event
+
+        Args:
+            args (list): arguments
+
+        Returns:
+            void
+
+        """
+
+        if (not self._filtered):
+            return
+
+        cnt = len(self._filtered)
+        if (args[0] == 'moveto'):
+            top = int(float(args[1]) * cnt)
+        else:
+            top = self._top + int(args[1]) * (self._height if (args[2] == 'pages') else 1)
+        self._top = min(max(top, 0), max(cnt - self._height, 0))
+        self._selected = min(max(self._selected, self._top), self._top + self._height - 1)
+        self._render()
+
+    def _on_click(self, event=None):
+        """Method selects clicked candidate
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        item = self._tree.identify_row(event.y)
+        if (item and self._filtered):
+            self._selected = int(item)
+            self._render()
+
+    def hide(self):
+        """Method closes completion session and hides call tip
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self.close()
+        self.hide_calltip()
+
+    def on_key_press(self, tab, event):
+        """Method handles key press in tab while completion session or call tip is open
+
+        Args:
+            tab (obj): tab reference
+            event (obj): event
+
+        Returns:
+            bool: key was consumed
+
+        """
+
+        if (not self.active or tab is not self._tab):
+            if (event.keysym == 'Escape' and self._call is not None):
+                self.hide_calltip()
+                return True
+            return False
+        elif (event.keysym == 'Escape'):
+            self.close()
+        elif (not self._filtered):
+            return False
+        elif (event.keysym in ['Up', 'Down']):
+            self._move(-1 if (event.keysym == 'Up') else 1)
+        elif (event.keysym in ['Prior', 'Next']):
+            self._move(-self._height if (event.keysym == 'Prior') else self._height)
+        elif (event.keysym in ['Return', 'Tab']):
+            self._complete(disable_format=(event.keysym == 'Return'))
+        else:
+            return False
+
+        return True
+
+    def on_key_release(self, tab, event):
+        """Method updates completion session and call tip after key release in tab
+
+        Args:
+            tab (obj): tab reference
             event (obj): event
-            completion (obj): code completion
 
         Returns:
             void
 
         """
 
-        if (completion == None):
-            item = self._tree.selection()
-            if (len(item) == 0):
-                return
+        if (self.active and tab is self._tab and event.keysym not in ['Up', 'Down', 'Prior', 'Next', 'Escape']):
+            self._update_session(tab)
+
+        if ((self._call is not None or event.char in ['(', ',']) and event.keysym != 'Escape'):
+            self._update_calltip(tab)
 
-            complete, item_type, params = self._tree.item(item)['values']
-            self._win.destroy()
+    def _update_session(self, tab):
+        """Method updates completion session
+
+        Candidates are filtered within same context, jedi is queried for new
+        identifier or attribute access, session is closed otherwise
+
+        Args:
+            tab (obj): tab reference
+
+        Returns:
+            void
+
+        """
+
+        context, prefix = self._get_context(tab)
+        if (context == self._context):
+            if (prefix != self._prefix and self._candidates is not None):
+                self._update_list(prefix)
+        elif (len(prefix) == 0 and not context[2].endswith('.')):
+            self.close()
         else:
-            complete, item_type = completion.complete, completion.type
-            try:
-                params = []
-                for p in completion.params:
-                    params.append(p.name)
-                params = ','.join(params)
-            except (AttributeError, NotImplementedError):
-                params = False
+            self._request(tab, context, prefix)
+
+    def _complete(self, event=None, disable_format=False):
+        """Method completes code with selected candidate
+
+        Identifier prefix is replaced by candidate name
+
+        Args:
+            event (obj): event
+            disable_format (bool): disable format after key release
+
+        Returns:
+            void
+
+        """
+
+        if (not self._filtered):
+            return
+
+        name, item_type, params = self._filtered[self._selected]
+        row, start = self._context[:2]
+        tab = self._tab
+        self.close()
 
+        complete = name
         if (item_type in ['function', 'class']):
             if (params):
                 complete += '('
@@ -233,5 +794,258 @@ class AutoCompleter(object):
             else:
                 complete += '()'
 
-        self.tab.disable_format()
-        self.tab.text.insert(tk.INSERT, complete)
+        if (disable_format):
+            tab.disable_format()
+        idx = '{0}.{1}'.format(row, start)
+        tab.text.delete(idx, tk.INSERT)
+        tab.text.insert(idx, complete)
+        tab.colorize(idx, tk.INSERT)
+
+    def _get_project(self, path):
+        """Method gets project containing file
+
+        Args:
+            path (str): file path
+
+        Returns:
+            str: project name, None if file is not in project
+
+        """
+
+        if (path is not None and self.config.data['Projects'] != None):
+            for name, project in self.config.data['Projects'].items():
+                if (path.startswith(project['path'])):
+                    return name
+
+        return None
+
+    def _get_call(self, tab):
+        """Method gets call around cursor
+
+        Previous lines are scanned for unclosed bracket, strings and comments are masked by lexer
+
+        Args:
+            tab (obj): tab reference
+
+        Returns:
+            tuple: bracket position (row, column), callee (str), argument index (int), None if cursor is not in call
+
+        """
+
+        row, col = [int(i) for i in tab.text.index(tk.INSERT).split('.')]
+        depth, arg = 0, 0
+        for r in range(row, max(row - 10, 0), -1):
+            line = tab.document.get_line(r)[:col] if (r == row) else tab.document.get_line(r)
+            if (tab.lexer is not None):
+                state = Colorizer.get_instance().get_state(tab.lexer, tab.line_states, r)
+                line = tab.lexer.mask(line, tab.lexer.lex_line(line, state)[0])
+
+            for i in range(len(line) - 1, -1, -1):
+                c = line[i]
+                if (c in ')]}'):
+                    depth += 1
+                elif (c in '([{' and depth > 0):
+                    depth -= 1
+                elif (c in '([{'):
+                    match = self._callee_re.search(line[:i]) if (c == '(') else None
+                    return ((r, i), match.group(1), arg) if (match is not None) else None
+                elif (c == ',' and depth == 0):
+                    arg += 1
+
+        return None
+
+    def _get_cached_signature(self, tab, callee):
+        """Method gets signature from cache
+
+        Cached signature is validated against defining module in background thread
+
+        Args:
+            tab (obj): tab reference
+            callee (str): called name
+
+        Returns:
+            tuple: module path (str), module modification time (float), signature (tuple), None if not cached
+
+        """
+
+        return self._signatures.get((self._get_project(tab.path), callee))
+
+    def _get_index_signature(self, callee):
+        """Method gets signature from symbol index
+
+        Args:
+            callee (str): called name
+
+        Returns:
+            tuple: name (str), parameters (tuple), docstring (str), None if not indexed
+
+        """
+
+        module, name = callee.rpartition('.')[::2]
+        symbols = self.index.get_module_symbols(module) if (len(module) > 0) else self.index.get_symbols(name)
+        symbols = [symbol for symbol in symbols if (symbol[0] == name)]
+        if (len(symbols) == 0):
+            return None
+
+        return name, symbols[0][5], (symbols[0][6] or '').strip().split('\n')[0]
+
+    @staticmethod
+    def _get_signature(content, row, col, cached=None):
+        """Method gets call signature, executed in background thread
+
+        Cached signature is used if defining module was not modified
+
+        Args:
+            content (str): text content
+            row (int): row
+            col (int): column
+            cached (tuple): cached module path, module modification time, signature
+
+        Returns:
+            tuple: signature (name, parameters, docstring), module path (str), module modification time (float)
+                   None if signature was not found
+
+        """
+
+        if (cached is not None):
+            module_path, mtime, signature = cached
+            try:
+                if (os.path.getmtime(module_path) == mtime):
+                    return signature, module_path, mtime
+            except OSError:
+                pass
+
+        try:
+            signatures = Script(content, row, col).call_signatures()
+        except ValueError:
+            return None
+
+        if (len(signatures) == 0):
+            return None
+
+        sig = signatures[0]
+        params = tuple([p.name for p in sig.params])
+        doc = sig.docstring(raw=True).strip().split('\n')[0]
+        module_path = sig.module_path
+        mtime = os.path.getmtime(module_path) if (module_path is not None and os.path.exists(module_path)) else None
+
+        return (sig.name, params, doc), module_path, mtime
+
+    def _update_calltip(self, tab):
+        """Method updates call tip for call around cursor
+
+        Signature is taken from cache or symbol index, jedi is queried
+        in background if cached one is missing or outdated
+
+        Args:
+            tab (obj): tab reference
+
+        Returns:
+            void
+
+        """
+
+        call = self._get_call(tab)
+        if (call is None):
+            self.hide_calltip()
+            return
+
+        position, callee, arg = call
+        if (self._call is not None and self._call[:3] == (tab, position, callee)):
+            if (self._call[3] is not None):
+                self._show_calltip(tab, position, self._call[3], arg)
+            return
+
+        cached = self._get_cached_signature(tab, callee)
+        signature = cached[2] if (cached is not None) else self._get_index_signature(callee)
+        self._call = (tab, position, callee, signature)
+        if (signature is not None):
+            self._show_calltip(tab, position, signature, arg)
+        elif (self._calltip is not None):
+            self._calltip.hide()
+
+        row, col = [int(i) for i in tab.text.index(tk.INSERT).split('.')]
+        source = self.get_source(tab, row, col)
+        if (source is not None):
+            self.worker.submit(self._get_signature, source + (cached,),
+                               lambda result: self._on_signature(tab, position, callee, result), key=self._calltip_key)
+
+    def _on_signature(self, tab, position, callee, result):
+        """Method stores found signature and shows call tip if call was not changed
+
+        Args:
+            tab (obj): tab reference
+            position (tuple): bracket position
+            callee (str): called name
+            result (tuple): signature, module path, module modification time
+
+        Returns:
+            void
+
+        """
+
+        key = (self._get_project(tab.path), callee)
+        if (result is None):
+            self._signatures.pop(key, None)
+            return
+
+        signature, module_path, mtime = result
+        if (mtime is not None):
+            self._signatures[key] = (module_path, mtime, signature)
+        else:
+            self._signatures.pop(key, None)
+
+        if (self._call is not None and self._call[:3] == (tab, position, callee) and tab.winfo_exists()):
+            self._call = (tab, position, callee, signature)
+            call = self._get_call(tab)
+            if (call is not None and call[:2] == (position, callee)):
+                self._show_calltip(tab, position, signature, call[2])
+
+    def _show_calltip(self, tab, position, signature, arg):
+        """Method shows call tip with current argument highlighted
+
+        Args:
+            tab (obj): tab reference
+            position (tuple): bracket position
+            signature (tuple): name, parameters, docstring
+            arg (int): argument index
+
+        Returns:
+            void
+
+        """
+
+        name, params, doc = signature
+        text, highlight = name + '(', None
+        for i, param in enumerate(params):
+            if (i > 0):
+                text += ', '
+            if (i == arg):
+                highlight = (len(text), len(text) + len(param))
+            text += param
+        text += ')'
+        if (len(doc) > 0):
+            text += '\n' + doc
+
+        if (self._calltip is not None and self._calltip.parent is not tab.text):
+            self._calltip.hide()
+            self._calltip = None
+        if (self._calltip is None):
+            self._calltip = CallTip(tab.text)
+        self._calltip.show(text, '{0}.{1}'.format(*position), highlight)
+
+    def hide_calltip(self):
+        """Method hides call tip
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._call = None
+        self.worker.cancel(self._calltip_key)
+        if (self._calltip is not None):
+            self._calltip.hide()
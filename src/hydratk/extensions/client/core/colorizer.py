@@ -8,26 +8,65 @@
 
 """
 
-from hydratk.extensions.client.core.tkimport import tk, PYTHON_MAJOR_VERSION
+from hydratk.extensions.client.core.tkimport import PYTHON_MAJOR_VERSION
+from hydratk.extensions.client.core.lexer import PythonLexer, YodaLexer, YamlLexer, LogLexer
+from hydratk.extensions.client.core.utils import fix_path, get_cache_dir, write_file
 
-import keyword
+from collections import OrderedDict
+from hashlib import md5
+from os import path, makedirs
 
 if (PYTHON_MAJOR_VERSION == 2):
-    import __builtin__ as builtins
+    import cPickle as pickle
 else:
-    import builtins
+    import pickle
+
+class LineStates(list):
+    """Class LineStates
+
+    Lexer states at line end, index 0 holds initial state.
+    Rows before fill row are lexed and not dirty.
+
+    """
+
+    fill_row = 1
 
 class Colorizer(object):
     """Class Colorizer
+
+    Text is lexed line by line by lexer registered for file suffix, lexer state
+    at the end of each line (open triple-quoted string, YAML block scalar) is cached per document.
+    Lexing stops behind the damaged range once computed state matches the cached one.
+    Spans of fully lexed documents are cached by content hash, unchanged
+    document is painted from cache without lexing.
+
     """
 
     _instance = None
     _instance_created = False
 
     # references
+    _root = None
     _config = None
 
-    _patterns = {}
+    _colors = {}
+    _lexers = {}
+
+    # lexer state
+    _dirty = object()
+    _unknown = object()
+    _chunk = 500
+
+    # span cache
+    _cache = None
+    _cache_size = 100
+    _cache_persist = False
+    _cache_file = None
+
+    # Tk
+    _configured = set()
+    _tcl_calls = 0
+    _tcl_calls_total = 0
 
     def __init__(self):
         """Class constructor
@@ -48,10 +87,13 @@ class Colorizer(object):
             raise ValueError('A Class instance already exists, use get_instance method instead!')
 
         from hydratk.extensions.client.core.gui import Gui
-        self._config = Gui.get_instance().cfg
+        self._root = Gui.get_instance()
+        self._config = self._root.cfg
 
+        self._cache = OrderedDict()
         self._parse_config()
-        self._make_patterns()
+        self._register_lexers()
+        self.load_cache()
 
     @staticmethod
     def get_instance():
@@ -77,6 +119,18 @@ class Colorizer(object):
 
         return self._config
 
+    @property
+    def tcl_calls(self):
+        """ tcl_calls property getter, count of Tcl calls in last colorizing pass """
+
+        return self._tcl_calls
+
+    @property
+    def tcl_calls_total(self):
+        """ tcl_calls_total property getter """
+
+        return self._tcl_calls_total
+
     def _parse_config(self):
         """Method parses configuration
 
@@ -89,12 +143,17 @@ class Colorizer(object):
         """
 
         cfg = self.config.data['Core']['editor']['color']
-        self._patterns['keyword'] = {'color' : cfg['keyword']}
-        self._patterns['string'] = {'color' : cfg['string']}
-        self._patterns['yoda'] = {'color' : cfg['yoda']}
+        self._colors['keyword'] = cfg['keyword']
+        self._colors['string'] = cfg['string']
+        self._colors['yoda'] = cfg['yoda']
+
+        cfg = self.config.data['Core']['editor']['cache']
+        self._cache_size = int(cfg['size'])
+        self._cache_persist = (int(cfg['persist']) == 1)
+        self._cache_file = fix_path(path.join(get_cache_dir(cfg['cachedir']), 'colorizer.cache'))
 
-    def _make_patterns(self):
-        """Method makes patterns for colorized strings
+    def _register_lexers(self):
+        """Method registers core lexers
 
         Args:
             none
@@ -104,31 +163,96 @@ class Colorizer(object):
 
         """
 
-        # keyword
-        builtin = [str(name) for name in dir(builtins) if not name.startswith('_')]
-        kw = r'\y(' + '|'.join(keyword.kwlist + builtin) + r')\y'
-        self._patterns['keyword']['pattern'] = kw
+        self.register_lexer(PythonLexer(), ['py'])
+        self.register_lexer(YodaLexer(), ['jedi', 'padawan'])
+        self.register_lexer(YamlLexer(), ['yaml', 'yml', 'conf'])
+        self.register_lexer(LogLexer(), ['log'])
+
+    def register_lexer(self, lexer, suffixes):
+        """Method registers lexer for file suffixes
+
+        Args:
+            lexer (obj): Lexer instance
+            suffixes (list): file suffixes
+
+        Returns:
+            void
+
+        """
+
+        for suffix in suffixes:
+            self._lexers[suffix.lower()] = lexer
+
+    def get_lexer(self, path):
+        """Method gets lexer for file
+
+        Args:
+            path (str): file path
+
+        Returns:
+            obj: Lexer instance, None for plain text
+
+        """
+
+        if (path is None or '.' not in path):
+            return None
+
+        return self._lexers.get(path.split('.')[-1].lower())
+
+    def _init_states(self, lexer, states, last):
+        """Method initializes cached line states
+
+        States are aligned with line count by update_states on each edit,
+        states not matching line count are reset
+
+        Args:
+            lexer (obj): Lexer instance
+            states (list): lexer states at line end, index 0 holds initial state
+            last (int): last row
+
+        Returns:
+            void
+
+        """
+
+        if (len(states) != last + 1):
+            states[:] = [lexer.default_state] + [self._unknown] * last
+            states.fill_row = 1
+
+    def update_states(self, lexer, states, row1, row2, last):
+        """Method aligns cached line states after edit, executed on main thread
+
+        Lines inserted or deleted at first changed row are marked dirty or dropped,
+        changed rows are marked dirty
+
+        Args:
+            lexer (obj): Lexer instance
+            states (list): lexer states at line end, updated
+            row1 (int): first changed row
+            row2 (int): last changed row after edit
+            last (int): last row after edit
+
+        Returns:
+            void
+
+        """
+
+        if (len(states) == 0):
+            return
 
-        # string
-        stringprefix = r'(\br|u|ur|R|U|UR|Ur|uR|b|B|br|Br|bR|BR)?'
-        sqstring = stringprefix + r"'[^'\\\n]*(\\.[^'\\\n]*)*'?"
-        dqstring = stringprefix + r'"[^"\\\n]*(\\.[^"\\\n]*)*"?'
-        sq3string = stringprefix + r"'''[^'\\]*((\\.|'(?!''))[^'\\]*)*(''')?"
-        dq3string = stringprefix + r'"""[^"\\]*((\\.|"(?!""))[^"\\]*)*(""")?'
-        string = r'(' + '|'.join([r'#[^\n]*', sq3string, dq3string, sqstring, dqstring]) + r')'
-        self._patterns['string']['pattern'] = string
+        delta = last + 1 - len(states)
+        if (delta > 0):
+            states[row1:row1] = [self._dirty] * delta
+        elif (delta < 0):
+            del states[row1:row1 - delta]
 
-        # yoda
-        tags = [
-                'TEST-SCENARIO-\d+', 'TEST-CASE-\d+', 'TEST-CONDITION-\d+',
-                'ID', 'PATH', 'NAME', 'DESC', 'AUTHOR', 'VERSION',
-                'PRE-REQ', 'POST-REQ', 'TEST', 'VALIDATE', 'EVENTS', 'BEFORE_START', 'AFTER_FINISH'
-               ]
-        yoda = r'\y(' + '|'.join(tags) + r')\y\s*:\s*\|?'
-        self._patterns['yoda']['pattern'] = yoda
+        for row in range(row1, min(row2, last) + 1):
+            if (states[row] is not self._unknown):
+                states[row] = self._dirty
+        states.fill_row = min(states.fill_row, row1)
 
-    def colorize(self, text, start, stop):
-        """Method colorizes text
+    def _get_rows(self, text, start, stop):
+        """Method gets rows for given indexes
 
         Args:
             text (obj): Text widget
@@ -136,31 +260,435 @@ class Colorizer(object):
             stop (str): stop index
 
         Returns:
-            bool: yoda tag found
+            tuple: start row (int), stop row (int), last row (int)
+
+        """
+
+        row1 = int(str(self._call(text, 'index', start)).split('.')[0])
+        row2 = int(str(self._call(text, 'index', stop)).split('.')[0])
+        last = int(str(self._call(text, 'index', 'end-1c')).split('.')[0])
+
+        return row1, row2, last
+
+    def _get_fill_row(self, states):
+        """Method gets first row which was not lexed yet or is dirty
+
+        Rows are scanned from fill row which is moved forward
+
+        Args:
+            states (list): lexer states at line end
+
+        Returns:
+            int: row, None if text is fully lexed
+
+        """
+
+        unknown, dirty = self._unknown, self._dirty
+        for row in range(max(states.fill_row, 1), len(states)):
+            if (states[row] is unknown or states[row] is dirty):
+                states.fill_row = row
+                return row
+
+        states.fill_row = len(states)
+        return None
+
+    def get_state(self, lexer, states, row):
+        """Method gets cached lexer state at row start
+
+        Args:
+            lexer (obj): Lexer instance
+            states (list): lexer states at line end
+            row (int): row
+
+        Returns:
+            obj: lexer state, default state if not known
+
+        """
+
+        if (row - 1 < len(states) and states[row - 1] is not self._unknown and states[row - 1] is not self._dirty):
+            return states[row - 1]
+
+        return lexer.default_state
+
+    def _lex_rows(self, lexer, text, row, last, state):
+        """Method lexes rows from given row until the end of text
+
+        Generator, text is read in chunks
+
+        Args:
+            lexer (obj): Lexer instance
+            text (obj): Text widget
+            row (int): start row
+            last (int): last row
+            state (tuple): lexer state at start row
+
+        Returns:
+            tuple: row (int), spans (list), state at line end (tuple), yoda tag found (bool)
+
+        """
+
+        while (row <= last):
+            lines = self._call(text, 'get', '{0}.0'.format(row), '{0}.0'.format(row + self._chunk)).split('\n')[:-1]
+            for line in lines:
+                spans, state, found = lexer.lex_line(line, state)
+                yield row, spans, state, found
+                row += 1
+
+    def _call(self, text, *args):
+        """Method calls Text widget command
+
+        Calls are counted
+
+        Args:
+            text (obj): Text widget
+            args (list): command arguments
+
+        Returns:
+            obj
 
         """
 
-        cnt = tk.IntVar()
-        yoda_found = False
-        for pattern in ['keyword', 'yoda', 'string']:
-            text.tag_remove(pattern, start, stop)
-            idx1 = start
-            while True:
-                # direct Tk call, wrap method search doesn't support nolinestop
-                args = [text._w, 'search', '-count', cnt, '-regexp', '-nolinestop']
-                if (pattern == 'yoda'):
-                    args.append('-nocase')
-                args += [self._patterns[pattern]['pattern'], idx1, stop]
-                idx1 = str(text.tk.call(tuple(args)))
+        self._tcl_calls += 1
+        self._tcl_calls_total += 1
 
-                if (not idx1):
-                    break
-                elif (pattern == 'yoda'):
-                    yoda_found = True
+        return text.tk.call((text._w,) + args)
 
-                idx2 = '{0}+{1}c'.format(idx1, cnt.get())
-                text.tag_add(pattern, idx1, idx2)
-                idx1 = idx2
-            text.tag_config(pattern, foreground=self._patterns[pattern]['color'])
+    def _configure_tags(self, lexer, text):
+        """Method configures tags, once per Text widget and lexer
+
+        Args:
+            lexer (obj): Lexer instance
+            text (obj): Text widget
+
+        Returns:
+            void
+
+        """
+
+        if ((text._w, lexer.lexer_id) not in self._configured):
+            for tag in lexer.tags:
+                color = self._colors[tag] if (tag in self._colors) else lexer.colors[tag]
+                self._call(text, 'tag', 'configure', tag, '-foreground', color)
+            self._configured.add((text._w, lexer.lexer_id))
+
+    def _apply(self, lexer, text, row1, row2, tokens):
+        """Method applies tags to lexed rows
+
+        All ranges of tag are applied in single call
+
+        Args:
+            lexer (obj): Lexer instance
+            text (obj): Text widget
+            row1 (int): first lexed row
+            row2 (int): last lexed row
+            tokens (dict): tag spans, key tag, value list of row, start column, stop column
+
+        Returns:
+            void
+
+        """
+
+        self._configure_tags(lexer, text)
+        idx1, idx2 = '{0}.0'.format(row1), '{0}.0'.format(row2 + 1)
+        for tag in lexer.tags:
+            self._call(text, 'tag', 'remove', tag, idx1, idx2)
+            if (len(tokens[tag]) > 0):
+                indexes = []
+                for r, col1, col2 in tokens[tag]:
+                    indexes.append('{0}.{1}'.format(r, col1))
+                    indexes.append('{0}.{1}'.format(r, col2))
+                self._call(text, 'tag', 'add', tag, *indexes)
+
+    def prepare(self, lexer, text, start, stop, states):
+        """Method prepares colorizing job, executed on main thread
+
+        Edited rows are marked dirty, text snapshot starts one row before
+        first dirty row and is limited by chunk size behind stop.
+        Colorizing pass starts here, Tcl call counter is reset.
+
+        Args:
+            lexer (obj): Lexer instance
+            text (obj): Text widget
+            start (str): start index of edited text
+            stop (str): stop index of edited text
+            states (list): lexer states at line end, updated
+
+        Returns:
+            tuple: arguments of method lex
+
+        """
+
+        self._tcl_calls = 0
+        row1, row2, last = self._get_rows(text, start, stop)
+        self._init_states(lexer, states, last)
+        for row in range(row1, min(row2, last) + 1):
+            if (states[row] is not self._unknown):
+                states[row] = self._dirty
+        states.fill_row = min(states.fill_row, row1)
+
+        row0 = max(row1 - 1, 1)
+        while (states[row0 - 1] is self._dirty):
+            row0 -= 1
+        provisional = states[row0 - 1] is self._unknown
+        state = lexer.default_state if (provisional) else states[row0 - 1]
+
+        lines = self._call(text, 'get', '{0}.0'.format(row0), '{0}.0'.format(max(row0, row2) + self._chunk)).split('\n')[:-1]
+        old = tuple(states[row0:row0 + len(lines)])
+
+        return lexer, row0, row2, lines, state, old, provisional
+
+    def lex(self, lexer, row0, row2, lines, state, old, provisional):
+        """Method lexes text snapshot
+
+        Tk is not accessed, method can be executed in background thread.
+        Lexing continues behind stop row until lexer state matches cached state.
+
+        Args:
+            lexer (obj): Lexer instance
+            row0 (int): first row of snapshot
+            row2 (int): stop row
+            lines (list): snapshot lines
+            state (obj): lexer state at first row
+            old (tuple): cached lexer states at line end for snapshot rows
+            provisional (bool): lexer state at first row is not known
+
+        Returns:
+            tuple: lexer (obj), first row (int), last lexed row (int), tokens (dict), states (list),
+                   provisional (bool), yoda tag found (bool), converged (bool)
+
+        """
+
+        tokens = dict((tag, []) for tag in lexer.tags)
+        states, yoda_found, converged = [], False, False
+        for i, line in enumerate(lines):
+            row = row0 + i
+            spans, state, found = lexer.lex_line(line, state)
+            yoda_found = yoda_found or found
+            for tag, col1, col2 in spans:
+                tokens[tag].append((row, col1, col2))
+            states.append(state)
+
+            if (row >= row2 and (provisional or old[i] == state or old[i] is self._unknown)):
+                converged = True
+                break
+
+        return lexer, row0, row, tokens, states, provisional, yoda_found, converged
+
+    def apply(self, text, result, states):
+        """Method applies lexed snapshot, executed on main thread
+
+        Text must not be changed since snapshot was prepared
+
+        Args:
+            text (obj): Text widget
+            result (tuple): result of method lex
+            states (list): lexer states at line end, updated
+
+        Returns:
+            bool: yoda tag found
+
+        """
+
+        lexer, row0, row, tokens, new_states, provisional, yoda_found, converged = result
+        if (not provisional):
+            states[row0:row + 1] = new_states
+            if (not converged and row + 1 < len(states) and states[row + 1] is not self._unknown):
+                states[row + 1] = self._dirty
+                states.fill_row = min(states.fill_row, row + 1)
+
+        self._apply(lexer, text, row0, row, tokens)
 
         return yoda_found
+
+    def colorize_view(self, lexer, text, start, stop, states):
+        """Method colorizes visible rows which were not lexed yet
+
+        Args:
+            lexer (obj): Lexer instance
+            text (obj): Text widget
+            start (str): first visible index
+            stop (str): last visible index
+            states (list): lexer states at line end, updated
+
+        Returns:
+            void
+
+        """
+
+        self._tcl_calls = 0
+        row1, row2, last = self._get_rows(text, start, stop)
+        self._init_states(lexer, states, last)
+        if (states[row2] is self._unknown):
+            result = self.lex(*self.prepare(lexer, text, '{0}.0'.format(row1 + 1), '{0}.0'.format(row2), states))
+            self.apply(text, result, states)
+
+    def fill(self, lexer, text, states, count):
+        """Method colorizes next rows which were not lexed yet or are dirty
+
+        Used for background colorizing in small chunks
+
+        Args:
+            lexer (obj): Lexer instance
+            text (obj): Text widget
+            states (list): lexer states at line end, updated
+            count (int): count of rows to be lexed
+
+        Returns:
+            bool: more rows to be lexed
+
+        """
+
+        self._tcl_calls = 0
+        last = int(str(self._call(text, 'index', 'end-1c')).split('.')[0])
+        self._init_states(lexer, states, last)
+        row1 = self._get_fill_row(states)
+        if (row1 is None):
+            return False
+
+        tokens = dict((tag, []) for tag in lexer.tags)
+        for row, spans, state, found in self._lex_rows(lexer, text, row1, last, states[row1 - 1]):
+            for tag, col1, col2 in spans:
+                tokens[tag].append((row, col1, col2))
+            old, states[row] = states[row], state
+            if (old == state):
+                break
+            elif (row - row1 + 1 >= count):
+                if (row < last and states[row + 1] is not self._unknown):
+                    states[row + 1] = self._dirty
+                break
+
+        self._apply(lexer, text, row1, row, tokens)
+
+        return True
+
+    def _get_cache_key(self, lexer, content):
+        """Method gets span cache key
+
+        Args:
+            lexer (obj): Lexer instance
+            content (str): text content
+
+        Returns:
+            tuple: lexer id (str), content hash (str)
+
+        """
+
+        if (PYTHON_MAJOR_VERSION == 2 and isinstance(content, unicode)):
+            content = content.encode('utf-8')
+        elif (PYTHON_MAJOR_VERSION == 3):
+            content = content.encode('utf-8', 'surrogatepass')
+
+        return lexer.lexer_id, md5(content).hexdigest()
+
+    def store(self, lexer, text, states, content=None):
+        """Method stores spans of fully lexed text to cache
+
+        Tag ranges are read from Text widget, least recently used entry
+        is dropped when cache is full
+
+        Args:
+            lexer (obj): Lexer instance
+            text (obj): Text widget
+            states (list): lexer states at line end
+            content (str): text content, read from Text widget if None
+
+        Returns:
+            bool: result
+
+        """
+
+        if (self._cache_size <= 0 or self._get_fill_row(states) is not None):
+            return False
+
+        if (content is None):
+            content = self._call(text, 'get', '1.0', 'end-1c')
+        key = self._get_cache_key(lexer, content)
+        ranges = {}
+        for tag in lexer.tags:
+            ranges[tag] = tuple(str(idx) for idx in text.tk.splitlist(self._call(text, 'tag', 'ranges', tag)))
+
+        self._cache.pop(key, None)
+        self._cache[key] = (ranges, list(states))
+        while (len(self._cache) > self._cache_size):
+            self._cache.popitem(last=False)
+
+        return True
+
+    def colorize_cached(self, lexer, text, states, content=None):
+        """Method colorizes text from cache
+
+        Tags are applied in single call per tag, text is not lexed
+
+        Args:
+            lexer (obj): Lexer instance
+            text (obj): Text widget
+            states (list): lexer states at line end, updated
+            content (str): text content, read from Text widget if None
+
+        Returns:
+            bool: result, False if text is not cached
+
+        """
+
+        self._tcl_calls = 0
+        if (content is None):
+            content = self._call(text, 'get', '1.0', 'end-1c')
+        key = self._get_cache_key(lexer, content)
+        if (key not in self._cache):
+            return False
+
+        ranges, cached_states = self._cache.pop(key)
+        self._cache[key] = (ranges, cached_states)
+        self._configure_tags(lexer, text)
+        for tag in lexer.tags:
+            self._call(text, 'tag', 'remove', tag, '1.0', 'end')
+            if (len(ranges.get(tag, ())) > 0):
+                self._call(text, 'tag', 'add', tag, *ranges[tag])
+        states[:] = cached_states
+        states.fill_row = 1
+
+        return True
+
+    def load_cache(self):
+        """Method loads span cache from file
+
+        Invalid cache file is ignored
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        if (self._cache_persist and path.exists(self._cache_file)):
+            try:
+                with open(self._cache_file, 'rb') as f:
+                    items = pickle.load(f)
+                for key, (ranges, states) in items[-self._cache_size:] if (self._cache_size > 0) else []:
+                    if (not isinstance(key, tuple) or not isinstance(ranges, dict) or not isinstance(states, list)):
+                        raise ValueError('Invalid cache item')
+                    self._cache[key] = (ranges, states)
+            except Exception:
+                self._cache.clear()
+
+    def save_cache(self):
+        """Method saves span cache to file
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        if (self._cache_persist):
+            try:
+                cachedir = path.dirname(self._cache_file)
+                if (not path.exists(cachedir)):
+                    makedirs(cachedir, 0o700)
+                write_file(self._cache_file, pickle.dumps(list(self._cache.items()), 2), binary=True)
+            except Exception as ex:
+                self._root.logger.error(self._root.trn.msg('htk_core_cache_save_error', self._cache_file, ex))
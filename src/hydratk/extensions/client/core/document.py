@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""Document mirror
+
+.. module:: client.core.document
+   :platform: Windows, Unix
+   :synopsis: Document mirror
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+from bisect import bisect_right
+
+class Document(object):
+    """Class Document
+
+    Python side copy of Text widget content stored as list of lines.
+    Content string and line start offsets are built lazily once per version.
+
+    """
+
+    _lines = None
+    _version = 0
+    _content = None
+    _starts = None
+    _listeners = None
+
+    def __init__(self, content=''):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           content (str): initial content
+
+        """
+
+        self._lines = content.split('\n')
+        self._listeners = []
+
+    @property
+    def version(self):
+        """ version property getter, incremented by each change """
+
+        return self._version
+
+    @property
+    def line_count(self):
+        """ line_count property getter """
+
+        return len(self._lines)
+
+    def get_content(self):
+        """Method gets content
+
+        Args:
+            none
+
+        Returns:
+            str
+
+        """
+
+        if (self._content is None):
+            self._content = '\n'.join(self._lines)
+
+        return self._content
+
+    def get_line(self, row):
+        """Method gets line content
+
+        Args:
+            row (int): row, starting from 1
+
+        Returns:
+            str
+
+        """
+
+        return self._lines[row - 1]
+
+    def get_lines(self, row1, row2):
+        """Method gets lines content
+
+        Args:
+            row1 (int): first row
+            row2 (int): last row
+
+        Returns:
+            list
+
+        """
+
+        return self._lines[row1 - 1:row2]
+
+    def _get_starts(self):
+        """Method gets line start offsets
+
+        Args:
+            none
+
+        Returns:
+            list
+
+        """
+
+        if (self._starts is None):
+            starts, offset = [], 0
+            for line in self._lines:
+                starts.append(offset)
+                offset += len(line) + 1
+            self._starts = starts
+
+        return self._starts
+
+    def _parse_index(self, index):
+        """Method parses index
+
+        Position is limited by document end
+
+        Args:
+            index (str): index in format row.col
+
+        Returns:
+            tuple: row (int), col (int)
+
+        """
+
+        row, col = [int(i) for i in str(index).split('.')]
+        if (row > len(self._lines)):
+            return len(self._lines), len(self._lines[-1])
+
+        return max(row, 1), min(col, len(self._lines[max(row, 1) - 1]))
+
+    def index_to_offset(self, index):
+        """Method converts index to character offset
+
+        Args:
+            index (str): index in format row.col
+
+        Returns:
+            int
+
+        """
+
+        row, col = self._parse_index(index)
+
+        return self._get_starts()[row - 1] + col
+
+    def offset_to_index(self, offset):
+        """Method converts character offset to index
+
+        Args:
+            offset (int): offset
+
+        Returns:
+            str: index in format row.col
+
+        """
+
+        starts = self._get_starts()
+        row = bisect_right(starts, offset)
+        col = min(offset - starts[row - 1], len(self._lines[row - 1]))
+
+        return '{0}.{1}'.format(row, col)
+
+    def add_listener(self, callback):
+        """Method adds change listener
+
+        Listener is called after each change with version (int),
+        first changed row (int), last changed row (int), count of added lines (int, negative if removed)
+
+        Args:
+            callback (callable): listener
+
+        Returns:
+            void
+
+        """
+
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Method removes change listener
+
+        Args:
+            callback (callable): listener
+
+        Returns:
+            void
+
+        """
+
+        if (callback in self._listeners):
+            self._listeners.remove(callback)
+
+    def _changed(self, row1, row2, delta):
+        """Method invalidates cached content after change and notifies listeners
+
+        Args:
+            row1 (int): first changed row
+            row2 (int): last changed row after change
+            delta (int): count of added lines
+
+        Returns:
+            void
+
+        """
+
+        self._version += 1
+        self._content = None
+        self._starts = None
+        for callback in self._listeners:
+            callback(self._version, row1, row2, delta)
+
+    def insert(self, index, chars):
+        """Method inserts text
+
+        Args:
+            index (str): index in format row.col
+            chars (str): text
+
+        Returns:
+            void
+
+        """
+
+        if (len(chars) == 0):
+            return
+
+        row, col = self._parse_index(index)
+        line = self._lines[row - 1]
+        new_lines = chars.split('\n')
+        new_lines[0] = line[:col] + new_lines[0]
+        new_lines[-1] = new_lines[-1] + line[col:]
+        self._lines[row - 1:row] = new_lines
+        self._changed(row, row + len(new_lines) - 1, len(new_lines) - 1)
+
+    def delete(self, index1, index2):
+        """Method deletes text
+
+        Final newline is never deleted like in Text widget, range reaching
+        behind end and starting at line start deletes the preceding newline
+
+        Args:
+            index1 (str): start index
+            index2 (str): stop index
+
+        Returns:
+            void
+
+        """
+
+        row1, col1 = [int(i) for i in str(index1).split('.')]
+        row2, col2 = [int(i) for i in str(index2).split('.')]
+        if ((row2, col2) <= (row1, col1)):
+            return
+
+        row1, col1 = self._parse_index(index1)
+        if (row2 > len(self._lines) and col1 == 0 and row1 > 1):
+            row1, col1 = row1 - 1, len(self._lines[row1 - 2])
+        row2, col2 = self._parse_index(index2)
+        if ((row2, col2) <= (row1, col1)):
+            return
+
+        self._lines[row1 - 1:row2] = [self._lines[row1 - 1][:col1] + self._lines[row2 - 1][col2:]]
+        self._changed(row1, row1, row1 - row2)
+
+    def set_content(self, content):
+        """Method sets whole content
+
+        Changed rows are found by comparing common leading and trailing lines,
+        so listeners get the real range also after resynchronization
+
+        Args:
+            content (str): content
+
+        Returns:
+            void
+
+        """
+
+        old, new = self._lines, content.split('\n')
+        size = min(len(old), len(new))
+        prefix = 0
+        while (prefix < size and old[prefix] == new[prefix]):
+            prefix += 1
+        suffix = 0
+        while (suffix < size - prefix and old[-1 - suffix] == new[-1 - suffix]):
+            suffix += 1
+
+        self._lines = new
+        if (prefix == len(old) == len(new)):
+            return
+
+        row1 = min(prefix + 1, len(new))
+        self._changed(row1, max(len(new) - suffix, row1), len(new) - len(old))
+
+class DocumentProxy(object):
+    """Class DocumentProxy
+
+    Text widget command is replaced by Tcl procedure in style of idlelib WidgetRedirector.
+    Insert, delete and replace are forwarded to original command and mirrored to document,
+    they are ignored in disabled state, document is resynchronized after undo and redo. Errors of original command are not masked.
+
+    """
+
+    _text = None
+    _document = None
+    _orig = None
+    _callback = None
+
+    _proc = '''
+proc {w} args {{
+    set op [lindex $args 0]
+    if {{$op in {{"insert" "delete" "replace"}} && [{o} cget -state] eq "disabled"}} {{
+        return
+    }} elseif {{$op eq "insert" && [llength $args] > 2}} {{
+        set i [{o} index [lindex $args 1]]
+        set res [uplevel 1 [linsert $args 0 {o}]]
+        set chars ""
+        foreach {{c t}} [lrange $args 2 end] {{append chars $c}}
+        {cb} insert $i $chars
+        return $res
+    }} elseif {{($op eq "delete" && [llength $args] <= 3) || ($op eq "replace" && [llength $args] > 3)}} {{
+        set i1 [{o} index [lindex $args 1]]
+        if {{[llength $args] > 2}} {{set i2 [{o} index [lindex $args 2]]}} else {{set i2 [{o} index "$i1+1c"]}}
+        set res [uplevel 1 [linsert $args 0 {o}]]
+        set chars ""
+        foreach {{c t}} [lrange $args 3 end] {{append chars $c}}
+        {cb} replace $i1 $i2 $chars
+        return $res
+    }} elseif {{$op in {{"delete" "replace" "image" "window"}} || ($op eq "edit" && [lindex $args 1] in {{"undo" "redo"}})}} {{
+        set res [uplevel 1 [linsert $args 0 {o}]]
+        {cb} resync
+        return $res
+    }}
+    uplevel 1 [linsert $args 0 {o}]
+}}
+'''
+
+    def __init__(self, text, document):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           text (obj): Text widget
+           document (obj): Document
+
+        """
+
+        self._text = text
+        self._document = document
+        self._orig = text._w + '_orig'
+        self._callback = text.register(self._dispatch)
+
+        text.tk.call('rename', text._w, self._orig)
+        text.tk.eval(self._proc.format(w=text._w, o=self._orig, cb=self._callback))
+        text.bind('<Destroy>', self._close, '+')
+        self.resync()
+
+    @property
+    def text(self):
+        """ text property getter """
+
+        return self._text
+
+    @property
+    def document(self):
+        """ document property getter """
+
+        return self._document
+
+    def resync(self):
+        """Method resynchronizes document with Text widget content
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._document.set_content(self._text.tk.call(self._orig, 'get', '1.0', 'end-1c'))
+
+    def _dispatch(self, operation, *args):
+        """Method mirrors Text widget change to document
+
+        Called from Tcl procedure after original command succeeded
+
+        Args:
+            operation (str): insert|replace|resync
+            args (list): indexes and text
+
+        Returns:
+            void
+
+        """
+
+        try:
+            if (operation == 'insert'):
+                self._document.insert(args[0], args[1])
+            elif (operation == 'replace'):
+                self._document.delete(args[0], args[1])
+                self._document.insert(args[0], args[2])
+            else:
+                self.resync()
+        except Exception:
+            self.resync()
+
+    def _close(self, event=None):
+        """Method removes Tcl procedure when Text widget is destroyed
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        if (event is None or event.widget is self._text):
+            self._text.tk.call('rename', self._text._w, '')
+            self._text.tk.call('rename', self._orig, self._text._w)
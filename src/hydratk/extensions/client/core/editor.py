@@ -12,7 +12,10 @@ import os
 
 from hydratk.extensions.client.core.tkimport import tk, ttk, tkmsg, tkfd
 from hydratk.extensions.client.core.notebook import CustomNotebook
-from hydratk.extensions.client.core.utils import fix_path
+from hydratk.extensions.client.core.worker import Worker
+from hydratk.extensions.client.core.symbolindex import SymbolIndex
+from hydratk.extensions.client.core.navigator import Navigator
+from hydratk.extensions.client.core.utils import fix_path, write_file
 
 class Editor(tk.LabelFrame):
     """Class Explorer
@@ -37,6 +40,17 @@ class Editor(tk.LabelFrame):
     # font
     _font = None
 
+    # update delays
+    _delay = None
+
+    # large file mode
+    _large_file = None
+
+    # save queue
+    _save = None
+    _saver = None
+    _saving = None
+
     def __init__(self, root):
         """Class constructor
 
@@ -62,6 +76,8 @@ class Editor(tk.LabelFrame):
         tk.LabelFrame.__init__(self, self.root._pane_right, text=self.trn.msg('htk_gui_editor_label'))
         self._set_gui()
         self._parse_config()
+        self._saver = Worker(self.root, self._save['threads'])
+        self._saving = {}
 
     @staticmethod
     def get_instance(root=None):
@@ -150,6 +166,24 @@ class Editor(tk.LabelFrame):
 
         return self._font
 
+    @property
+    def delay(self):
+        """ delay property getter, debounce delays of tab updates in ms """
+
+        return self._delay
+
+    @property
+    def large_file(self):
+        """ large_file property getter, threshold in bytes and window in lines """
+
+        return self._large_file
+
+    @property
+    def saver(self):
+        """ saver property getter, worker writing files """
+
+        return self._saver
+
     def _parse_config(self):
         """Method parses configuration
 
@@ -171,6 +205,23 @@ class Editor(tk.LabelFrame):
                       'style'  : cfg['font']['style']
                      }
 
+        self._delay = {
+                       'colorize'  : int(cfg['delay']['colorize']),
+                       'fill'      : int(cfg['delay']['fill']),
+                       'find'      : int(cfg['delay']['find']),
+                       'yoda_tree' : int(cfg['delay']['yoda_tree'])
+                      }
+
+        self._large_file = {
+                            'threshold' : int(float(cfg['large_file']['threshold']) * 1048576),
+                            'window'    : int(cfg['large_file']['window'])
+                           }
+
+        self._save = {
+                      'fsync'   : True if (int(cfg['save']['fsync']) == 1) else False,
+                      'threads' : int(cfg['save']['threads'])
+                     }
+
     def _set_gui(self):
         """Method sets graphical interface
 
@@ -200,14 +251,17 @@ class Editor(tk.LabelFrame):
         tab_text = '{0}_{1}.txt'.format(self.trn.msg('htk_gui_editor_tab_new_text'), self.nb.new_cnt)
         self.nb.add_tab(text=tab_text)
         
-    def open_file(self, event=None, path=None):
+    def open_file(self, event=None, path=None, callback=None):
         """Method opens file
 
         File is opened from dialog or path, the content is displayed in tab
+        File is loaded in background, file larger than threshold
+        is opened read-only in large file mode
 
         Args:
             event (obj): event
             path (str): file path
+            callback (callable): called with tab when file content is displayed
 
         Returns:
             void
@@ -222,45 +276,90 @@ class Editor(tk.LabelFrame):
         path = fix_path(path)
         name = os.path.split(path)[1]
         res, idx = self.nb.is_tab_present(path)
-        if (not res):
-            with open(path, 'r') as f:
-                content = f.read()
-                self.nb.add_tab(path=path, content=content, text=name)
-                self.yoda_tree.add_test(path, content)
-                self.logger.debug(self.trn.msg('htk_core_file_opened', path))
+        if (not res and os.path.getsize(path) > self._large_file['threshold']):
+            tab = self.nb.add_tab(path=path, text=name, large=True)
+            self.logger.info(self.trn.msg('htk_core_large_file_opened', path))
+            if (callback is not None):
+                callback(tab)
+        elif (not res):
+            tab = self.nb.add_tab(path=path, text=name)
+            tab.load(path, lambda content: self._on_file_loaded(tab, content, callback))
         else:
             self.nb.select(idx)
+            if (callback is not None):
+                self.nb.tab_refs[idx].add_load_callback(callback)
 
-    def save_as_file(self, event=None):
+    def _on_file_loaded(self, tab, content, callback=None):
+        """Method handles loaded file content
+
+        Args:
+            tab (obj): tab
+            content (str): file content
+            callback (callable): called with tab
+
+        Returns:
+            void
+
+        """
+
+        self.yoda_tree.add_test(tab.path, content)
+        self.logger.debug(self.trn.msg('htk_core_file_opened', tab.path))
+        if (self.nb.get_current_tab() is not tab):
+            self.on_tab_changed()
+        if (callback is not None):
+            callback(tab)
+
+    def save_as_file(self, event=None, idx=None):
         """Method saves new file as
 
-        Choose file name in dialog, content is stored to file
+        Choose file name in dialog, content is stored to file in background
 
         Args:
             event (obj): event
+            idx (int): tab index, current tab if None
 
         Returns:
             void
 
         """
 
+        tab = self.nb.get_current_tab() if (idx is None) else self.nb.tab_refs[idx]
+        if (tab is None):
+            return
+        elif (tab.read_only):
+            self.logger.info(self.trn.msg('htk_core_file_read_only', tab.path))
+            return
+
         path = tkfd.asksaveasfilename(filetypes=[(self.trn.msg('htk_gui_editor_filetypes'), '*.*')])
         if (len(path) == 0):
             return
 
-        with open(path, 'w') as f:
-            content = self.nb.get_current_content()
-            f.write(content)
-            self.logger.debug(self.trn.msg('htk_core_file_saved', path))
+        content = tab.get_content()
+        self._submit_save(tab, path, content, tab.version, lambda: self._on_saved_as(tab, path, content))
+
+    def _on_saved_as(self, tab, path, content):
+        """Method updates tab and trees after file was saved as
+
+        Args:
+            tab (obj): tab
+            path (str): file path
+            content (str): file content
+
+        Returns:
+            void
+
+        """
+
+        if (tab in self.nb.tab_refs):
             name = os.path.split(path)[1]
-            self.nb.set_current_tab(name, path, False)
-            self.explorer.refresh(path=path)
-            self.yoda_tree.add_test(path, content)
-            
+            self.nb.set_current_tab(name, path, tab.text.edit_modified(), self.nb.tab_refs.index(tab))
+        self.explorer.refresh(path=path)
+        self.yoda_tree.add_test(path, content)
+
     def save_file(self, event=None, path=None, idx=None):
         """Method saves file
 
-        From current tab, file path or requested tab
+        From current tab, file path or requested tab. File is written in background
 
         Args:
             event (obj): event
@@ -272,18 +371,99 @@ class Editor(tk.LabelFrame):
 
         """
 
-        tab = self.nb.get_current_tab()
-        if (tab is not None):
+        tab = self.nb.get_current_tab() if (idx is None) else self.nb.tab_refs[idx]
+        if (tab is not None and tab.read_only):
+            self.logger.info(self.trn.msg('htk_core_file_read_only', tab.path))
+        elif (tab is not None):
             if (path is None):
                 path = tab.path
             if (path is None):
-                self.save_as_file()
+                self.save_as_file(idx=idx)
             else:
-                with open(path, 'w') as f:
-                    content = self.nb.get_current_content() if (idx is None) else self._nb.get_content(idx)
-                    f.write(content)
-                    self.logger.debug(self.trn.msg('htk_core_file_saved', path))
-                    tab.text.edit_modified(False)
+                self._submit_save(tab, path, tab.get_content(), tab.version)
+
+    def _submit_save(self, tab, path, content, version, callback=None):
+        """Method submits file write to save queue
+
+        File is written atomically by saver worker, next save of file
+        being written is submitted after current one finishes
+
+        Args:
+            tab (obj): tab
+            path (str): file path
+            content (str): file content
+            version (int): tab version of content
+            callback (callable): called without arguments after file was saved
+
+        Returns:
+            void
+
+        """
+
+        if (path in self._saving):
+            self._saving[path] = (tab, path, content, version, callback)
+            return
+
+        self._saving[path] = None
+        self._saver.submit(write_file, (path, content, self._save['fsync']),
+                           lambda result: self._on_saved(tab, path, version, callback),
+                           errback=lambda error: self._on_save_error(path, error))
+
+    def _on_saved(self, tab, path, version, callback=None):
+        """Method handles saved file
+
+        Tab is marked unmodified if it was not changed meanwhile
+
+        Args:
+            tab (obj): tab
+            path (str): file path
+            version (int): tab version of saved content
+            callback (callable): called without arguments
+
+        Returns:
+            void
+
+        """
+
+        self.logger.debug(self.trn.msg('htk_core_file_saved', path))
+        if (path.endswith('.py')):
+            SymbolIndex.get_instance().update()
+        if (tab in self.nb.tab_refs and tab.version == version):
+            tab.text.edit_modified(False)
+        if (callback is not None):
+            callback()
+        self._next_save(path)
+
+    def _on_save_error(self, path, error):
+        """Method handles file write error
+
+        Args:
+            path (str): file path
+            error (str): traceback
+
+        Returns:
+            void
+
+        """
+
+        self.logger.error(self.trn.msg('htk_core_file_save_error', path))
+        self.logger.error(error)
+        self._next_save(path)
+
+    def _next_save(self, path):
+        """Method submits pending save of file
+
+        Args:
+            path (str): file path
+
+        Returns:
+            void
+
+        """
+
+        pending = self._saving.pop(path, None)
+        if (pending is not None):
+            self._submit_save(*pending)
 
     def undo(self, event=None):
         """Method undos last text change
@@ -301,7 +481,7 @@ class Editor(tk.LabelFrame):
             if (tab is not None):
                 tab.text.edit_undo()
                 tab.update_line_numbers()
-                tab.colorize()
+                tab.colorize_changed()
                 return 'break'
         except tk.TclError:
             pass
@@ -322,7 +502,7 @@ class Editor(tk.LabelFrame):
             if (tab is not None):
                 tab.text.edit_redo()
                 tab.update_line_numbers()
-                tab.colorize()
+                tab.colorize_changed()
                 return 'break'
         except tk.TclError:
             pass
@@ -345,6 +525,7 @@ class Editor(tk.LabelFrame):
             tab = self.nb.get_current_tab()
             tab.text.delete(tk.SEL_FIRST, tk.SEL_LAST)
             tab.update_line_numbers()
+            tab.colorize(tk.INSERT, tk.INSERT)
             self.refresh_yoda_tree()
 
     def copy(self, event=None):
@@ -400,6 +581,7 @@ class Editor(tk.LabelFrame):
             tab = self.nb.get_current_tab()
             tab.text.delete(tk.SEL_FIRST, tk.SEL_LAST)
             tab.update_line_numbers()
+            tab.colorize(tk.INSERT, tk.INSERT)
             self.refresh_yoda_tree()
 
     def select_all(self, event=None):
@@ -417,10 +599,26 @@ class Editor(tk.LabelFrame):
         if (tab is not None):
             tab.text.tag_add(tk.SEL, '1.0', 'end')
 
+    def reformat(self, event=None):
+        """Method reformats marked text or whole tab text content
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        tab = self.nb.get_current_tab()
+        if (tab is not None):
+            tab.reformat()
+            return 'break'
+
     def save_tabs(self):
         """Method saves all tab content
 
-        Dialog is displayed for new files
+        Dialog is displayed for new files, files are written concurrently in background
 
         Args:
             event (obj): event
@@ -519,7 +717,7 @@ class Editor(tk.LabelFrame):
             win.destroy()
 
     def win_find(self, event=None):
-        """Method displays Find window
+        """Method displays incremental find bar of current tab
 
         Args:
             event (obj): event
@@ -531,51 +729,7 @@ class Editor(tk.LabelFrame):
 
         tab = self.nb.get_current_tab()
         if (tab is not None):
-            win = tk.Toplevel(self.root)
-            win.title(self.trn.msg('htk_gui_editor_find_title'))
-            win.transient(self.root)
-            win.resizable(False, False)
-            win.geometry('+%d+%d' % (self.root.winfo_screenwidth() / 2, self.root.winfo_screenheight() / 2))
-            win.tk.call('wm', 'iconphoto', win._w, self.root.images['logo'])
-
-            tk.Label(win, text=self.trn.msg('htk_gui_editor_find_text')).grid(row=0, column=0, sticky='e')
-            entry = tk.Entry(win, width=50)
-            entry.grid(row=0, column=1, padx=3, sticky='e')
-            entry.focus_set()
-
-            find_all = tk.BooleanVar(value=True)
-            tk.Checkbutton(win, text=self.trn.msg('htk_gui_editor_find_find_all'), variable=find_all).grid(row=1, column=1, pady=3, sticky='w')
-            ignore_case = tk.BooleanVar(value=True)
-            tk.Checkbutton(win, text=self.trn.msg('htk_gui_editor_find_ignore_case'), variable=ignore_case).grid(row=2, column=1, sticky='w')
-            regexp = tk.BooleanVar()
-            tk.Checkbutton(win, text=self.trn.msg('htk_gui_editor_find_regexp'), variable=regexp).grid(row=3, column=1, sticky='w')
-
-            btn = tk.Button(win, text='OK', command=lambda: self._find(entry.get(), find_all.get(), ignore_case.get(), regexp.get(), win))
-            btn.grid(row=0, column=2, padx=3, sticky='e')
-
-            win.bind('<Escape>', lambda f: win.destroy())
-
-    def _find(self, find_str, find_all, ignore_case, regexp, win=None):
-        """Method finds given string and highlights it
-
-        Args:
-            find_str (str): string to find
-            find_all (bool): find all occurrences, otherwise only next one
-            ignore_case (bool): ignore case
-            regexp (bool): regular expression
-            win (obj): window reference
-
-        Returns:
-            void
-
-        """
-
-        if (len(find_str) > 0):
-            tab = self.nb.get_current_tab()
-            tab.find(find_str=find_str, find_all=find_all, ignore_case=ignore_case, regexp=regexp)
-
-        if (win is not None):
-            win.destroy()
+            tab.show_find_bar()
 
     def win_replace(self, event=None):
         """Method displays Replace window
@@ -642,6 +796,36 @@ class Editor(tk.LabelFrame):
         if (win is not None):
             win.destroy()
 
+    def goto_definition(self, event=None):
+        """Method goes to definition of name at cursor
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        tab = self.nb.get_current_tab()
+        if (tab is not None):
+            Navigator.get_instance().goto_definition(tab)
+
+    def find_usages(self, event=None):
+        """Method finds usages of name at cursor
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        tab = self.nb.get_current_tab()
+        if (tab is not None):
+            Navigator.get_instance().find_usages(tab)
+
     def increase_font(self):
         """Method increases font size
 
@@ -687,6 +871,9 @@ class Editor(tk.LabelFrame):
 
         tab = self.nb.get_current_tab()
         if (tab != None):
+            tab.autocompleter.hide()
+
+        if (tab != None and not tab.read_only):
             self.yoda_tree.add_test(tab.path)
         else:
             self.yoda_tree.clear_tree()
@@ -694,6 +881,9 @@ class Editor(tk.LabelFrame):
     def refresh_yoda_tree(self, tab=None):
         """Method refreshes yoda tree
 
+        Test is parsed in background, tree is updated only
+        if tab version was not changed meanwhile
+
         Args:
             tab (obj): tab
 
@@ -704,4 +894,25 @@ class Editor(tk.LabelFrame):
         
         if (tab == None):
             tab = self.nb.get_current_tab()
-        self.yoda_tree.refresh(tab.path, tab.text.get('1.0', 'end-1c'))
+        if (tab.read_only):
+            return
+
+        version = tab.version
+        self.root.worker.submit(self.yoda_tree.parse, (tab.path, tab.get_content()),
+                                lambda parsed: self._update_yoda_tree(tab, version, parsed), key=(str(tab), 'yoda_tree'))
+
+    def _update_yoda_tree(self, tab, version, parsed):
+        """Method updates yoda tree with parsed test
+
+        Args:
+            tab (obj): tab
+            version (int): tab version of parsed test
+            parsed (tuple): parsed test
+
+        Returns:
+            void
+
+        """
+
+        if (tab.version == version):
+            self.yoda_tree.update_test(tab.path, parsed)
@@ -9,9 +9,15 @@
 """
 
 from hydratk.extensions.client.core.tkimport import tk, ttk, c_os
-from hydratk.extensions.client.core.colorizer import Colorizer
+from hydratk.extensions.client.core.colorizer import Colorizer, LineStates
 from hydratk.extensions.client.core.formatter import Formatter
 from hydratk.extensions.client.core.autocompleter import AutoCompleter
+from hydratk.extensions.client.core.gutter import Gutter
+from hydratk.extensions.client.core.scheduler import Scheduler
+from hydratk.extensions.client.core.document import Document, DocumentProxy
+from hydratk.extensions.client.core.finder import Finder
+
+import re
 
 class FileTab(tk.Frame):
     """Class FileTab
@@ -29,14 +35,57 @@ class FileTab(tk.Frame):
     _path = None
     _last_find_str = ''
     _disable_format = False
+    _highlight = None
+    _read_only = False
+    _row_offset = 0
+
+    # colorizing
+    _cached_version = None
+    _store_pending = False
+    _lexer = None
+    _line_states = None
+    _fill_job = None
+    _view_job = None
+    _fill_chunk = 200
+    _fill_delay = 500
+
+    # loading
+    _loading = False
+    _load_job = None
+    _load_callbacks = None
+    _load_chunk = 5000
+
+    # updates
+    _scheduler = None
+    _colorize_rows = None
+
+    # document mirror
+    _document = None
+    _proxy = None
+    _subscribers = None
+    _change = None
+
+    # find
+    _finder = None
+    _match = None
+    _find_origin = None
+    _tag_job = None
+    _tag_ranges = None
+    _tag_chunk = 500
 
     # gui elements
     _text = None
-    _ln_bar = None
+    _gutter = None
     _info_bar = None
     _vbar = None
     _hbar = None
     _menu = None
+    _find_bar = None
+    _find_entry = None
+    _find_label = None
+    _find_var = None
+    _find_ignore_case = None
+    _find_regexp = None
 
     def __init__(self, nb, name, path=None, content=None):
         """Class constructor
@@ -60,6 +109,10 @@ class FileTab(tk.Frame):
         tk.Frame.__init__(self)
         self._name = name
         self._path = path
+        self._lexer = self.colorizer.get_lexer(path)
+        self._line_states = LineStates()
+        self._fill_delay = self.editor.delay['fill']
+        self._set_scheduler()
         self._set_gui(content)
 
     @property
@@ -98,18 +151,87 @@ class FileTab(tk.Frame):
 
         return self._text
 
+    @property
+    def document(self):
+        """ document property getter """
+
+        return self._document
+
+    @property
+    def gutter(self):
+        """ gutter property getter """
+
+        return self._gutter
+
+    @property
+    def scheduler(self):
+        """ scheduler property getter """
+
+        return self._scheduler
+
+    @property
+    def version(self):
+        """ version property getter, document version incremented by each text change """
+
+        return self._document.version
+
+    @property
+    def read_only(self):
+        """ read_only property getter, tab is read-only also while content is loading """
+
+        return self._read_only or self._loading
+
+    @property
+    def loading(self):
+        """ loading property getter """
+
+        return self._loading
+
     @property
     def name(self):
         """ name property getter """
 
         return self._name
 
+    @name.setter
+    def name(self, name):
+        """ name property setter """
+
+        self._name = name
+
     @property
     def path(self):
         """ path property getter """
 
         return self._path
 
+    @path.setter
+    def path(self, path):
+        """ path property setter, lexer is changed according to file suffix """
+
+        self._path = path
+        lexer = self.colorizer.get_lexer(path)
+        if (lexer is not self._lexer):
+            self._lexer = lexer
+            self._line_states = LineStates()
+            self._cached_version = None
+            for tag in self._text.tag_names():
+                if (tag not in [tk.SEL, 'highlight', 'match']):
+                    self._text.tag_remove(tag, '1.0', tk.END)
+            self.colorize_view()
+
+    @property
+    def lexer(self):
+        """ lexer property getter """
+
+        return self._lexer
+
+    @property
+    def line_states(self):
+        """ line_states property getter """
+
+        return self._line_states
+
     def _set_gui(self, content=None):
         """Method sets graphical interface
 
@@ -127,14 +249,23 @@ class FileTab(tk.Frame):
         self._vbar = ttk.Scrollbar(self, orient=tk.VERTICAL)
         self._hbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL)
 
-        # line number bar
-        self._ln_bar = tk.Text(self, background='#FFFFFF', width=5, padx=3, takefocus=0, state=tk.DISABLED, yscrollcommand=self._vbar.set)
-        self._ln_bar.grid(in_=self, row=0, column=0, sticky=tk.NSEW)
-
         # text area
-        self._text = tk.Text(self, wrap=tk.NONE, background='#FFFFFF', xscrollcommand=self._hbar.set, yscrollcommand=self._vbar.set)
-        self.set_font(self.editor.font['family'], self.editor.font['size'], self.editor.font['style'])
+        self._text = tk.Text(self, wrap=tk.NONE, background='#FFFFFF', xscrollcommand=self._hbar.set, yscrollcommand=self._on_text_scroll)
         self._text.grid(in_=self, row=0, column=1, sticky=tk.NSEW)
+        self._text.tag_configure('highlight', background='#AFEEEE')
+        self._text.tag_configure('match', foreground='#FF0000', background='#FFFF00')
+        self._subscribers = []
+        self._document = Document()
+        self._document.add_listener(self._on_document_change)
+        self._proxy = DocumentProxy(self._text, self._document)
+        self._finder = Finder(self._document)
+        self.subscribe(self._on_change)
+
+        # line number gutter
+        font = (self.editor.font['family'], self.editor.font['size'], self.editor.font['style'])
+        self._gutter = Gutter(self, self._text, self._document, font, self.editor.var_show_line_number.get())
+        self._gutter.grid(in_=self, row=0, column=0, sticky=tk.NSEW)
+        self.set_font(*font)
 
         # scrollbars
         self._vbar.configure(command=self._text.yview)
@@ -156,7 +287,8 @@ class FileTab(tk.Frame):
             self._text.mark_set(tk.INSERT, 1.0)
             self.update_line_numbers()
             self.update_info_bar()
-            self.colorize()
+            if (not self.colorize_cached()):
+                self.after_idle(self.colorize_view)
 
         # events
         self._text.configure(undo=True)
@@ -166,26 +298,51 @@ class FileTab(tk.Frame):
         self._text.bind('<Any-KeyRelease>', self._on_key_release)
         self._text.bind('<ButtonRelease-1>', self._on_mouse_click)
         self._vbar.configure(command=self._on_vsb)
+        self._text.bind('<Configure>', self._gutter.schedule)
 
         if (c_os == 'Windows'):
-            self._ln_bar.bind('<MouseWheel>', self._on_mouse_wheel)
+            self._gutter.bind('<MouseWheel>', self._on_mouse_wheel)
             self._text.bind('<MouseWheel>', self._on_mouse_wheel)
             self._text.bind('<Control-MouseWheel>', self._change_font_size)
         else:
-            self._ln_bar.bind('<Button-4>', self._on_mouse_wheel)
-            self._ln_bar.bind('<Button-5>', self._on_mouse_wheel)
+            self._gutter.bind('<Button-4>', self._on_mouse_wheel)
+            self._gutter.bind('<Button-5>', self._on_mouse_wheel)
             self._text.bind('<Button-4>', self._on_mouse_wheel)
             self._text.bind('<Button-5>', self._on_mouse_wheel)
             self._text.bind('<Control-Button-4>', self._change_font_size)
             self._text.bind('<Control-Button-5>', self._change_font_size)
 
         self._text.bind('<F3>', self.find)
+        self._text.bind('<Shift-F3>', self.find_previous)
         self._text.bind('<Control-z>', self.editor.undo)
         self._text.bind('<Control-y>', self.editor.redo)
         self._text.bind('<Control-space>', self._show_autocomplete)
+        self._text.bind('<F12>', self.editor.goto_definition)
+        self._text.bind('<Shift-F12>', self.editor.find_usages)
+        self._text.bind('<Control-Button-1>', self._on_ctrl_click)
+        self._text.bind('<Escape>', self._on_escape)
 
         self._set_menu()
 
+    def _set_scheduler(self):
+        """Method sets scheduler of tab updates
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._scheduler = Scheduler(self)
+        self._scheduler.register('gutter', self._redraw_gutter)
+        self._scheduler.register('cursor', self._update_cursor)
+        self._scheduler.register('colorize', self._flush_colorize, self.editor.delay['colorize'])
+        self._scheduler.register('changes', self._flush_changes)
+        self._scheduler.register('yoda_tree', lambda: self.editor.refresh_yoda_tree(self), self.editor.delay['yoda_tree'])
+        self._scheduler.register('find', self._incremental_find, self.editor.delay['find'])
+
     def _set_menu(self):
         """Method sets menu
 
@@ -205,9 +362,12 @@ class FileTab(tk.Frame):
         self._menu.add_command(label=self.editor.trn.msg('htk_gui_editor_menu_paste'), accelerator='Ctrl+V', command=self.editor.paste)
         self._menu.add_command(label=self.editor.trn.msg('htk_gui_editor_menu_delete'), accelerator='Delete', command=self.editor.delete)
         self._menu.add_command(label=self.editor.trn.msg('htk_gui_editor_menu_select_all'), accelerator='Ctrl+A', command=self.editor.select_all)
+        self._menu.add_command(label=self.editor.trn.msg('htk_gui_editor_menu_reformat'), accelerator='Ctrl+Shift+F', command=self.editor.reformat)
         self._menu.add_command(label=self.editor.trn.msg('htk_gui_editor_menu_goto'), accelerator='Ctrl+G', command=self.editor.win_goto)
         self._menu.add_command(label=self.editor.trn.msg('htk_gui_editor_menu_find'), accelerator='Ctrl+F', command=self.editor.win_find)
         self._menu.add_command(label=self.editor.trn.msg('htk_gui_editor_menu_replace'), accelerator='Ctrl+R', command=self.editor.win_replace)
+        self._menu.add_command(label=self.editor.trn.msg('htk_gui_editor_menu_goto_definition'), accelerator='F12', command=self.editor.goto_definition)
+        self._menu.add_command(label=self.editor.trn.msg('htk_gui_editor_menu_find_usages'), accelerator='Shift+F12', command=self.editor.find_usages)
 
         self._text.bind('<Button-3>', self._context_menu)
 
@@ -238,29 +398,270 @@ class FileTab(tk.Frame):
         """
 
         self._text.configure(font=(family, size, style))
-        self._ln_bar.configure(font=(family, size, style))
+        self._gutter.set_font((family, size, style))
+
+    def load(self, path, callback=None):
+        """Method loads file content
+
+        File is read in background, content is inserted in chunks with progress
+        in info bar. Text is disabled until last chunk is inserted, then it is colorized.
+        Loading is cancelled by Escape.
+
+        Args:
+            path (str): file path
+            callback (callable): called with content after last chunk
+
+        Returns:
+            void
+
+        """
+
+        self._loading = True
+        self._load_callbacks = []
+        self._text.configure(state=tk.DISABLED)
+        self._info_bar.config(text=self.editor.trn.msg('htk_gui_editor_loading', 0))
+        self.editor.root.worker.submit(self._read_file, (path,), lambda result: self._insert_chunk(result, 0, callback),
+                                       key=(str(self), 'load'), errback=self._on_load_error)
+
+    @staticmethod
+    def _read_file(path):
+        """Method reads file, executed in background thread
+
+        Args:
+            path (str): file path
+
+        Returns:
+            tuple: content (str), lines (list)
+
+        """
+
+        with open(path, 'r') as f:
+            content = f.read()
+
+        return content, content.split('\n')
+
+    def _insert_chunk(self, result, start, callback=None):
+        """Method inserts next chunk of loaded lines
+
+        Args:
+            result (tuple): content (str), lines (list)
+            start (int): index of first line in chunk
+            callback (callable): called with content after last chunk
+
+        Returns:
+            void
+
+        """
+
+        self._load_job = None
+        content, lines = result
+        stop = min(start + self._load_chunk, len(lines))
+        chunk = '\n'.join(lines[start:stop])
+        self._text.configure(state=tk.NORMAL)
+        self._text.insert('end-1c', chunk if (start == 0) else '\n' + chunk)
+        self._text.configure(state=tk.DISABLED)
+
+        if (stop < len(lines)):
+            self._info_bar.config(text=self.editor.trn.msg('htk_gui_editor_loading', 100 * stop // len(lines)))
+            self._load_job = self.after(1, lambda: self._insert_chunk(result, stop, callback))
+        else:
+            self._loading = False
+            self._text.configure(state=tk.NORMAL)
+            self._text.edit_reset()
+            self._text.edit_modified(False)
+            self._text.mark_set(tk.INSERT, 1.0)
+            self.update_line_numbers()
+            self.update_info_bar()
+            if (not self.colorize_cached()):
+                self.colorize_view()
+            if (callback is not None):
+                callback(content)
+            callbacks, self._load_callbacks = self._load_callbacks, []
+            for callback in callbacks:
+                callback(self)
+
+    def add_load_callback(self, callback):
+        """Method adds callback called when loading is finished
+
+        Callback is called immediately if tab is not loading
+
+        Args:
+            callback (callable): called with tab
+
+        Returns:
+            void
+
+        """
+
+        if (self._loading):
+            self._load_callbacks.append(callback)
+        else:
+            callback(self)
+
+    def _on_load_error(self, error):
+        """Method handles file read error, tab is closed
+
+        Args:
+            error (str): traceback
+
+        Returns:
+            void
+
+        """
+
+        self.editor.logger.error(error)
+        self.cancel_load()
+
+    def cancel_load(self, event=None):
+        """Method cancels loading, tab is closed
+
+        Args:
+            event (obj): event
+
+        Returns:
+            str: break if loading was cancelled
+
+        """
+
+        if (self._loading):
+            self._text.edit_modified(False)
+            self.nb.close_tab(index=self.nb.index(self))
+            return 'break'
+
+    def subscribe(self, callback):
+        """Method subscribes to text changes
+
+        Changes are merged and delivered once when idle, callback is called with
+        version (int), first changed row (int), last changed row (int), count of added lines (int)
+
+        Args:
+            callback (callable): subscriber
+
+        Returns:
+            void
+
+        """
+
+        if (callback not in self._subscribers):
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Method unsubscribes from text changes
+
+        Args:
+            callback (callable): subscriber
+
+        Returns:
+            void
+
+        """
+
+        if (callback in self._subscribers):
+            self._subscribers.remove(callback)
+
+    def _on_document_change(self, version, row1, row2, delta):
+        """Method merges document change into pending change
+
+        Rows of current line highlight and cached lexer states are moved by change
+
+        Args:
+            version (int): document version
+            row1 (int): first changed row
+            row2 (int): last changed row
+            delta (int): count of added lines
+
+        Returns:
+            void
+
+        """
+
+        if (self._highlight is not None):
+            rows = [row if (row < row1) else (row + delta if (row > row2 - delta) else bound)
+                    for row, bound in zip(self._highlight[:2], (row1, row2))]
+            self._highlight = (max(rows[0], 1), max(rows[1], 1), self._highlight[2])
+        if (self._lexer is not None and not self._loading):
+            self.colorizer.update_states(self._lexer, self._line_states, row1, row2, self._document.line_count)
+
+        if (self._change is not None):
+            start, end, total = self._change[1:]
+            end = end + delta if (row1 <= end) else end
+            row1, row2, delta = min(start, row1), max(end, row2), total + delta
+        self._change = (version, row1, row2, delta)
+        self._scheduler.mark('changes')
 
-    def _get_line_numbers(self):
-        """Method calculates line numbers for current tab
+    def _flush_changes(self):
+        """Method delivers pending change to subscribers
 
         Args:
             none
 
         Returns:
-            str
+            void
+
+        """
+
+        change, self._change = self._change, None
+        if (change is not None):
+            for callback in list(self._subscribers):
+                callback(*change)
+
+    def _on_change(self, version, start, end, delta):
+        """Method handles text change
+
+        Gutter is redrawn when line count was changed, yoda tree is refreshed for test
+
+        Args:
+            version (int): document version
+            start (int): first changed row
+            end (int): last changed row
+            delta (int): count of added lines
+
+        Returns:
+            void
+
+        """
+
+        if (delta != 0):
+            self._scheduler.mark('gutter')
+        if (self._lexer is not None and self._lexer.lexer_id == 'yoda'):
+            self._scheduler.mark('yoda_tree')
+
+    def colorize_changed(self):
+        """Method colorizes rows of pending document change
+
+        Used after undo and redo which can change many rows
+
+        Args:
+            none
+
+        Returns:
+            void
 
         """
 
-        output = ''
-        row, col = self._text.index('end').split('.')
-        i = 0
-        for i in range(1, int(row) - 1):
-            output += str(i) + '\n'
+        if (self._change is not None):
+            row1, row2 = self._change[1:3]
+            self.colorize('{0}.0'.format(row1), '{0}.end'.format(row2))
+
+    def get_content(self):
+        """Method gets text content
 
-        return output + str(i + 1)
+        Content is served from document mirror without Tk access
+
+        Args:
+            none
+
+        Returns:
+            str
+
+        """
+
+        return self._document.get_content()
 
     def update_line_numbers(self, event=None):
-        """Method updates line numbers bar after event
+        """Method updates line numbers gutter after event
+
+        Only visible lines are redrawn when idle
 
         Args:
             event (obj): event
@@ -270,17 +671,23 @@ class FileTab(tk.Frame):
 
         """
 
-        if (self.editor.var_show_line_number.get()):
-            line_numbers = self._get_line_numbers()
-            self._ln_bar.config(state=tk.NORMAL)
-            self._ln_bar.delete('1.0', 'end')
-            self._ln_bar.insert('1.0', line_numbers)
-            self._ln_bar.yview_moveto(self._text.yview()[0])
-            self._ln_bar.config(state=tk.DISABLED)
-        else:
-            self._ln_bar.config(state=tk.NORMAL)
-            self._ln_bar.delete('1.0', 'end')
-            self._ln_bar.config(state=tk.DISABLED)
+        self._scheduler.mark('gutter')
+
+    def _redraw_gutter(self):
+        """Method redraws line numbers gutter
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        show_numbers = self.editor.var_show_line_number.get()
+        if (show_numbers != self._gutter.show_numbers):
+            self._gutter.show_numbers = show_numbers
+        self._gutter.redraw()
 
     def update_info_bar(self, event=None, index=None):
         """Method updates info bar after event
@@ -294,36 +701,67 @@ class FileTab(tk.Frame):
 
         """
 
-        if (self.editor.var_show_info_bar.get()):
+        if (self._loading):
+            return
+        elif (self.editor.var_show_info_bar.get()):
             row, col = self._text.index(tk.INSERT).split('.') if (index == None) else index.split('.')
-            row, col = str(int(row)), str(int(col) + 1)
-            self._info_bar.config(text='{0} : {1}'.format(row, col))
+            row, col = str(int(row) + self._row_offset), str(int(col) + 1)
+            text = '{0} : {1}'.format(row, col)
+            if (self._match is not None):
+                text += '    ' + self.editor.trn.msg('htk_gui_editor_find_match', self._match + 1, self._finder.count)
+            self._info_bar.config(text=text)
         else:
             self._info_bar.config(text='')
 
-    def highlight_line(self, event=None, row=None):
+    def highlight_line(self, event=None, row=None, see=False):
         """Method highlights current line
 
+        Highlight is moved only if row or text was changed, previous highlight
+        is removed from its rows tracked through document changes
+
         Args:
             event (obj): event
             row (str): row
+            see (bool): scroll to row
 
         Returns:
             void
 
         """
 
-        if (event != None):
+        if (event != None or row == None):
             row, col = self._text.index(tk.INSERT).split('.')
 
-        self._text.tag_remove('highlight', 1.0, 'end')
-        self._text.tag_add('highlight', row + '.0', row + '.150')
-        self._text.tag_configure('highlight', background='#AFEEEE')
-        self._text.see(row + '.0')
+        row = int(row)
+        if (self._highlight != (row, row, self.version)):
+            if (self._highlight is not None):
+                self._text.tag_remove('highlight', '{0}.0'.format(self._highlight[0]), '{0}.0'.format(self._highlight[1] + 1))
+            self._text.tag_add('highlight', '{0}.0'.format(row), '{0}.150'.format(row))
+            self._highlight = (row, row, self.version)
+
+        if (see):
+            self._text.see('{0}.0'.format(row))
+
+    def _update_cursor(self):
+        """Method updates info bar and highlight after cursor move
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        idx = self._text.index(tk.INSERT)
+        self.update_info_bar(index=idx)
+        self.highlight_line(row=idx.split('.')[0])
 
     def _on_key_press(self, event=None):
         """Method handles key press
 
+        Updates are flushed once when idle
+
         Args:
             event (obj): event
 
@@ -332,13 +770,17 @@ class FileTab(tk.Frame):
 
         """
 
-        self.update_line_numbers(event)
-        self.update_info_bar(event)
-        self.highlight_line(event)
+        if (self.autocompleter.on_key_press(self, event)):
+            return 'break'
+
+        self._cancel_fill()
+        self._mark_view()
 
     def _on_key_release(self, event=None):
         """Method handles key release
 
+        Updates are flushed once when idle, key repeat bursts are coalesced
+
         Args:
             event (obj): event
 
@@ -347,24 +789,41 @@ class FileTab(tk.Frame):
 
         """
 
-        self.update_line_numbers(event)
-        self.update_info_bar(event)
-        self.highlight_line(event)
+        self._mark_view()
+
+        # format text
+        self._format_text(event)
 
         # recolorize
-        if (event.keysym not in ['Up', 'Down']):
-            row = self._text.index(tk.INSERT).split('.')[0]
-            self.colorize('{0}.0'.format(int(row)), '{0}.0'.format(int(row) + 1))
+        if (self._is_edit_key(event)):
+            self.mark_colorize(tk.INSERT, tk.INSERT)
 
         # remove highlight
-        self._text.tag_remove('match', 1.0, tk.END)
+        if (event.keysym not in ['F3', 'Shift_L', 'Shift_R']):
+            self._clear_match()
 
-        # format text
-        self._format_text(event)
+        self._schedule_fill(self._fill_delay)
 
-        # refresh yoda tree
-        if (event.keysym == 'BackSpace'):
-            self.editor.refresh_yoda_tree(self)
+        # update code completion
+        self.autocompleter.on_key_release(self, event)
+
+    def _on_escape(self, event=None):
+        """Method handles Escape key
+
+        Loading or code completion is cancelled
+
+        Args:
+            event (obj): event
+
+        Returns:
+            str: break if event was handled
+
+        """
+
+        if (self._loading):
+            return self.cancel_load()
+        elif (self.autocompleter.on_key_press(self, event)):
+            return 'break'
 
     def _on_mouse_click(self, event=None):
         """Method handles mouse click event
@@ -377,9 +836,37 @@ class FileTab(tk.Frame):
 
         """
 
-        self.update_info_bar(event)
-        self.highlight_line(event)
-        self.text.tag_remove('match', 1.0, tk.END)
+        self._scheduler.mark('cursor')
+        self._clear_match()
+        if (self.autocompleter.tab is self):
+            self.autocompleter.hide()
+
+    def _mark_view(self):
+        """Method marks view updates dirty
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._scheduler.mark('gutter')
+        self._scheduler.mark('cursor')
+
+    def _is_edit_key(self, event):
+        """Method checks if key can change text
+
+        Args:
+            event (obj): event
+
+        Returns:
+            bool
+
+        """
+
+        return len(event.char) > 0 or event.keysym in ['BackSpace', 'Delete', 'Insert', 'Return', 'Tab']
 
     def _on_vsb(self, *args):
         """Method handles scrollbar event
@@ -392,9 +879,26 @@ class FileTab(tk.Frame):
 
         """
 
-        self._ln_bar.yview(*args)
         self._text.yview(*args)
 
+    def _on_text_scroll(self, *args):
+        """Method handles text scroll event
+
+        Visible rows are colorized and gutter is redrawn when idle
+
+        Args:
+            args (list): arguments
+
+        Returns:
+            void
+
+        """
+
+        self._vbar.set(*args)
+        self._gutter.schedule()
+        if (self._view_job is None):
+            self._view_job = self.after_idle(self.colorize_view)
+
     def _on_mouse_wheel(self, event=None):
         """Method handles mouse wheel event
 
@@ -407,7 +911,6 @@ class FileTab(tk.Frame):
         """
 
         if (c_os == 'Windows'):
-            self._ln_bar.yview_scroll(-1 * (event.delta / 120), 'units')
             self._text.yview_scroll(-1 * (event.delta / 120), 'units')
         else:
             unit = 0
@@ -415,7 +918,6 @@ class FileTab(tk.Frame):
                 unit = -1
             elif (event.num == 5):
                 unit = 1
-            self._ln_bar.yview_scroll(unit, 'units')
             self._text.yview_scroll(unit, 'units')
 
         return 'break'
@@ -454,16 +956,20 @@ class FileTab(tk.Frame):
         """
 
         self._text.mark_set(tk.INSERT, '%s.1' % line)
-        self.highlight_line(line)
+        self.highlight_line(row=line, see=True)
         self.update_info_bar()
         self.update_line_numbers()
 
     def find(self, event=None, find_str=None, find_all=False, ignore_case=False, regexp=False):
         """Method finds given string and highlights it
 
+        Matches are searched by Python regular expression over content snapshot,
+        all matches are highlighted by one call. Next match is searched from cursor
+        and wraps around document end, it is also used for event.
+
         Args:
             event (obj): event
-            find_str (str): string to find
+            find_str (str): string to find, last one is used for event
             find_all (bool): find all occurrences, otherwise only next one
             ignore_case (bool): ignore case
             regexp (bool): regular expression
@@ -474,98 +980,479 @@ class FileTab(tk.Frame):
         """
 
         if (event != None):
-            if (len(self._last_find_str) > 0):
-                find_str = self._last_find_str
-            else:
+            if (self._finder.query is None):
                 return
+            find_str, ignore_case, regexp = self._finder.query
+            find_all = False
 
-        self._text.tag_remove('match', 1.0, tk.END)
-        first_match = True
+        if (not self._search(find_str, ignore_case, regexp)):
+            return
 
         if (find_all):
-            idx1 = 1.0
+            i = 0 if (self._finder.count > 0) else None
+            if (i is not None):
+                self._text.tag_add('match', *self._finder.get_ranges())
         else:
-            row, col = self._text.index(tk.INSERT).split('.')
-            idx1 = '{0}.{1}'.format(row, int(col) + 1)
-
-        if (regexp):
-            find_str = r'{0}'.format(find_str)
-
-        while True:
-            idx1 = self._text.search(find_str, idx1, stopindex=tk.END, nocase=ignore_case, regexp=regexp)
-            if (not idx1):
-                if (event != None):
-                    idx1 = self._text.search(find_str, 1.0, stopindex=tk.END, nocase=ignore_case)
-                    if (not idx1):
-                        break
-                else:
-                    break
-            idx2 = '{0}+{1}c'.format(idx1, len(find_str))
-            self._text.tag_add('match', idx1, idx2)
-
-            if (first_match):
-                self._last_find_str = find_str
-                self._text.mark_set(tk.INSERT, idx1)
-                self._text.see(tk.INSERT)
-                first_match = False
-                if (not find_all):
-                    break
-
-            idx1 = idx2
-        self._text.tag_config('match', foreground='#FF0000', background='#FFFF00')
+            i = self._finder.find_next(self._document.index_to_offset(self._text.index(tk.INSERT)))
+            if (i is not None):
+                self._text.tag_add('match', *self._finder.get_range(i))
 
-    def replace(self, find_str, replace_str, replace_all, ignore_case, regexp):
-        """Method finds given string and replaces it
+        self._show_match(i)
 
-        Args:
-            find_str (str): string to find
-            replace_str (str): string to replace
-            replace_all (bool): replace all occurrences, otherwise only next one
-            ignore_case (bool): ignore case
-            regexp (bool): regular expression
+    def find_previous(self, event=None):
+        """Method finds previous occurrence of last string and highlights it
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        if (self._finder.query is None or not self._search(*self._finder.query)):
+            return
+
+        i = self._finder.find_previous(self._document.index_to_offset(self._text.index(tk.INSERT)))
+        if (i is not None):
+            self._text.tag_add('match', *self._finder.get_range(i))
+
+        self._show_match(i)
+
+    def _search(self, find_str, ignore_case, regexp):
+        """Method searches content and removes previous highlight
+
+        Args:
+            find_str (str): string to find
+            ignore_case (bool): ignore case
+            regexp (bool): regular expression
+
+        Returns:
+            bool: search succeeded, invalid regular expression is logged
+
+        """
+
+        self._clear_match()
+        try:
+            self._finder.search(find_str, ignore_case, regexp)
+        except re.error as ex:
+            self.editor.logger.error(ex)
+            return False
+
+        self._last_find_str = find_str
+        return True
+
+    def _clear_match(self):
+        """Method removes match highlight
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._cancel_tagging()
+        self._text.tag_remove('match', '1.0', tk.END)
+        self._match = None
+
+    def show_find_bar(self, event=None):
+        """Method shows incremental find bar
+
+        Selected text is used as initial string, matches are searched from cursor
+
+        Args:
+            event (obj): event
+
+        Returns:
+            str: break
+
+        """
+
+        if (self._find_bar is None):
+            self._set_find_bar()
+        else:
+            self._find_bar.grid()
+
+        self._find_origin = self._text.index(tk.INSERT)
+        selection = self._text.tag_ranges(tk.SEL)
+        if (len(selection) > 0):
+            text = self._text.get(*selection)
+            if (len(text) > 0 and '\n' not in text):
+                self._find_origin = str(selection[0])
+                self._find_var.set(text)
+
+        self._find_entry.focus_set()
+        self._find_entry.select_range(0, tk.END)
+        if (len(self._find_var.get()) > 0):
+            self._scheduler.mark('find')
+
+        return 'break'
+
+    def hide_find_bar(self, event=None):
+        """Method hides incremental find bar
+
+        Args:
+            event (obj): event
+
+        Returns:
+            str: break
+
+        """
+
+        self._scheduler.cancel('find')
+        self._clear_match()
+        self.update_info_bar()
+        if (self._find_bar is not None):
+            self._find_bar.grid_remove()
+        self._text.focus_set()
+
+        return 'break'
+
+    def _set_find_bar(self):
+        """Method sets incremental find bar
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        trn = self.editor.trn
+        self._find_bar = tk.Frame(self)
+        self._find_bar.grid(in_=self, row=2, column=0, columnspan=3, sticky=tk.EW)
+
+        tk.Label(self._find_bar, text=trn.msg('htk_gui_editor_find_text')).pack(side=tk.LEFT, padx=3)
+        self._find_var = tk.StringVar()
+        self._find_entry = tk.Entry(self._find_bar, width=40, textvariable=self._find_var)
+        self._find_entry.pack(side=tk.LEFT, padx=3)
+        self._find_ignore_case = tk.BooleanVar(value=False)
+        tk.Checkbutton(self._find_bar, text=trn.msg('htk_gui_editor_find_ignore_case'), variable=self._find_ignore_case,
+                       command=self._on_find_changed).pack(side=tk.LEFT, padx=3)
+        self._find_regexp = tk.BooleanVar()
+        tk.Checkbutton(self._find_bar, text=trn.msg('htk_gui_editor_find_regexp'), variable=self._find_regexp,
+                       command=self._on_find_changed).pack(side=tk.LEFT, padx=3)
+        self._find_label = tk.Label(self._find_bar)
+        self._find_label.pack(side=tk.LEFT, padx=3)
+        tk.Button(self._find_bar, text='x', relief=tk.FLAT, command=self.hide_find_bar).pack(side=tk.RIGHT, padx=3)
+
+        self._find_var.trace('w', lambda *args: self._on_find_changed())
+        self._find_entry.bind('<Return>', lambda e: self._find_step())
+        self._find_entry.bind('<F3>', lambda e: self._find_step())
+        self._find_entry.bind('<Shift-Return>', lambda e: self._find_step(True))
+        self._find_entry.bind('<Shift-F3>', lambda e: self._find_step(True))
+        self._find_entry.bind('<Escape>', self.hide_find_bar)
+
+    def _on_find_changed(self):
+        """Method handles change of incremental find query
+
+        Pending search and highlighting are cancelled, search is debounced
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._cancel_tagging()
+        self._scheduler.mark('find')
+
+    def _incremental_find(self):
+        """Method searches query of find bar
+
+        First match from find origin is selected, matches in view are
+        highlighted immediately and remaining ones in idle chunks
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._clear_match()
+        query = self._find_var.get()
+        if (len(query) == 0):
+            self._finder.clear()
+            self._find_label.config(text='')
+            self.update_info_bar()
+            return
+
+        try:
+            count = self._finder.search(query, self._find_ignore_case.get(), self._find_regexp.get())
+        except re.error as ex:
+            self._find_label.config(text=str(ex))
+            self.update_info_bar()
+            return
+
+        self._last_find_str = query
+        self._show_match(self._finder.find_next(self._document.index_to_offset(self._find_origin) - 1))
+        i1, i2 = self._tag_visible()
+        self._tag_ranges = [(i2, count), (0, i1)]
+        self._tag_job = self.after_idle(self._tag_matches)
+
+    def _find_step(self, previous=False):
+        """Method moves to next or previous match of find bar query
+
+        Args:
+            previous (bool): previous match, otherwise next one
+
+        Returns:
+            str: break
+
+        """
+
+        self._scheduler.flush('find')
+        if (self._finder.current):
+            offset = self._document.index_to_offset(self._text.index(tk.INSERT))
+            i = self._finder.find_previous(offset) if (previous) else self._finder.find_next(offset)
+            self._show_match(i)
+            self._tag_visible()
+            self._find_origin = self._text.index(tk.INSERT)
+
+        return 'break'
+
+    def _show_match(self, i):
+        """Method moves cursor to match and shows its number in info bar
+
+        Args:
+            i (int): match number, None if not found
+
+        Returns:
+            void
+
+        """
+
+        self._match = i
+        if (i is not None):
+            self._text.mark_set(tk.INSERT, self._finder.get_range(i)[0])
+            self._text.see(tk.INSERT)
+            self._mark_view()
+        self.update_info_bar()
+
+        if (self._find_label is not None):
+            text = self.editor.trn.msg('htk_gui_editor_find_match', i + 1, self._finder.count) if (i is not None) else \
+                   self.editor.trn.msg('htk_gui_editor_find_not_found')
+            self._find_label.config(text=text)
+
+    def _tag_visible(self):
+        """Method highlights matches in view
+
+        Args:
+            none
+
+        Returns:
+            tuple: first match number (int), match number after last one (int)
+
+        """
+
+        top = self._document.index_to_offset(self._text.index('@0,0'))
+        bottom = self._document.index_to_offset(self._text.index('@0,{0} lineend'.format(self._text.winfo_height())))
+        i1, i2 = self._finder.get_between(top, bottom)
+        if (i2 > i1):
+            self._text.tag_add('match', *self._finder.get_ranges(i1, i2))
+
+        return i1, i2
+
+    def _tag_matches(self):
+        """Method highlights next chunk of matches when idle
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._tag_job = None
+        if (not self._finder.current):
+            return
+
+        while (len(self._tag_ranges) > 0 and self._tag_ranges[0][0] >= self._tag_ranges[0][1]):
+            self._tag_ranges.pop(0)
+        if (len(self._tag_ranges) == 0):
+            return
+
+        i1, i2 = self._tag_ranges[0]
+        stop = min(i1 + self._tag_chunk, i2)
+        self._text.tag_add('match', *self._finder.get_ranges(i1, stop))
+        self._tag_ranges[0] = (stop, i2)
+        self._tag_job = self.after_idle(self._tag_matches)
+
+    def _cancel_tagging(self):
+        """Method cancels pending highlighting of matches
+
+        Args:
+            none
 
         Returns:
             void
 
         """
 
-        self._text.tag_remove('match', 1.0, tk.END)
-        first_match = True
+        if (self._tag_job is not None):
+            self.after_cancel(self._tag_job)
+            self._tag_job = None
+
+    def replace(self, find_str, replace_str, replace_all, ignore_case, regexp):
+        """Method finds given string and replaces it
+
+        Replacement of all occurrences is computed by Python regular expression,
+        group references are expanded for regular expression. Changed spans
+        are applied from last one within single undo separator pair,
+        text is colorized and yoda tree is refreshed once.
+
+        Args:
+            find_str (str): string to find
+            replace_str (str): string to replace
+            replace_all (bool): replace all occurrences, otherwise only next one
+            ignore_case (bool): ignore case
+            regexp (bool): regular expression
+
+        Returns:
+            void
+
+        """
 
         if (replace_all):
-            idx1 = 1.0
+            self._clear_match()
+            try:
+                changes = self._finder.replace_all(find_str, replace_str, ignore_case, regexp)
+            except (re.error, IndexError) as ex:
+                self.editor.logger.error(ex)
+                return
         else:
-            row, col = self._text.index(tk.INSERT).split('.')
-            idx1 = '{0}.{1}'.format(row, int(col) + 1)
+            if (not self._search(find_str, ignore_case, regexp)):
+                return
+
+            i = self._finder.find_next(self._document.index_to_offset(self._text.index(tk.INSERT)))
+            if (i is None):
+                return
+
+            try:
+                changes = [self._finder.get_match(i) + (self._finder.expand(i, replace_str) if (regexp) else replace_str,)]
+            except (re.error, IndexError) as ex:
+                self.editor.logger.error(ex)
+                return
+
+        self._last_find_str = replace_str
+        if (len(changes) > 0):
+            self._apply_changes(changes)
+        if (replace_all):
+            self.editor.logger.info(self.editor.trn.msg('htk_core_replaced', len(changes), self.name))
+
+    def _apply_changes(self, changes):
+        """Method applies text changes
+
+        Changes are applied in reverse order within single undo separator pair,
+        replaced text is highlighted
+
+        Args:
+            changes (list): start offset (int), stop offset (int), replacement (str), sorted by offset
+
+        Returns:
+            void
+
+        """
+
+        changes = [(self._document.offset_to_index(start), self._document.offset_to_index(stop), text) for start, stop, text in changes]
+        autoseparators = self._text.cget('autoseparators')
+        self._text.configure(autoseparators=False)
+        try:
+            self._text.edit_separator()
+            for i, (idx1, idx2, text) in enumerate(reversed(changes)):
+                if (idx1 != idx2):
+                    self._text.delete(idx1, idx2)
+                if (len(text) > 0):
+                    self._text.insert(idx1, text, 'match')
+                if (i == 0):
+                    self._text.mark_set('replace_last', '{0}+{1}c'.format(idx1, len(text)))
+            self._text.edit_separator()
+        finally:
+            self._text.configure(autoseparators=autoseparators)
+
+        first_idx = changes[0][0]
+        self._text.mark_set(tk.INSERT, first_idx)
+        self._text.see(tk.INSERT)
+        self.colorize('{0} linestart'.format(first_idx), 'replace_last lineend')
+        self._text.mark_unset('replace_last')
+        self.editor.refresh_yoda_tree(self)
+
+    def reformat(self):
+        """Method reformats selected text or whole text
+
+        Text is changed in single undo step, changed rows are
+        colorized once
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        if (len(self._text.tag_ranges(tk.SEL)) > 0):
+            row1 = int(self._text.index(tk.SEL_FIRST).split('.')[0])
+            row2 = int(self._text.index(tk.SEL_LAST).split('.')[0])
+        else:
+            row1, row2 = 1, int(self._text.index('end-1c').split('.')[0])
+
+        rows = self.formatter.reformat(self, row1, row2)
+        if (rows is not None):
+            self.colorize('{0}.0'.format(rows[0]), '{0}.end'.format(rows[1]))
+            self.editor.refresh_yoda_tree(self)
+
+    def mark_colorize(self, start, stop):
+        """Method marks rows to be colorized
 
-        if (regexp):
-            find_str = r'{0}'.format(find_str)
+        Rows marked until flush are colorized together
 
-        while True:
-            idx1 = self._text.search(find_str, idx1, stopindex=tk.END, nocase=ignore_case, regexp=regexp)
-            if (not idx1):
-                break
+        Args:
+            start (str): start index
+            stop (str): stop index
+
+        Returns:
+            void
+
+        """
 
-            idx2 = '{0}+{1}c'.format(idx1, len(find_str))
-            self._text.delete(idx1, idx2)
-            self._text.insert(idx1, replace_str)
-            idx2 = '{0}+{1}c'.format(idx1, len(replace_str))
-            self._text.tag_add('match', idx1, idx2)
+        row1, row2 = int(self._text.index(start).split('.')[0]), int(self._text.index(stop).split('.')[0])
+        if (self._colorize_rows is not None):
+            row1, row2 = min(row1, self._colorize_rows[0]), max(row2, self._colorize_rows[1])
+        self._colorize_rows = (row1, row2)
+        self._scheduler.mark('colorize')
 
-            if (first_match):
-                self._last_find_str = replace_str
-                self._text.mark_set(tk.INSERT, idx1)
-                self._text.see(tk.INSERT)
-                first_match = False
-                if (not replace_all):
-                    break
+    def _flush_colorize(self):
+        """Method colorizes marked rows
 
-            idx1 = idx2
-        self._text.tag_config('match', foreground='red', background='yellow')
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        if (self._colorize_rows is not None):
+            row1, row2 = self._colorize_rows
+            self._colorize_rows = None
+            self.colorize('{0}.0'.format(row1), '{0}.end'.format(row2))
 
     def colorize(self, start='1.0', stop='end'):
         """Method colorizes text
 
+        Colorizing is incremental, start must point to edited row.
+        Text snapshot is lexed in background, result is applied only
+        if text version and lexer were not changed meanwhile.
+
         Args:
             start (str): start index
             stop (str): stop index
@@ -575,9 +1462,143 @@ class FileTab(tk.Frame):
 
         """
 
-        yoda_found = self.colorizer.colorize(self._text, start, stop)
-        if (yoda_found):
-            self.editor.refresh_yoda_tree(self)
+        if (self._lexer is None or self._loading):
+            return
+
+        version = self.version
+        args = self.colorizer.prepare(self._lexer, self._text, start, stop, self._line_states)
+        self.editor.root.worker.submit(self.colorizer.lex, args, lambda result: self._apply_colorize(version, result),
+                                       key=(str(self), 'colorize'))
+
+    def _apply_colorize(self, version, result):
+        """Method applies colorizing result
+
+        Args:
+            version (int): text version of result
+            result (tuple): lexer result
+
+        Returns:
+            void
+
+        """
+
+        if (version == self.version and result[0] is self._lexer):
+            yoda_found = self.colorizer.apply(self._text, result, self._line_states)
+            self._schedule_fill(self._fill_delay)
+            if (yoda_found):
+                self._scheduler.mark('yoda_tree')
+
+    def colorize_view(self, event=None):
+        """Method colorizes visible text first
+
+        Rest of text is colorized in background
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        self._view_job = None
+        if (self._lexer is None or self._loading):
+            return
+
+        start, stop = '@0,0', '@0,{0}'.format(self._text.winfo_height())
+        self.colorizer.colorize_view(self._lexer, self._text, start, stop, self._line_states)
+        if (self._fill_job is None):
+            self._schedule_fill()
+
+    def _schedule_fill(self, delay=None):
+        """Method schedules background colorizing
+
+        Args:
+            delay (int): delay in ms, otherwise when idle
+
+        Returns:
+            void
+
+        """
+
+        self._cancel_fill()
+        if (delay is None):
+            self._fill_job = self.after_idle(self._fill)
+        else:
+            self._fill_job = self.after(delay, self._fill)
+
+    def _cancel_fill(self):
+        """Method cancels pending background colorizing
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        if (self._fill_job is not None):
+            self.after_cancel(self._fill_job)
+            self._fill_job = None
+
+    def _fill(self):
+        """Method colorizes next chunk of text in background
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._fill_job = None
+        if (self._lexer is None or self._loading):
+            return
+        elif (self.colorizer.fill(self._lexer, self._text, self._line_states, self._fill_chunk)):
+            self._fill_job = self.after_idle(self._fill)
+        elif (self._store_pending):
+            self._store_pending = False
+            self.store_cache()
+
+    def colorize_cached(self):
+        """Method colorizes text from cache of fully lexed documents
+
+        Text not found in cache is stored when it is fully lexed
+
+        Args:
+            none
+
+        Returns:
+            bool: result
+
+        """
+
+        if (self._lexer is not None and self.colorizer.colorize_cached(self._lexer, self._text, self._line_states, self.get_content())):
+            self._cached_version = self.version
+            return True
+
+        self._store_pending = True
+        return False
+
+    def store_cache(self):
+        """Method stores fully lexed text to cache
+
+        Called after first fill of loaded text, on close and exit,
+        not after each edit
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        if (self._lexer is not None and self._cached_version != self.version and
+            self.colorizer.store(self._lexer, self._text, self._line_states, self.get_content())):
+            self._cached_version = self.version
 
     def _format_text(self, event=None):
         """Method formats text
@@ -591,10 +1612,27 @@ class FileTab(tk.Frame):
         """
 
         if (not self._disable_format):
-            self.formatter.format_text(event, self._text)
+            self.formatter.format_text(event, self)
         else:
             self._disable_format = False
 
+    def _on_ctrl_click(self, event):
+        """Method handles mouse click with Control, goes to definition of clicked name
+
+        Args:
+            event (obj): event
+
+        Returns:
+            str: break
+
+        """
+
+        self._text.mark_set(tk.INSERT, '@{0},{1}'.format(event.x, event.y))
+        self._on_mouse_click()
+        self.editor.goto_definition()
+
+        return 'break'
+
     def _show_autocomplete(self, event=None):
         """Method shows code autocomplete
 
@@ -608,6 +1646,32 @@ class FileTab(tk.Frame):
         
         self.autocompleter.show_completion(self)
 
+    def close(self):
+        """Method releases tab resources before tab is closed
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._cancel_fill()
+        self._cancel_tagging()
+        self._scheduler.cancel()
+        if (not self._loading):
+            self.store_cache()
+        if (self.autocompleter.tab is self):
+            self.autocompleter.hide()
+        if (self._loading):
+            self.editor.root.worker.cancel((str(self), 'load'))
+            if (self._load_job is not None):
+                self.after_cancel(self._load_job)
+                self._load_job = None
+            self._loading = False
+            self._load_callbacks = []
+
     def disable_format(self):
         """Method disables automatic format
 
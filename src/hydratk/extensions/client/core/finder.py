@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""Find engine
+
+.. module:: client.core.finder
+   :platform: Windows, Unix
+   :synopsis: Find engine
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+import re
+
+class Finder(object):
+    """Class Finder
+
+    Compiled Python regular expression is run over document content snapshot.
+    Matches are indexed as sorted start and stop offsets, index is reused
+    until query or document version is changed. Empty matches are skipped.
+
+    """
+
+    _patterns = OrderedDict()
+    _cache_size = 32
+
+    _document = None
+    _query = None
+    _version = None
+    _pattern = None
+    _content = None
+    _starts = None
+    _stops = None
+
+    def __init__(self, document):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           document (obj): Document
+
+        """
+
+        self._document = document
+        self._starts = []
+        self._stops = []
+
+    @property
+    def document(self):
+        """ document property getter """
+
+        return self._document
+
+    @property
+    def query(self):
+        """ query property getter, find string (str), ignore case (bool), regular expression (bool) """
+
+        return self._query
+
+    @property
+    def pattern(self):
+        """ pattern property getter """
+
+        return self._pattern
+
+    @property
+    def current(self):
+        """ current property getter, index matches document version """
+
+        return self._query is not None and self._version == self._document.version
+
+    @property
+    def count(self):
+        """ count property getter """
+
+        return len(self._starts)
+
+    @staticmethod
+    def compile(find_str, ignore_case=False, regexp=False):
+        """Method compiles pattern
+
+        Compiled patterns are cached
+
+        Args:
+            find_str (str): string to find
+            ignore_case (bool): ignore case
+            regexp (bool): regular expression
+
+        Returns:
+            obj
+
+        Raises:
+            error: re.error
+
+        """
+
+        key = (find_str, ignore_case, regexp)
+        if (key in Finder._patterns):
+            pattern = Finder._patterns.pop(key)
+        else:
+            flags = re.MULTILINE | re.UNICODE | (re.IGNORECASE if (ignore_case) else 0)
+            pattern = re.compile(find_str if (regexp) else re.escape(find_str), flags)
+            if (len(Finder._patterns) >= Finder._cache_size):
+                Finder._patterns.popitem(last=False)
+
+        Finder._patterns[key] = pattern
+
+        return pattern
+
+    def search(self, find_str, ignore_case=False, regexp=False):
+        """Method searches document
+
+        Args:
+            find_str (str): string to find
+            ignore_case (bool): ignore case
+            regexp (bool): regular expression
+
+        Returns:
+            int: count of matches
+
+        Raises:
+            error: re.error
+
+        """
+
+        query = (find_str, ignore_case, regexp)
+        if (query == self._query and self._version == self._document.version):
+            return self.count
+
+        self._pattern = self.compile(*query)
+        self._query = query
+        self._version = self._document.version
+        self._content = self._document.get_content()
+        self._starts, self._stops = [], []
+        for match in self._pattern.finditer(self._content):
+            if (match.end() > match.start()):
+                self._starts.append(match.start())
+                self._stops.append(match.end())
+
+        return self.count
+
+    def clear(self):
+        """Method clears match index
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._query = self._version = self._pattern = self._content = None
+        self._starts, self._stops = [], []
+
+    def get_match(self, i):
+        """Method gets match offsets
+
+        Args:
+            i (int): match number, starting from 0
+
+        Returns:
+            tuple: start offset (int), stop offset (int)
+
+        """
+
+        return self._starts[i], self._stops[i]
+
+    def get_range(self, i):
+        """Method gets match indexes
+
+        Args:
+            i (int): match number
+
+        Returns:
+            tuple: start index (str), stop index (str)
+
+        """
+
+        return self._document.offset_to_index(self._starts[i]), self._document.offset_to_index(self._stops[i])
+
+    def get_ranges(self, i1=0, i2=None):
+        """Method gets indexes of matches, flattened for tag_add
+
+        Args:
+            i1 (int): first match number
+            i2 (int): match number after last one, all matches if None
+
+        Returns:
+            list
+
+        """
+
+        ranges = []
+        for i in range(i1, self.count if (i2 is None) else min(i2, self.count)):
+            ranges.extend(self.get_range(i))
+
+        return ranges
+
+    def get_between(self, offset1, offset2):
+        """Method gets matches overlapping offset range
+
+        Args:
+            offset1 (int): start offset
+            offset2 (int): stop offset
+
+        Returns:
+            tuple: first match number (int), match number after last one (int)
+
+        """
+
+        return bisect_right(self._stops, offset1), bisect_right(self._starts, offset2)
+
+    def find_next(self, offset):
+        """Method finds first match starting after offset
+
+        Search wraps around document end
+
+        Args:
+            offset (int): offset
+
+        Returns:
+            int: match number, None if there is no match
+
+        """
+
+        if (self.count == 0):
+            return None
+
+        i = bisect_right(self._starts, offset)
+
+        return i if (i < self.count) else 0
+
+    def find_previous(self, offset):
+        """Method finds last match starting before offset
+
+        Search wraps around document begin
+
+        Args:
+            offset (int): offset
+
+        Returns:
+            int: match number, None if there is no match
+
+        """
+
+        if (self.count == 0):
+            return None
+
+        i = bisect_left(self._starts, offset) - 1
+
+        return i if (i >= 0) else self.count - 1
+
+    def expand(self, i, template):
+        """Method expands replacement template for match
+
+        Args:
+            i (int): match number
+            template (str): template with group references
+
+        Returns:
+            str
+
+        Raises:
+            error: re.error
+
+        """
+
+        return self._pattern.match(self._content, self._starts[i]).expand(template)
+
+    def replace_all(self, find_str, template, ignore_case=False, regexp=False):
+        """Method computes replacement of all matches
+
+        Document content is replaced by re.subn, template group references
+        are expanded for regular expression. Only changed spans are returned.
+
+        Args:
+            find_str (str): string to find
+            template (str): replacement
+            ignore_case (bool): ignore case
+            regexp (bool): regular expression
+
+        Returns:
+            list: start offset (int), stop offset (int), replacement (str)
+
+        Raises:
+            error: re.error
+
+        """
+
+        changes = []
+
+        def replace(match):
+            text = match.expand(template) if (regexp) else template
+            if (text != match.group(0)):
+                changes.append((match.start(), match.end(), text))
+            return text
+
+        self.compile(find_str, ignore_case, regexp).subn(replace, self._document.get_content())
+
+        return changes
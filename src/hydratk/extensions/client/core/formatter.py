@@ -9,9 +9,13 @@
 """
 
 from hydratk.extensions.client.core.tkimport import tk
+from hydratk.extensions.client.core.colorizer import Colorizer
 
 class Formatter(object):
     """Class Formatter
+
+    Indent is computed from lexer state of previous line, Tk search is not used
+
     """
 
     _instance = None
@@ -19,9 +23,10 @@ class Formatter(object):
 
     # references
     _config = None
+    _colorizer = None
 
     # format
-    _patterns = {}
+    _indent_size = {}
     _amend_keys = {}
 
     def __init__(self):
@@ -44,6 +49,7 @@ class Formatter(object):
 
         from hydratk.extensions.client.core.gui import Gui
         self._config = Gui.get_instance().cfg
+        self._colorizer = Colorizer.get_instance()
 
         self._parse_config()
         self._make_patterns()
@@ -72,6 +78,12 @@ class Formatter(object):
 
         return self._config
 
+    @property
+    def colorizer(self):
+        """ colorizer property getter """
+
+        return self._colorizer
+
     def _parse_config(self):
         """Method parses configuration
 
@@ -84,9 +96,8 @@ class Formatter(object):
         """
 
         cfg = self.config.data['Core']['editor']['format']
-        self._patterns['python_inc'] = {'indent' : cfg['indent_python']}
-        self._patterns['python_dec'] = {'indent' :-cfg['indent_python']}
-        self._patterns['yoda'] = {'indent' : cfg['indent_yoda']}
+        self._indent_size['python'] = int(cfg['indent_python'])
+        self._indent_size['yoda'] = int(cfg['indent_yoda'])
 
     def _make_patterns(self):
         """Method makes patterns for text formatting
@@ -99,25 +110,6 @@ class Formatter(object):
 
         """
 
-        # python increase
-        tags = [
-                'def', 'class', 'if', 'elif', 'else', 'while', 'for', 'with', 'try', 'except', 'finally'
-               ]
-        self._patterns['python_inc']['pattern'] = r'\y(' + '|'.join(tags) + r')\y\s*.*:'
-        
-        # python decrease
-        tags = [
-                'return', 'break', 'continue', 'pass', 'exit', 'raise'
-               ]
-        self._patterns['python_dec']['pattern'] = r'\y(' + '|'.join(tags) + r')\y\s+.*'
-
-        # yoda
-        tags = [
-                'TEST-SCENARIO-\d+', 'TEST-CASE-\d+', 'TEST-CONDITION-\d+', 'PRE-REQ', 'POST-REQ',
-                'TEST', 'VALIDATE', 'EVENTS', 'BEFORE_START', 'AFTER_FINISH'
-               ]
-        self._patterns['yoda']['pattern'] = r'\y(' + '|'.join(tags) + r')\y\s*:\s*\|?'
-        
         # keys to be amended
         self._amend_keys = {
                             '(' : ')',
@@ -125,12 +117,12 @@ class Formatter(object):
                             '[' : ']'
                            }
 
-    def format_text(self, event, text):
+    def format_text(self, event, tab):
         """Method formats text
 
         Args:
             event (obj): event
-            text (obj): Text widget
+            tab (obj): FileTab
 
         Returns:
             void
@@ -138,9 +130,9 @@ class Formatter(object):
         """
 
         if (event.keysym == 'Return'):
-            self._indent(text)
+            self._indent(tab)
         elif (event.char in self._amend_keys):
-            self._amend_key(event.char, text)
+            self._amend_key(event.char, tab.text)
             
     def _amend_key(self, key, text):
         """Method amends predefined key
@@ -156,29 +148,103 @@ class Formatter(object):
 
         text.insert(tk.INSERT, self._amend_keys[key])
 
-    def _indent(self, text):
+    def _get_changes(self, lines, row, size, lexer=None, state=None):
+        """Method gets changes normalizing indentation and trailing whitespace
+
+        Tabs in indentation are expanded to spaces, trailing whitespace is removed.
+        Lines are lexed if lexer is given, indentation of line starting inside
+        multi-line string and trailing whitespace of line ending inside it are kept.
+
+        Args:
+            lines (list): lines content
+            row (int): row of first line
+            size (int): indent size
+            lexer (obj): Lexer instance
+            state (obj): lexer state at first line start
+
+        Returns:
+            list: changes (row, start column, stop column, replacement)
+
+        """
+
+        changes = []
+        in_string = False
+        for i, line in enumerate(lines):
+            if (lexer is not None):
+                in_string = lexer.in_string(state)
+                state = lexer.lex_line(line, state)[1]
+
+            content = line.rstrip()
+            code = content.lstrip()
+            indent = content[:len(content) - len(code)]
+            if ('\t' in indent and not in_string):
+                changes.append((row + i, 0, len(indent), indent.expandtabs(size)))
+            if (len(content) < len(line) and (lexer is None or not lexer.in_string(state))):
+                changes.append((row + i, len(content), len(line), ''))
+
+        return changes
+
+    def reformat(self, tab, row1, row2):
+        """Method reformats rows
+
+        Text is read in single call and lexed from cached state at first row,
+        changes are applied in reverse order within single undo separator pair
+
+        Args:
+            tab (obj): FileTab
+            row1 (int): first row
+            row2 (int): last row
+
+        Returns:
+            tuple: first and last changed row (int), None if text was not changed
+
+        """
+
+        text = tab.text
+        key = 'yoda' if (tab.lexer is not None and tab.lexer.lexer_id in ['yoda', 'yaml']) else 'python'
+        lines = text.get('{0}.0'.format(row1), '{0}.end'.format(row2)).split('\n')
+        state = self.colorizer.get_state(tab.lexer, tab.line_states, row1) if (tab.lexer is not None) else None
+        changes = self._get_changes(lines, row1, self._indent_size[key], tab.lexer, state)
+        if (len(changes) == 0):
+            return None
+
+        autoseparators = text.cget('autoseparators')
+        text.configure(autoseparators=False)
+        try:
+            text.edit_separator()
+            for row, col1, col2, replacement in reversed(changes):
+                text.delete('{0}.{1}'.format(row, col1), '{0}.{1}'.format(row, col2))
+                if (len(replacement) > 0):
+                    text.insert('{0}.{1}'.format(row, col1), replacement)
+            text.edit_separator()
+        finally:
+            text.configure(autoseparators=autoseparators)
+
+        return changes[0][0], changes[-1][0]
+
+    def _indent(self, tab):
         """Method sets indent
 
+        Previous line is lexed from cached lexer state at its start
+
         Args:
-            text (obj): Text widget
+            tab (obj): FileTab
 
         Returns:
             void
 
         """
 
-        row, col = text.index(tk.INSERT).split('.')
-        start, stop = '{0}.0'.format(int(row) - 1), '{0}.0-1c'.format(row)
-        content = text.get(start, stop)
-        indent = len(content) - len(content.lstrip())
-
-        for key, value in self._patterns.items():
-            nocase = True if (key == 'yoda') else False
-            idx = text.search(value['pattern'], start, stopindex=stop, nocase=nocase, regexp=True)
-            if (idx):
-                indent += value['indent']
-                if (indent < 0):
-                    indent = 0
-                break
-
-        text.insert(tk.INSERT, ' ' * indent)
+        text = tab.text
+        row = int(text.index(tk.INSERT).split('.')[0])
+        content = text.get('{0}.0'.format(row - 1), '{0}.end'.format(row - 1))
+
+        if (tab.lexer is None):
+            indent = len(content) - len(content.lstrip())
+        else:
+            state1 = self.colorizer.get_state(tab.lexer, tab.line_states, row - 1)
+            spans, state2, found = tab.lexer.lex_line(content, state1)
+            indent = tab.lexer.get_indent(content, spans, state1, state2, self._indent_size)
+
+        if (indent > 0):
+            text.insert(tk.INSERT, ' ' * indent)
@@ -21,6 +21,9 @@ from hydratk.extensions.client.core.logger import Logger
 from hydratk.extensions.client.core.pluginmanager import PluginManager
 from hydratk.extensions.client.core.help import Help
 from hydratk.extensions.client.core.tooltip import ToolTip
+from hydratk.extensions.client.core.worker import Worker
+from hydratk.extensions.client.core.colorizer import Colorizer
+from hydratk.extensions.client.core.autocompleter import AutoCompleter
 
 class Gui(tk.Tk):
     """Class Gui
@@ -39,6 +42,7 @@ class Gui(tk.Tk):
     _pluginmanager = None
     _plugins = {}
     _help = None
+    _worker = None
 
     # frames
     _frame_main = None
@@ -154,6 +158,12 @@ class Gui(tk.Tk):
 
         return self._help
 
+    @property
+    def worker(self):
+        """ worker property getter """
+
+        return self._worker
+
     @property
     def menu_bar(self):
         """ menu_bar property getter """
@@ -208,12 +218,16 @@ class Gui(tk.Tk):
         """
 
         self._set_window()
+        self._worker = Worker(self)
         self._set_pane_left()
         self._set_pane_right()
         self._set_menu()
         self._set_toolbar()
         self._load_plugins()
 
+        # jedi is warmed up in background when main loop is started
+        self.after_idle(AutoCompleter.get_instance)
+
         self.logger.info(self.trn.msg('htk_core_started'))
 
     def _set_window(self):
@@ -330,13 +344,18 @@ class Gui(tk.Tk):
         menu_edit.add_command(label=self.trn.msg('htk_gui_menu_edit_paste'), accelerator='Ctrl+V', command=self.editor.paste, state=tk.DISABLED)
         menu_edit.add_command(label=self.trn.msg('htk_gui_menu_edit_delete'), accelerator='Delete', command=self.editor.delete, state=tk.DISABLED)
         menu_edit.add_command(label=self.trn.msg('htk_gui_menu_edit_select_all'), accelerator='Ctrl+A', command=self.editor.select_all, state=tk.DISABLED)
+        menu_edit.add_command(label=self.trn.msg('htk_gui_menu_edit_reformat'), accelerator='Ctrl+Shift+F', command=self.editor.reformat, state=tk.DISABLED)
         menu_edit.add_separator()
         menu_edit.add_command(label=self.trn.msg('htk_gui_menu_edit_goto'), accelerator='Ctrl+G', command=self.editor.win_goto, state=tk.DISABLED)
         menu_edit.add_command(label=self.trn.msg('htk_gui_menu_edit_find'), accelerator='Ctrl+F', command=self.editor.win_find, state=tk.DISABLED)
         menu_edit.add_command(label=self.trn.msg('htk_gui_menu_edit_replace'), accelerator='Ctrl+R', command=self.editor.win_replace, state=tk.DISABLED)
+        menu_edit.add_separator()
+        menu_edit.add_command(label=self.trn.msg('htk_gui_menu_edit_goto_definition'), accelerator='F12', command=self.editor.goto_definition, state=tk.DISABLED)
+        menu_edit.add_command(label=self.trn.msg('htk_gui_menu_edit_find_usages'), accelerator='Shift+F12', command=self.editor.find_usages, state=tk.DISABLED)
 
         # shorcuts
         self.bind('<Control-a>', self.editor.select_all)
+        self.bind('<Control-F>', self.editor.reformat)
         self.bind('<Control-g>', self.editor.win_goto)
         self.bind('<Control-f>', self.editor.win_find)
         self.bind('<Control-r>', self.editor.win_replace)
@@ -575,6 +594,10 @@ class Gui(tk.Tk):
         res = tkmsg.askyesno(self.trn.msg('htk_gui_exit_title'), self.trn.msg('htk_gui_exit_question'))
         if (res):
             self.editor.save_tabs()
+            self.editor.saver.wait()
+            for tab in self.editor.nb.tab_refs:
+                tab.store_cache()
+            Colorizer.get_instance().save_cache()
             self.logger.info(self.trn.msg('htk_core_stopped'))
             self.logger.logfile.close()
             self.destroy()
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Gutter widget
+
+.. module:: client.core.gutter
+   :platform: Windows, Unix
+   :synopsis: Gutter widget
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+from hydratk.extensions.client.core.tkimport import tk
+
+class Gutter(tk.Canvas):
+    """Class Gutter
+
+    Line numbers and markers are drawn for visible lines only.
+    Marker callbacks are called in the same pass for each visible line.
+
+    """
+
+    # references
+    _text = None
+    _document = None
+
+    # gutter parameters
+    _show_numbers = True
+    _font = None
+    _digits = 0
+    _offset = 0
+    _padx = 3
+    _markers = None
+    _redraw_job = None
+
+    def __init__(self, parent, text, document, font, show_numbers=True):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           parent (obj): parent widget
+           text (obj): Text widget
+           document (obj): Document mirror of text
+           font (tuple): font
+           show_numbers (bool): show line numbers
+
+        """
+
+        tk.Canvas.__init__(self, parent, background='#FFFFFF', highlightthickness=0, takefocus=0)
+        self._text = text
+        self._document = document
+        self._font = font
+        self._show_numbers = show_numbers
+        self._markers = []
+
+        self.bind('<Configure>', self.schedule)
+        self._set_width(1)
+
+    @property
+    def text(self):
+        """ text property getter """
+
+        return self._text
+
+    @property
+    def document(self):
+        """ document property getter """
+
+        return self._document
+
+    @property
+    def show_numbers(self):
+        """ show_numbers property getter """
+
+        return self._show_numbers
+
+    @show_numbers.setter
+    def show_numbers(self, show_numbers):
+        """ show_numbers property setter """
+
+        self._show_numbers = show_numbers
+        self._digits = 0
+        self.schedule()
+
+    @property
+    def offset(self):
+        """ offset property getter """
+
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset):
+        """ offset property setter, added to displayed line numbers """
+
+        self._offset = offset
+        self.schedule()
+
+    def set_font(self, font):
+        """Method sets font
+
+        Args:
+            font (tuple): font
+
+        Returns:
+            void
+
+        """
+
+        self._font = font
+        self._digits = 0
+        self.schedule()
+
+    def add_marker(self, key, callback):
+        """Method adds marker
+
+        Callback draws marker on gutter for visible line, called with
+        gutter (obj), row (int), y coordinate (int), line height (int)
+
+        Args:
+            key (str): marker key
+            callback (callable): marker callback
+
+        Returns:
+            void
+
+        """
+
+        self.remove_marker(key)
+        self._markers.append((key, callback))
+        self.schedule()
+
+    def remove_marker(self, key):
+        """Method removes marker
+
+        Args:
+            key (str): marker key
+
+        Returns:
+            void
+
+        """
+
+        self._markers = [marker for marker in self._markers if (marker[0] != key)]
+        self.schedule()
+
+    def _set_width(self, digits):
+        """Method sets gutter width according to count of digits
+
+        Args:
+            digits (int): count of digits of last line number
+
+        Returns:
+            void
+
+        """
+
+        digits = max(digits, 3) if (self._show_numbers) else 0
+        if (digits != self._digits):
+            self._digits = digits
+            width = self.tk.call('font', 'measure', self._font, '0' * digits) if (digits > 0) else 0
+            self.configure(width=int(width) + 2 * self._padx)
+
+    def schedule(self, event=None):
+        """Method schedules redraw when idle
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        if (self._redraw_job is None):
+            self._redraw_job = self.after_idle(self.redraw)
+
+    def redraw(self, event=None):
+        """Method redraws visible lines
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        if (self._redraw_job is not None):
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+
+        self.delete(tk.ALL)
+        last = self._document.line_count
+        self._set_width(len(str(last + self._offset)))
+        if (not self._show_numbers and len(self._markers) == 0):
+            return
+
+        x = self.winfo_width() - self._padx
+        idx = self._text.index('@0,0')
+        while True:
+            dline = self._text.dlineinfo(idx)
+            if (dline is None):
+                break
+
+            row = int(idx.split('.')[0])
+            if (self._show_numbers):
+                self.create_text(x, dline[1], anchor=tk.NE, text=str(row + self._offset), font=self._font)
+            for key, callback in self._markers:
+                callback(self, row, dline[1], dline[3])
+
+            if (row >= last):
+                break
+            idx = '{0}.0'.format(row + 1)
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""Large file
+
+.. module:: client.core.largefile
+   :platform: Windows, Unix
+   :synopsis: Large file
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+from hydratk.extensions.client.core.tkimport import PYTHON_MAJOR_VERSION
+
+from array import array
+from bisect import bisect_right
+import mmap
+import re
+import threading
+
+class LargeFile(object):
+    """Class LargeFile
+
+    File is memory mapped, line start offsets are indexed in background thread.
+    Content is decoded only for requested lines.
+
+    """
+
+    _path = None
+    _file = None
+    _mmap = None
+    _size = 0
+    _offsets = None
+    _indexed = False
+    _closed = False
+    _thread = None
+    _chunk = 1048576
+    _overlap = 65536
+
+    def __init__(self, path, count=0):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           path (str): file path
+           count (int): count of lines indexed synchronously
+
+        """
+
+        self._path = path
+        self._file = open(path, 'rb')
+        self._offsets = self._make_offsets()
+        self._size = self._get_size()
+        if (self._size > 0):
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index(count)
+            self._thread = threading.Thread(target=self._index)
+            self._thread.daemon = True
+            self._thread.start()
+        else:
+            self._indexed = True
+
+    @property
+    def path(self):
+        """ path property getter """
+
+        return self._path
+
+    @property
+    def size(self):
+        """ size property getter """
+
+        return self._size
+
+    @property
+    def indexed(self):
+        """ indexed property getter, all lines were indexed """
+
+        return self._indexed
+
+    @property
+    def line_count(self):
+        """ line_count property getter, count of lines indexed so far """
+
+        return len(self._offsets)
+
+    @staticmethod
+    def _make_offsets():
+        """Method makes array of line offsets
+
+        Offsets need 64 bits, Python 2 array has no Q typecode and its
+        L typecode has 32 bits on Windows, list is used then
+
+        Args:
+            none
+
+        Returns:
+            obj: array or list
+
+        """
+
+        if (PYTHON_MAJOR_VERSION > 2):
+            return array('Q', [0])
+
+        return array('L', [0]) if (array('L').itemsize >= 8) else [0]
+
+    def _get_size(self):
+        """Method gets file size
+
+        Args:
+            none
+
+        Returns:
+            int
+
+        """
+
+        self._file.seek(0, 2)
+        return self._file.tell()
+
+    def _index(self, count=0):
+        """Method indexes line start offsets, thread target
+
+        Args:
+            count (int): count of lines to index, all lines if 0
+
+        Returns:
+            void
+
+        """
+
+        offsets, mm = self._offsets, self._mmap
+        limit = len(offsets) + count if (count > 0) else None
+        pos = offsets[-1]
+        while (not self._closed and (limit is None or len(offsets) < limit)):
+            chunk = mm[pos:pos + self._chunk]
+            if (len(chunk) == 0):
+                break
+            start = 0
+            while True:
+                start = chunk.find(b'\n', start) + 1
+                if (start == 0 or (limit is not None and len(offsets) >= limit)):
+                    break
+                offsets.append(pos + start)
+            pos = offsets[-1] if (limit is not None and len(offsets) >= limit) else pos + len(chunk)
+
+        if (limit is None and not self._closed):
+            # line start behind final newline is not a line
+            if (len(offsets) > 1 and offsets[-1] >= self._size):
+                offsets.pop()
+            self._indexed = True
+
+    def _decode(self, data):
+        """Method decodes line content
+
+        Args:
+            data (bytes): content
+
+        Returns:
+            str
+
+        """
+
+        return data.decode('utf-8', 'replace').rstrip('\r\n')
+
+    def get_lines(self, row1, row2):
+        """Method gets lines content
+
+        Args:
+            row1 (int): first row, starting from 1
+            row2 (int): last row
+
+        Returns:
+            list
+
+        """
+
+        lines = []
+        if (self._mmap is None):
+            return lines
+
+        for row in range(max(row1, 1), min(row2, self.line_count) + 1):
+            start = self._offsets[row - 1]
+            stop = self._offsets[row] if (row < len(self._offsets)) else self._size
+            lines.append(self._decode(self._mmap[start:stop]))
+
+        return lines
+
+    def get_offset(self, row, col=0):
+        """Method gets byte offset of position
+
+        Args:
+            row (int): row
+            col (int): column in characters
+
+        Returns:
+            int
+
+        """
+
+        row = min(max(row, 1), self.line_count)
+        offset = self._offsets[row - 1]
+        if (col > 0):
+            offset += len(self.get_lines(row, row)[0][:col].encode('utf-8'))
+
+        return offset
+
+    def get_position(self, offset):
+        """Method gets position of byte offset
+
+        Args:
+            offset (int): offset
+
+        Returns:
+            tuple: row (int), col (int) in characters
+
+        """
+
+        row = bisect_right(self._offsets, offset)
+        start = self._offsets[row - 1]
+
+        return row, len(self._decode(self._mmap[start:offset]))
+
+    @staticmethod
+    def compile(find_str, ignore_case=False, regexp=False):
+        """Method compiles pattern matched against file bytes
+
+        Plain string is found as is. Ignore case of plain string is applied also
+        to non-ASCII characters, regular expression is matched against bytes
+        so its ignore case and character classes apply to ASCII characters only.
+
+        Args:
+            find_str (str): string to find
+            ignore_case (bool): ignore case
+            regexp (bool): regular expression
+
+        Returns:
+            obj: bytes for plain string, compiled regular expression otherwise
+
+        Raises:
+            error: re.error
+
+        """
+
+        if (regexp):
+            return re.compile(find_str.encode('utf-8'), re.IGNORECASE if (ignore_case) else 0)
+        elif (not ignore_case):
+            return find_str.encode('utf-8')
+
+        pattern = []
+        for char in find_str:
+            variants = [re.escape(variant.encode('utf-8')) for variant in set([char, char.lower(), char.upper()])]
+            pattern.append(variants[0] if (len(variants) == 1) else b'(?:' + b'|'.join(variants) + b')')
+
+        return re.compile(b''.join(pattern), re.IGNORECASE)
+
+    def find(self, pattern, offset=0, stop=None, cancelled=None):
+        """Method finds pattern, executed in background thread
+
+        File is searched by chunks, overlapping chunks of regular expression are limited
+        so longer matches across chunk border are shortened or not found.
+
+        Args:
+            pattern (obj): compiled pattern
+            offset (int): start offset
+            stop (int): offset where match can start at most, file end if None
+            cancelled (callable): returns True if search was superseded
+
+        Returns:
+            tuple: start offset (int), stop offset (int), None if not found
+
+        """
+
+        if (self._mmap is None):
+            return None
+
+        plain = isinstance(pattern, bytes)
+        overlap = max(len(pattern) - 1, 0) if (plain) else self._overlap
+        stop = self._size if (stop is None) else min(stop, self._size)
+        while (offset < stop):
+            if (self._closed or (cancelled is not None and cancelled())):
+                return None
+
+            end = min(offset + self._chunk, stop)
+            if (plain):
+                start = self._mmap.find(pattern, offset, min(end + overlap, self._size))
+                if (start >= 0 and start < end):
+                    return start, start + len(pattern)
+            else:
+                match = pattern.search(self._mmap, offset, min(end + overlap, self._size))
+                if (match is not None and match.start() < end):
+                    return match.start(), match.end()
+            offset = end
+
+        return None
+
+    def rfind(self, pattern, offset=None, stop=0, cancelled=None):
+        """Method finds last occurrence of pattern before offset, executed in background thread
+
+        File is searched by chunks backwards, chunk borders are handled as in find.
+        Last of non overlapping regular expression matches in chunk is used.
+
+        Args:
+            pattern (obj): compiled pattern
+            offset (int): offset where match can start at most, file end if None
+            stop (int): start offset
+            cancelled (callable): returns True if search was superseded
+
+        Returns:
+            tuple: start offset (int), stop offset (int), None if not found
+
+        """
+
+        if (self._mmap is None):
+            return None
+
+        plain = isinstance(pattern, bytes)
+        overlap = max(len(pattern) - 1, 0) if (plain) else self._overlap
+        offset = self._size if (offset is None) else min(offset, self._size)
+        while (offset > stop):
+            if (self._closed or (cancelled is not None and cancelled())):
+                return None
+
+            start = max(offset - self._chunk, stop)
+            if (plain):
+                pos = self._mmap.rfind(pattern, start, min(offset + overlap, self._size))
+                if (pos >= 0 and pos < offset):
+                    return pos, pos + len(pattern)
+            else:
+                res = None
+                for match in pattern.finditer(self._mmap, start, min(offset + overlap, self._size)):
+                    if (match.start() >= offset):
+                        break
+                    res = match.start(), match.end()
+                if (res is not None):
+                    return res
+            offset = start
+
+        return None
+
+    def close(self):
+        """Method closes file
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._closed = True
+        if (self._thread is not None):
+            self._thread.join()
+        if (self._mmap is not None):
+            try:
+                self._mmap.close()
+            except BufferError:
+                # running search holds buffer, map is released with it
+                pass
+        self._file.close()
@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+"""LargeFileTab
+
+.. module:: client.core.largefiletab
+   :platform: Windows, Unix
+   :synopsis: LargeFileTab
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+from hydratk.extensions.client.core.tkimport import tk
+from hydratk.extensions.client.core.filetab import FileTab
+from hydratk.extensions.client.core.largefile import LargeFile
+
+import re
+
+class LargeFileTab(FileTab):
+    """Class LargeFileTab
+
+    Read-only tab for large file. Text widget holds window of lines around view,
+    window is moved when view approaches its edge. Scrollbar and line numbers
+    are relative to whole file. Text is not colorized and not parsed as test.
+
+    """
+
+    _read_only = True
+
+    # large file
+    _file = None
+    _window = 5000
+    _shift_job = None
+    _index_job = None
+    _search = 0
+    _last_query = None
+
+    def __init__(self, nb, name, path):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           nb (obj): notebook reference
+           name (str): file name
+           path (str): file path
+
+        """
+
+        self._window = nb.editor.large_file['window']
+        self._file = LargeFile(path, self._window)
+        FileTab.__init__(self, nb, name, path)
+
+        self._lexer = None
+        self._text.configure(undo=False)
+        self._load_window(1)
+        self._text.mark_set(tk.INSERT, '1.0')
+        self.update_info_bar()
+        self._poll_index()
+
+    @property
+    def file(self):
+        """ file property getter """
+
+        return self._file
+
+    @FileTab.path.setter
+    def path(self, path):
+        """ path property setter, lexer is not used """
+
+        self._path = path
+
+    def _load_window(self, row):
+        """Method loads window of lines around row
+
+        Args:
+            row (int): row in file
+
+        Returns:
+            void
+
+        """
+
+        start = max(1, min(row - self._window // 2, self._file.line_count - self._window + 1))
+        self._row_offset = start - 1
+        self._text.configure(state=tk.NORMAL)
+        self._text.delete('1.0', tk.END)
+        self._text.insert('1.0', '\n'.join(self._file.get_lines(start, start + self._window - 1)))
+        self._text.configure(state=tk.DISABLED)
+        self._text.edit_modified(False)
+        self._gutter.offset = self._row_offset
+
+    def _to_window(self, row):
+        """Method converts row in file to row in window
+
+        Window is loaded around row if needed
+
+        Args:
+            row (int): row in file
+
+        Returns:
+            int
+
+        """
+
+        if (row <= self._row_offset or row > self._row_offset + self._document.line_count):
+            self._load_window(row)
+
+        return row - self._row_offset
+
+    def _shift_window(self):
+        """Method moves window around view, cursor keeps its position in file
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._shift_job = None
+        top = self._row_offset + int(self._text.index('@0,0').split('.')[0])
+        row, col = self._text.index(tk.INSERT).split('.')
+        cursor = self._row_offset + int(row)
+
+        self._load_window(top)
+        self._text.yview('{0}.0'.format(top - self._row_offset))
+        row = cursor - self._row_offset
+        if (row < 1 or row > self._document.line_count):
+            row, col = top - self._row_offset, 0
+        self._text.mark_set(tk.INSERT, '{0}.{1}'.format(row, col))
+        self._mark_view()
+
+    def _poll_index(self):
+        """Method updates scrollbar until file is indexed
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._index_job = self.after(500, self._poll_index) if (not self._file.indexed) else None
+        self._on_text_scroll()
+
+    def _on_vsb(self, *args):
+        """Method handles scrollbar event
+
+        Scrollbar position is relative to whole file
+
+        Args:
+            args (list): arguments
+
+        Returns:
+            void
+
+        """
+
+        if (args[0] == 'moveto'):
+            row = int(float(args[1]) * self._file.line_count) + 1
+            self._text.yview('{0}.0'.format(self._to_window(min(row, self._file.line_count))))
+        else:
+            self._text.yview(*args)
+
+    def _on_text_scroll(self, *args):
+        """Method handles text scroll event
+
+        Window is moved when idle if view approaches its edge
+
+        Args:
+            args (list): arguments
+
+        Returns:
+            void
+
+        """
+
+        self._gutter.schedule()
+        count, rows = self._file.line_count, self._document.line_count
+        top = int(self._text.index('@0,0').split('.')[0])
+        bottom = int(self._text.index('@0,{0}'.format(self._text.winfo_height())).split('.')[0])
+        self._vbar.set(float(self._row_offset + top - 1) / count, min(float(self._row_offset + bottom) / count, 1.0))
+
+        margin = self._window // 4
+        if (self._shift_job is None and ((top <= margin and self._row_offset > 0) or
+                                         (bottom > rows - margin and self._row_offset + rows < count))):
+            self._shift_job = self.after_idle(self._shift_window)
+
+    def goto(self, line):
+        """Method goes to given line
+
+        Args:
+            line (int): line number in file
+
+        Returns:
+            void
+
+        """
+
+        FileTab.goto(self, self._to_window(min(max(int(line), 1), self._file.line_count)))
+
+    def find(self, event=None, find_str=None, find_all=False, ignore_case=False, regexp=False):
+        """Method finds given string and highlights it
+
+        Memory mapped file is searched in background thread, only first occurrence
+        is highlighted also for find_all which searches from file begin.
+        Last query with its options is used for event, search wraps around file end.
+
+        Args:
+            event (obj): event
+            find_str (str): string to find
+            find_all (bool): find from file begin, otherwise from cursor
+            ignore_case (bool): ignore case
+            regexp (bool): regular expression
+
+        Returns:
+            void
+
+        """
+
+        if (event != None):
+            if (self._last_query is None):
+                return
+            find_str, ignore_case, regexp = self._last_query
+
+        self._search_file((find_str, ignore_case, regexp), 0 if (find_all) else self._get_cursor_offset(1), event != None)
+
+    def find_previous(self, event=None):
+        """Method finds previous occurrence of last query and highlights it
+
+        Search wraps around file begin
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        if (self._last_query is not None):
+            self._search_file(self._last_query, self._get_cursor_offset(), True, True)
+
+    def _get_cursor_offset(self, shift=0):
+        """Method gets byte offset of cursor
+
+        Args:
+            shift (int): shift in characters
+
+        Returns:
+            int
+
+        """
+
+        row, col = self._text.index(tk.INSERT).split('.')
+
+        return self._file.get_offset(int(row) + self._row_offset, int(col) + shift)
+
+    def _search_file(self, query, offset, wrap=False, previous=False):
+        """Method starts search of file
+
+        New search supersedes running one
+
+        Args:
+            query (tuple): string to find (str), ignore case (bool), regular expression (bool)
+            offset (int): start offset
+            wrap (bool): search around file end or begin if not found
+            previous (bool): search backwards
+
+        Returns:
+            void
+
+        """
+
+        if (not self._file.indexed):
+            self.editor.logger.info(self.editor.trn.msg('htk_core_file_indexing', self.path))
+            return
+
+        self._text.tag_remove('match', 1.0, tk.END)
+        try:
+            pattern = self._file.compile(*query)
+        except re.error as ex:
+            self.editor.logger.error(ex)
+            return
+
+        self._search += 1
+        search = self._search
+        cancelled = lambda: search != self._search
+        self.editor.root.worker.submit(self._find_file, (self._file, pattern, offset, wrap, previous, cancelled),
+                                       lambda result: self._on_find(search, query, result), key=(str(self), 'find'))
+
+    @staticmethod
+    def _find_file(file, pattern, offset, wrap, previous, cancelled):
+        """Method finds pattern in file, executed in background thread
+
+        Args:
+            file (obj): LargeFile
+            pattern (obj): compiled pattern
+            offset (int): start offset
+            wrap (bool): search around file end or begin if not found
+            previous (bool): search backwards
+            cancelled (callable): returns True if search was superseded
+
+        Returns:
+            tuple: start offset (int), stop offset (int), None if not found
+
+        """
+
+        if (previous):
+            res = file.rfind(pattern, offset, cancelled=cancelled)
+            if (res is None and wrap):
+                res = file.rfind(pattern, None, offset, cancelled)
+        else:
+            res = file.find(pattern, offset, cancelled=cancelled)
+            if (res is None and wrap and offset > 0):
+                res = file.find(pattern, 0, offset, cancelled)
+
+        return res
+
+    def _on_find(self, search, query, res):
+        """Method highlights found occurrence
+
+        Match end is limited to window
+
+        Args:
+            search (int): search id
+            query (tuple): string to find (str), ignore case (bool), regular expression (bool)
+            res (tuple): start offset (int), stop offset (int), None if not found
+
+        Returns:
+            void
+
+        """
+
+        if (search != self._search or res is None):
+            return
+
+        row1, col1 = self._file.get_position(res[0])
+        row2, col2 = self._file.get_position(res[1])
+        idx1 = '{0}.{1}'.format(self._to_window(row1), col1)
+        row2 -= self._row_offset
+        idx2 = '{0}.{1}'.format(row2, col2) if (row2 <= self._document.line_count) else tk.END
+        self._text.tag_add('match', idx1, idx2)
+        self._text.tag_config('match', foreground='#FF0000', background='#FFFF00')
+        self._last_find_str, self._last_query = query[0], query
+        self._text.mark_set(tk.INSERT, idx1)
+        self._text.see(tk.INSERT)
+        self._mark_view()
+
+    def _incremental_find(self):
+        """Method searches query of find bar
+
+        First occurrence in file is highlighted
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        query = self._find_var.get()
+        if (len(query) > 0):
+            self.find(find_str=query, find_all=True, ignore_case=self._find_ignore_case.get(), regexp=self._find_regexp.get())
+        else:
+            self._clear_match()
+
+    def _find_step(self, previous=False):
+        """Method moves to next or previous occurrence of find bar query
+
+        Args:
+            previous (bool): previous occurrence, otherwise next one
+
+        Returns:
+            str: break
+
+        """
+
+        self._scheduler.flush('find')
+        query = self._find_var.get()
+        if (len(query) > 0):
+            query = (query, self._find_ignore_case.get(), self._find_regexp.get())
+            self._search_file(query, self._get_cursor_offset(0 if (previous) else 1), True, previous)
+
+        return 'break'
+
+    def replace(self, find_str, replace_str, replace_all, ignore_case, regexp):
+        """Method finds given string and replaces it, not supported for read-only tab
+
+        Args:
+            find_str (str): string to find
+            replace_str (str): string to replace
+            replace_all (bool): replace all occurrences, otherwise only next one
+            ignore_case (bool): ignore case
+            regexp (bool): regular expression
+
+        Returns:
+            void
+
+        """
+
+        self.editor.logger.info(self.editor.trn.msg('htk_core_file_read_only', self.path))
+
+    def reformat(self):
+        """Method reformats text, not supported for read-only tab
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self.editor.logger.info(self.editor.trn.msg('htk_core_file_read_only', self.path))
+
+    def _format_text(self, event=None):
+        """Method formats text, not supported for read-only tab
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        pass
+
+    def _show_autocomplete(self, event=None):
+        """Method shows code autocomplete, not supported for read-only tab
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        pass
+
+    def close(self):
+        """Method releases tab resources before tab is closed
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        FileTab.close(self)
+        self._search += 1
+        self.editor.root.worker.cancel((str(self), 'find'))
+        for job in [self._shift_job, self._index_job]:
+            if (job is not None):
+                self.after_cancel(job)
+        self._shift_job = self._index_job = None
+        self._file.close()
@@ -0,0 +1,620 @@
+# -*- coding: utf-8 -*-
+"""Language lexers
+
+.. module:: client.core.lexer
+   :platform: Windows, Unix
+   :synopsis: Language lexers
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+from hydratk.extensions.client.core.tkimport import PYTHON_MAJOR_VERSION
+
+import keyword
+import re
+
+if (PYTHON_MAJOR_VERSION == 2):
+    import __builtin__ as builtins
+else:
+    import builtins
+
+class Lexer(object):
+    """Class Lexer
+
+    Base class for language lexers, lexes plain text without spans.
+    Text is lexed line by line, state passed between lines must be comparable and hashable.
+    Patterns are compiled once per lexer instance which is shared by all tabs.
+
+    """
+
+    _lexer_id = 'Undefined'
+    _tags = []
+    _colors = {}
+    _default_state = None
+
+    @property
+    def lexer_id(self):
+        """ lexer_id property getter """
+
+        return self._lexer_id
+
+    @property
+    def tags(self):
+        """ tags property getter """
+
+        return self._tags
+
+    @property
+    def colors(self):
+        """ colors property getter, colors of tags not configured in Core """
+
+        return self._colors
+
+    @property
+    def default_state(self):
+        """ default_state property getter """
+
+        return self._default_state
+
+    def lex_line(self, line, state):
+        """Method lexes one line
+
+        Args:
+            line (str): line content
+            state (obj): lexer state at line start
+
+        Returns:
+            tuple: spans (list of tag, start column, stop column), state at line end (obj), yoda tag found (bool)
+
+        """
+
+        return [], state, False
+
+    def in_string(self, state):
+        """Method checks if lexer state is inside multi-line string
+
+        Args:
+            state (obj): lexer state
+
+        Returns:
+            bool
+
+        """
+
+        return False
+
+    def get_indent(self, line, spans, state1, state2, indent):
+        """Method gets indent of line following given line
+
+        Args:
+            line (str): line content
+            spans (list): spans of line
+            state1 (obj): lexer state at line start
+            state2 (obj): lexer state at line end
+            indent (dict): indent sizes, key python|yoda
+
+        Returns:
+            int
+
+        """
+
+        return len(line) - len(line.lstrip())
+
+    def mask(self, line, spans):
+        """Method masks strings and comments in line
+
+        Args:
+            line (str): line content
+            spans (list): spans of line
+
+        Returns:
+            str: code without trailing comment and whitespace
+
+        """
+
+        code = list(line)
+        for tag, col1, col2 in spans:
+            if (tag == 'string'):
+                code[col1:col2] = (' ' if (line[col1] == '#') else '_') * (col2 - col1)
+
+        return ''.join(code).rstrip()
+
+    def _get_yaml_indent(self, line, spans, size):
+        """Method gets indent of YAML line following given line
+
+        Args:
+            line (str): line content
+            spans (list): spans of line
+            size (int): indent size
+
+        Returns:
+            int
+
+        """
+
+        content = line.lstrip()
+        indent = len(line) - len(content)
+
+        code = self.mask(line, spans)
+
+        # list item content is aligned behind dash
+        if (content.startswith('- ')):
+            indent += len(content) - len(content[1:].lstrip())
+
+        if (code.endswith(':') or self._block_re.match(line)):
+            indent += size
+
+        return indent
+
+class PythonLexer(Lexer):
+    """Class PythonLexer
+
+    Lexer state holds open triple-quoted string, bracket depth and
+    start of statement continued in brackets or string (indent, statement ends block)
+
+    """
+
+    _lexer_id = 'python'
+    _tags = ['keyword', 'string']
+    _default_state = (None, 0, None)
+
+    def __init__(self):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           none
+
+        """
+
+        self._make_patterns()
+
+    def _make_patterns(self):
+        """Method makes patterns
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        # keyword
+        builtin = [str(name) for name in dir(builtins) if not name.startswith('_')]
+        kw = r'\b(' + '|'.join(keyword.kwlist + builtin) + r')\b'
+
+        # string
+        stringprefix = r'(?:\b[rRuUbB]{1,2})?'
+        sqstring = stringprefix + r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'?"
+        dqstring = stringprefix + r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"?'
+        string3 = stringprefix + r"(?:'''|\"\"\")"
+
+        self._token_re = re.compile(r'(?P<comment>#.*)|(?P<string3>' + string3 + r')|(?P<string>' +
+                                    sqstring + '|' + dqstring + r')|(?P<keyword>' + kw + r')|(?P<open>[(\[{])|(?P<close>[)\]}])')
+        self._string3_end = {
+                             "'''" : re.compile(r"(?:\\.|[^\\])*?'''"),
+                             '"""' : re.compile(r'(?:\\.|[^\\])*?"""')
+                            }
+
+        # statements ending block
+        self._dedent_re = re.compile(r'\s*(return|break|continue|pass|raise)\b')
+
+    def _lex_python(self, line, pos, state, spans):
+        """Method lexes Python code
+
+        Args:
+            line (str): line content
+            pos (int): start column
+            state (tuple): open triple-quoted string quote (str), bracket depth (int), statement (tuple)
+            spans (list): spans, updated
+
+        Returns:
+            tuple: state at line end
+
+        """
+
+        quote, depth, stmt = state
+        continued = quote is not None or depth > 0
+        if (quote is not None):
+            match = self._string3_end[quote].match(line, pos)
+            if (match is None):
+                spans.append(('string', pos, len(line)))
+                return state
+            spans.append(('string', pos, match.end()))
+            pos, quote = match.end(), None
+
+        if (not continued or stmt is None):
+            content = line[pos:].lstrip()
+            stmt = (len(line) - len(content), self._dedent_re.match(content) is not None)
+
+        while True:
+            match = self._token_re.search(line, pos)
+            if (match is None):
+                break
+
+            kind = match.lastgroup
+            if (kind == 'string3'):
+                end = self._string3_end[match.group(kind)[-3:]].match(line, match.end())
+                if (end is None):
+                    spans.append(('string', match.start(), len(line)))
+                    quote = match.group(kind)[-3:]
+                    break
+                spans.append(('string', match.start(), end.end()))
+                pos = end.end()
+            elif (kind == 'open'):
+                depth += 1
+                pos = match.end()
+            elif (kind == 'close'):
+                depth = max(depth - 1, 0)
+                pos = match.end()
+            else:
+                spans.append(('string' if (kind == 'comment') else kind, match.start(), match.end()))
+                pos = match.end()
+
+        return quote, depth, stmt if (depth > 0 or quote is not None) else None
+
+    def _get_python_indent(self, line, spans, state1, state2, size):
+        """Method gets indent of Python line following given line
+
+        Args:
+            line (str): line content
+            spans (list): spans of line
+            state1 (tuple): Python state at line start
+            state2 (tuple): Python state at line end
+            size (int): indent size
+
+        Returns:
+            int
+
+        """
+
+        indent = len(line) - len(line.lstrip())
+        if (state2[0] is not None):
+            return indent
+
+        code = self.mask(line, spans)
+
+        # statement continues in brackets, align behind last open bracket
+        if (state2[1] > 0):
+            depth = 0
+            for col in range(len(code) - 1, -1, -1):
+                if (code[col] in ')]}'):
+                    depth += 1
+                elif (code[col] in '([{'):
+                    if (depth == 0):
+                        if (col + 1 < len(code)):
+                            return col + 1 + len(code[col + 1:]) - len(code[col + 1:].lstrip())
+                        return (state2[2][0] if (state1[1] == 0) else indent) + size
+                    depth -= 1
+            return indent
+
+        # statement ends, use indent of its first line
+        continued = state1[0] is not None or state1[1] > 0
+        stmt = state1[2] if (continued and state1[2] is not None) else (indent, self._dedent_re.match(code) is not None)
+        if (code.endswith(':')):
+            return stmt[0] + size
+        elif (stmt[1]):
+            return max(stmt[0] - size, 0)
+
+        return stmt[0]
+
+    def lex_line(self, line, state):
+        """Method lexes one line
+
+        Args:
+            line (str): line content
+            state (tuple): open string quote (str), bracket depth (int), statement (tuple)
+
+        Returns:
+            tuple: spans (list), state at line end (tuple), yoda tag found (bool)
+
+        """
+
+        spans = []
+        state = self._lex_python(line, 0, state, spans)
+
+        return spans, state, False
+
+    def in_string(self, state):
+        """Method checks if lexer state is inside triple-quoted string
+
+        Args:
+            state (tuple): lexer state
+
+        Returns:
+            bool
+
+        """
+
+        return state[0] is not None
+
+    def get_indent(self, line, spans, state1, state2, indent):
+        """Method gets indent of line following given line
+
+        Args:
+            line (str): line content
+            spans (list): spans of line
+            state1 (tuple): lexer state at line start
+            state2 (tuple): lexer state at line end
+            indent (dict): indent sizes, key python|yoda
+
+        Returns:
+            int
+
+        """
+
+        return self._get_python_indent(line, spans, state1, state2, indent['python'])
+
+class YodaLexer(PythonLexer):
+    """Class YodaLexer
+
+    YAML test with Python code in block scalars
+
+    """
+
+    _lexer_id = 'yoda'
+    _tags = ['keyword', 'yoda', 'string']
+    _default_state = (-1, None, 0, None)
+
+    def _make_patterns(self):
+        """Method makes patterns
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        PythonLexer._make_patterns(self)
+
+        tags = [
+                'TEST-SCENARIO-\d+', 'TEST-CASE-\d+', 'TEST-CONDITION-\d+',
+                'ID', 'PATH', 'NAME', 'DESC', 'AUTHOR', 'VERSION',
+                'PRE-REQ', 'POST-REQ', 'TEST', 'VALIDATE', 'EVENTS', 'BEFORE_START', 'AFTER_FINISH'
+               ]
+        self._yoda_re = re.compile(r'\s*(\b(?:' + '|'.join(tags) + r')\b\s*:\s*\|?)', re.IGNORECASE)
+        self._block_re = re.compile(r'\s*[^\s#].*:\s*[|>][-+0-9]*\s*(#.*)?$')
+
+    def lex_line(self, line, state):
+        """Method lexes one line
+
+        Args:
+            line (str): line content
+            state (tuple): block scalar indent (int), Python state
+
+        Returns:
+            tuple: spans (list), state at line end (tuple), yoda tag found (bool)
+
+        """
+
+        block, pystate = state[0], state[1:]
+        spans, pos, yoda_found = [], 0, False
+        content = line.lstrip()
+        indent = len(line) - len(content)
+
+        # YAML block scalar ends at first non empty line with lower indentation
+        if (block >= 0 and len(content) > 0 and indent <= block):
+            block, pystate = -1, self._default_state[1:]
+
+        if (block < 0):
+            # brackets are not carried between YAML lines
+            pystate = (pystate[0], 0, None)
+            if (pystate[0] is None):
+                match = self._yoda_re.match(line)
+                if (match is not None):
+                    spans.append(('yoda', match.start(1), match.end(1)))
+                    pos, yoda_found = match.end(1), True
+                if (self._block_re.match(line)):
+                    block = indent
+
+        pystate = self._lex_python(line, pos, pystate, spans)
+        if (block == indent and len(content) > 0):
+            pystate = (pystate[0], 0, None)
+
+        return spans, (block,) + pystate, yoda_found
+
+    def in_string(self, state):
+        """Method checks if lexer state is inside triple-quoted string
+
+        Args:
+            state (tuple): lexer state
+
+        Returns:
+            bool
+
+        """
+
+        return state[1] is not None
+
+    def get_indent(self, line, spans, state1, state2, indent):
+        """Method gets indent of line following given line
+
+        Python indent is used within block scalar, YAML indent otherwise.
+        Python indent is not lower than block scalar content indent.
+
+        Args:
+            line (str): line content
+            spans (list): spans of line
+            state1 (tuple): lexer state at line start
+            state2 (tuple): lexer state at line end
+            indent (dict): indent sizes, key python|yoda
+
+        Returns:
+            int
+
+        """
+
+        content = line.lstrip()
+        block = state2[0]
+        if (block >= 0 and (len(content) == 0 or len(line) - len(content) > block)):
+            return max(self._get_python_indent(line, spans, state1[1:], state2[1:], indent['python']), block + indent['yoda'])
+
+        return self._get_yaml_indent(line, spans, indent['yoda'])
+
+    def get_block(self, document, row):
+        """Method gets block scalar with Python code containing row
+
+        Header is nearest previous line ending with block indicator which
+        has lower indentation than all lines up to row. Block ends before
+        first non empty line with header indentation.
+
+        Args:
+            document (obj): Document
+            row (int): row
+
+        Returns:
+            tuple: first row (int), last row (int), None if row is not in block
+
+        """
+
+        line = document.get_line(row)
+        content = line.lstrip()
+        min_indent = len(line) - len(content) if (len(content) > 0) else None
+        header = None
+        for r in range(row - 1, 0, -1):
+            line = document.get_line(r)
+            content = line.lstrip()
+            indent = len(line) - len(content)
+            if (len(content) == 0 or (min_indent is not None and indent >= min_indent)):
+                continue
+            elif (self._block_re.match(line)):
+                header = r
+                break
+            elif (indent == 0):
+                return None
+            min_indent = indent
+
+        if (header is None):
+            return None
+
+        block, last = indent, document.line_count
+        for r in range(row + 1, document.line_count + 1):
+            line = document.get_line(r)
+            content = line.lstrip()
+            if (len(content) > 0 and len(line) - len(content) <= block):
+                last = r - 1
+                break
+
+        return header + 1, last
+
+class YamlLexer(Lexer):
+    """Class YamlLexer
+    """
+
+    _lexer_id = 'yaml'
+    _tags = ['keyword', 'string']
+    _default_state = (-1,)
+
+    def __init__(self):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           none
+
+        """
+
+        self._key_re = re.compile(r'\s*(?:-\s+)*((?:[^\s#:\'"][^#:]*?|"[^"]*"|\'[^\']*\')\s*:)(?=\s|$)')
+        self._token_re = re.compile(r'(?:^|(?<=\s))#.*|"[^"\\]*(?:\\.[^"\\]*)*"?|\'[^\']*(?:\'\'[^\']*)*\'?')
+        self._block_re = re.compile(r'.*:\s*[|>][-+0-9]*\s*(#.*)?$')
+
+    def lex_line(self, line, state):
+        """Method lexes one line
+
+        Args:
+            line (str): line content
+            state (tuple): block scalar indent (int)
+
+        Returns:
+            tuple: spans (list), state at line end (tuple), yoda tag found (bool)
+
+        """
+
+        block = state[0]
+        spans, pos = [], 0
+        content = line.lstrip()
+        indent = len(line) - len(content)
+
+        if (block >= 0):
+            if (len(content) == 0 or indent > block):
+                if (len(content) > 0):
+                    spans.append(('string', indent, len(line)))
+                return spans, (block,), False
+            block = -1
+
+        match = self._key_re.match(line)
+        if (match is not None):
+            spans.append(('keyword', match.start(1), match.end(1)))
+            pos = match.end(1)
+            if (self._block_re.match(line, match.start(1))):
+                block = indent
+
+        for match in self._token_re.finditer(line, pos):
+            spans.append(('string', match.start(), match.end()))
+
+        return spans, (block,), False
+
+    def get_indent(self, line, spans, state1, state2, indent):
+        """Method gets indent of line following given line
+
+        Args:
+            line (str): line content
+            spans (list): spans of line
+            state1 (tuple): lexer state at line start
+            state2 (tuple): lexer state at line end
+            indent (dict): indent sizes, key python|yoda
+
+        Returns:
+            int
+
+        """
+
+        content = line.lstrip()
+        if (state2[0] >= 0 and (len(content) == 0 or len(line) - len(content) > state2[0])):
+            return len(line) - len(content)
+
+        return self._get_yaml_indent(line, spans, indent['yoda'])
+
+class LogLexer(Lexer):
+    """Class LogLexer
+    """
+
+    _lexer_id = 'log'
+    _tags = ['keyword', 'yoda', 'string']
+    _default_state = (None,)
+
+    def __init__(self):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           none
+
+        """
+
+        self._token_re = re.compile(r'(?P<string>^\d{4}-\d\d-\d\d[ T][\d:.,]+)|(?P<yoda>\b(?:ERROR|CRITICAL|FATAL|WARN|WARNING)\b)|' +
+                                    r'(?P<keyword>\b(?:INFO|DEBUG)\b)')
+
+    def lex_line(self, line, state):
+        """Method lexes one line
+
+        Args:
+            line (str): line content
+            state (tuple): no state
+
+        Returns:
+            tuple: spans (list), state at line end (tuple), yoda tag found (bool)
+
+        """
+
+        spans = []
+        for match in self._token_re.finditer(line):
+            spans.append((match.lastgroup, match.start(), match.end()))
+
+        return spans, state, False
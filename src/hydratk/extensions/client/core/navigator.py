@@ -0,0 +1,556 @@
+# -*- coding: utf-8 -*-
+"""Code navigation
+
+.. module:: client.core.navigator
+   :platform: Windows, Unix
+   :synopsis: Code navigation
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+import os
+import re
+from jedi import Script
+
+from hydratk.extensions.client.core.tkimport import tk, ttk
+from hydratk.extensions.client.core.worker import Worker
+from hydratk.extensions.client.core.autocompleter import AutoCompleter
+from hydratk.extensions.client.core.symbolindex import SymbolIndex
+from hydratk.extensions.client.core.utils import fix_path
+
+class Navigator(object):
+    """Class Navigator
+
+    Definition is searched by jedi in single completion worker thread because jedi
+    is not thread safe, symbol index is used when jedi does not resolve the name.
+    Usages are searched as text in project roots by worker threads, files are
+    processed in batches and results are streamed to usages window.
+
+    """
+
+    _instance = None
+    _instance_created = False
+
+    # references
+    _root = None
+    _config = None
+    _worker = None
+
+    # navigation
+    _key = ('navigator', 'definition')
+    _word_re = re.compile(r'[\w.]*\w', re.UNICODE)
+    _extensions = ['py', 'jedi', 'padawan']
+    _threads = 4
+    _batch = 20
+
+    # usages search
+    _search = 0
+    _pending = 0
+    _results = None
+
+    # gui elements
+    _win = None
+    _tree = None
+    _label = None
+
+    def __init__(self):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           none
+
+        Raises:
+           error: ValueError
+
+        """
+
+        if (self._instance_created == False):
+            raise ValueError('For creating class instance please use the get_instance method instead!')
+        if (self._instance is not None):
+            raise ValueError('A Class instance already exists, use get_instance method instead!')
+
+        from hydratk.extensions.client.core.gui import Gui
+        self._root = Gui.get_instance()
+        self._config = self.root.cfg
+        self._worker = Worker(self.root, self._threads)
+        self._results = []
+
+    @staticmethod
+    def get_instance():
+        """Method gets Navigator singleton instance
+
+        Args:
+            none
+
+        Returns:
+            obj
+
+        """
+
+        if (Navigator._instance is None):
+            Navigator._instance_created = True
+            Navigator._instance = Navigator()
+
+        return Navigator._instance
+
+    @property
+    def root(self):
+        """ root property getter """
+
+        return self._root
+
+    @property
+    def config(self):
+        """ config property getter """
+
+        return self._config
+
+    @property
+    def trn(self):
+        """ trn property getter """
+
+        return self.root.trn
+
+    @property
+    def editor(self):
+        """ editor property getter """
+
+        return self.root.editor
+
+    @property
+    def worker(self):
+        """ worker property getter """
+
+        return self._worker
+
+    def _is_supported(self, tab):
+        """Method checks if navigation is supported for tab
+
+        Args:
+            tab (obj): tab reference
+
+        Returns:
+            bool
+
+        """
+
+        return tab is not None and not tab.read_only and tab.path is not None and tab.path.split('.')[-1] in self._extensions
+
+    def _get_word(self, tab, row, col):
+        """Method gets dotted identifier at position
+
+        Args:
+            tab (obj): tab reference
+            row (int): row
+            col (int): column
+
+        Returns:
+            str: identifier qualified by preceding names, None if there is no identifier
+
+        """
+
+        for match in self._word_re.finditer(tab.document.get_line(row)):
+            if (match.start() <= col <= match.end()):
+                end = match.group(0).find('.', col - match.start())
+                word = (match.group(0) if (end < 0) else match.group(0)[:end]).strip('.')
+                return word if (len(word) > 0 and not word[0].isdigit()) else None
+
+        return None
+
+    def _get_roots(self):
+        """Method gets directories of projects and their Python path
+
+        Args:
+            none
+
+        Returns:
+            list
+
+        """
+
+        roots = []
+        if (self.config.data['Projects'] != None):
+            for project in self.config.data['Projects'].values():
+                for path in [project['path']] + project['pythonpath']:
+                    if (path not in roots and os.path.isdir(path)):
+                        roots.append(path)
+
+        return roots
+
+    def goto_definition(self, tab):
+        """Method goes to definition of name at cursor
+
+        Definition is searched in background
+
+        Args:
+            tab (obj): tab reference
+
+        Returns:
+            void
+
+        """
+
+        if (not self._is_supported(tab)):
+            return
+
+        row, col = [int(i) for i in tab.text.index(tk.INSERT).split('.')]
+        word = self._get_word(tab, row, col)
+        if (word is None):
+            return
+
+        autocompleter = AutoCompleter.get_instance()
+        source = autocompleter.get_source(tab, row, col)
+        if (source is None):
+            self._on_definitions(tab, row, word, [])
+        else:
+            autocompleter.worker.submit(self._get_definitions, source, lambda result: self._on_definitions(tab, row, word, result),
+                               key=self._key, errback=lambda error: self._on_definitions(tab, row, word, []))
+
+    @staticmethod
+    def _get_definitions(content, row, col):
+        """Method gets definitions, executed in jedi worker thread
+
+        Args:
+            content (str): text content
+            row (int): row
+            col (int): column
+
+        Returns:
+            list: module path (str), row (int), column (int), module path is None for definition in content
+
+        """
+
+        try:
+            script = Script(content, row, col)
+            definitions = script.goto_assignments(follow_imports=True)
+            if (len([d for d in definitions if (d.line is not None)]) == 0):
+                definitions = script.goto_definitions()
+        except ValueError:
+            return []
+
+        return [(d.module_path, d.line, d.column) for d in definitions if (d.line is not None)]
+
+    def _get_index_definitions(self, word):
+        """Method gets definitions from symbol index
+
+        Args:
+            word (str): dotted identifier
+
+        Returns:
+            list: module path (str), row (int), column (int)
+
+        """
+
+        index = SymbolIndex.get_instance()
+        module, name = word.rpartition('.')[::2]
+        symbols = [symbol for symbol in index.get_module_symbols(module) if (symbol[0] == name)] if (len(module) > 0) else []
+        if (len(symbols) == 0):
+            symbols = index.get_symbols(name)
+        if (len(symbols) == 0 and len(module) > 0):
+            symbols = index.get_symbols('{0}.{1}'.format(module.split('.')[-1], name))
+
+        return [(symbol[3], symbol[4], 0) for symbol in symbols]
+
+    def _on_definitions(self, tab, row, word, definitions):
+        """Method goes to found definition
+
+        Definitions from jedi are mapped to tab, symbol index is used
+        if jedi did not find any. Multiple definitions are listed in window.
+
+        Args:
+            tab (obj): tab reference
+            row (int): row of name
+            word (str): dotted identifier
+            definitions (list): definitions found by jedi
+
+        Returns:
+            void
+
+        """
+
+        found = []
+        for path, line, col in definitions:
+            if (path is None):
+                if (not tab.winfo_exists()):
+                    continue
+                position = AutoCompleter.get_instance().get_tab_position(tab, row, line, col)
+                if (position is not None):
+                    found.append((tab.path, position[0]))
+            else:
+                found.append((fix_path(path), line))
+
+        if (len(found) == 0):
+            found = [(path, line) for path, line, col in self._get_index_definitions(word)]
+
+        found = sorted(set(found), key=found.index)
+        if (len(found) == 0):
+            self.editor.logger.info(self.trn.msg('htk_core_definition_not_found', word))
+        elif (len(found) == 1):
+            self.open(*found[0])
+        else:
+            self._show_window(self.trn.msg('htk_gui_navigator_definitions_title', word))
+            self._add_results([(path, line, '') for path, line in found])
+            self._label.configure(text=self.trn.msg('htk_gui_navigator_found', len(found)))
+
+    def open(self, path, line):
+        """Method opens file and goes to line
+
+        Args:
+            path (str): file path
+            line (int): line
+
+        Returns:
+            void
+
+        """
+
+        if (os.path.isfile(path)):
+            self.editor.open_file(path=path, callback=lambda tab: tab.goto(line))
+        else:
+            self.editor.logger.error(self.trn.msg('htk_core_file_not_found', path))
+
+    def find_usages(self, tab):
+        """Method finds usages of name at cursor in projects
+
+        Files are searched in background, unsaved content of open tabs is used
+
+        Args:
+            tab (obj): tab reference
+
+        Returns:
+            void
+
+        """
+
+        if (not self._is_supported(tab)):
+            return
+
+        row, col = [int(i) for i in tab.text.index(tk.INSERT).split('.')]
+        word = self._get_word(tab, row, col)
+        if (word is None):
+            return
+
+        name = word.split('.')[-1]
+        snapshots = {}
+        for t in self.editor.nb.tab_refs:
+            if (t.path is not None and not t.read_only and t.text.edit_modified()):
+                snapshots[t.path] = t.get_content()
+        roots = self._get_roots()
+        if (tab.path not in snapshots and len([root for root in roots if (tab.path.startswith(root))]) == 0):
+            snapshots[tab.path] = tab.get_content()
+
+        self._search += 1
+        search = self._search
+        self._pending = 1
+        self._show_window(self.trn.msg('htk_gui_navigator_usages_title', name))
+        self._label.configure(text=self.trn.msg('htk_gui_navigator_searching'))
+        self.worker.submit(self._scan, (roots, self._extensions, list(snapshots.keys())),
+                           lambda files: self._on_scan(search, name, files, snapshots))
+
+    @staticmethod
+    def _scan(roots, extensions, paths):
+        """Method scans directories for searched files, executed in background thread
+
+        Args:
+            roots (list): directories
+            extensions (list): file extensions
+            paths (list): files searched additionally
+
+        Returns:
+            list
+
+        """
+
+        found = list(paths)
+        for root in roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if (not d.startswith('.') and d != '__pycache__')]
+                for filename in filenames:
+                    if (filename.split('.')[-1] in extensions):
+                        path = fix_path(os.path.join(dirpath, filename))
+                        if (path not in found):
+                            found.append(path)
+
+        return found
+
+    def _on_scan(self, search, name, files, snapshots):
+        """Method submits searched files in batches
+
+        Args:
+            search (int): search id
+            name (str): searched name
+            files (list): file paths
+            snapshots (dict): content of modified tabs
+
+        Returns:
+            void
+
+        """
+
+        if (search != self._search):
+            return
+
+        pattern = re.compile(r'\b{0}\b'.format(re.escape(name)), re.UNICODE)
+        cancelled = lambda: search != self._search
+        self._pending = 0
+        for i in range(0, len(files), self._batch):
+            batch = files[i:i + self._batch]
+            self._pending += 1
+            self.worker.submit(self._search_files, (batch, pattern, dict([(path, snapshots[path]) for path in batch if (path in snapshots)]), cancelled),
+                               lambda result: self._on_usages(search, result))
+
+        if (self._pending == 0):
+            self._on_usages(search, [])
+
+    @staticmethod
+    def _search_files(files, pattern, snapshots, cancelled):
+        """Method searches files for usages, executed in background thread
+
+        Args:
+            files (list): file paths
+            pattern (obj): compiled regular expression
+            snapshots (dict): content of modified tabs
+            cancelled (callable): returns True if search was superseded
+
+        Returns:
+            list: file path (str), row (int), line content (str)
+
+        """
+
+        usages = []
+        for path in files:
+            if (cancelled()):
+                break
+
+            if (path in snapshots):
+                content = snapshots[path]
+            else:
+                try:
+                    with open(path, 'rb') as f:
+                        content = f.read().decode('utf-8', 'replace')
+                except (IOError, OSError):
+                    continue
+
+            if (pattern.search(content) is None):
+                continue
+
+            for row, line in enumerate(content.split('\n'), 1):
+                if (pattern.search(line) is not None):
+                    usages.append((path, row, line.strip()))
+
+        return usages
+
+    def _on_usages(self, search, usages):
+        """Method adds found usages to window
+
+        Args:
+            search (int): search id
+            usages (list): usages
+
+        Returns:
+            void
+
+        """
+
+        if (search != self._search or self._win is None):
+            return
+
+        self._pending -= 1
+        self._add_results(usages)
+        if (self._pending > 0):
+            self._label.configure(text=self.trn.msg('htk_gui_navigator_searching_found', len(self._results)))
+        else:
+            self._label.configure(text=self.trn.msg('htk_gui_navigator_found', len(self._results)))
+
+    def _show_window(self, title):
+        """Method shows results window
+
+        Window is reused, previous results are cleared
+
+        Args:
+            title (str): window title
+
+        Returns:
+            void
+
+        """
+
+        if (self._win is None):
+            self._win = tk.Toplevel(self.root)
+            self._win.transient(self.root)
+            self._win.geometry('+%d+%d' % (self.root.winfo_screenwidth() / 3, self.root.winfo_screenheight() / 3))
+            self._win.tk.call('wm', 'iconphoto', self._win._w, self.root.images['logo'])
+
+            self._label = tk.Label(self._win, anchor='w')
+            self._label.pack(side=tk.BOTTOM, fill=tk.X, padx=3)
+            vbar = ttk.Scrollbar(self._win, orient=tk.VERTICAL)
+            self._tree = ttk.Treeview(self._win, columns=('line', 'text'), height=15, selectmode='browse', yscrollcommand=vbar.set)
+            vbar.configure(command=self._tree.yview)
+            vbar.pack(side=tk.RIGHT, fill=tk.Y)
+            self._tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+            self._tree.heading('#0', text=self.trn.msg('htk_gui_navigator_file'))
+            self._tree.heading('line', text=self.trn.msg('htk_gui_navigator_line'))
+            self._tree.heading('text', text=self.trn.msg('htk_gui_navigator_text'))
+            self._tree.column('#0', width=300)
+            self._tree.column('line', width=60, stretch=False, anchor='e')
+            self._tree.column('text', width=400)
+
+            self._tree.bind('<Double-1>', self._on_select)
+            self._tree.bind('<Return>', self._on_select)
+            self._win.bind('<Escape>', self._close)
+            self._win.protocol('WM_DELETE_WINDOW', self._close)
+        else:
+            self._tree.delete(*self._tree.get_children())
+            self._win.deiconify()
+
+        self._results = []
+        self._win.title(title)
+        self._win.lift()
+        self._tree.focus_set()
+
+    def _add_results(self, results):
+        """Method adds results to window
+
+        Args:
+            results (list): file path (str), row (int), line content (str)
+
+        Returns:
+            void
+
+        """
+
+        for path, row, text in results:
+            self._tree.insert('', tk.END, iid=str(len(self._results)), text=path, values=(row, text))
+            self._results.append((path, row))
+
+    def _on_select(self, event=None):
+        """Method opens selected result
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        item = self._tree.focus()
+        if (len(item) > 0):
+            self.open(*self._results[int(item)])
+
+    def _close(self, event=None):
+        """Method hides results window and stops search
+
+        Args:
+            event (obj): event
+
+        Returns:
+            void
+
+        """
+
+        self._search += 1
+        self._win.withdraw()
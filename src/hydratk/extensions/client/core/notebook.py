@@ -12,6 +12,7 @@ import os
 
 from hydratk.extensions.client.core.tkimport import tk, ttk, tkmsg
 from hydratk.extensions.client.core.filetab import FileTab
+from hydratk.extensions.client.core.largefiletab import LargeFileTab
 
 class CustomNotebook(ttk.Notebook):
     """Class CustomNotebook
@@ -137,20 +138,21 @@ class CustomNotebook(ttk.Notebook):
 
         return res, idx
 
-    def add_tab(self, path=None, content=None, **kwargs):
+    def add_tab(self, path=None, content=None, large=False, **kwargs):
         """Method adds file tab
 
         Args:
             path (str): file path
             content (str): file content
+            large (bool): open read-only tab in large file mode
             kwargs (dict): key values arguments
 
         Returns:
-            void
+            obj: FileTab
 
         """
 
-        tab = FileTab(self, kwargs['text'], path, content)
+        tab = FileTab(self, kwargs['text'], path, content) if (not large) else LargeFileTab(self, kwargs['text'], path)
         self._tab_refs.append(tab)
         self.add(tab, **kwargs)
         self.select(len(self._tab_refs) - 1)
@@ -158,6 +160,8 @@ class CustomNotebook(ttk.Notebook):
         if (len(self._tab_refs) == 1):
             self._set_tab_related_controls(True)
 
+        return tab
+
     def _get_current_index(self):
         """Method gets index of current tab
 
@@ -200,7 +204,7 @@ class CustomNotebook(ttk.Notebook):
         """
 
         tab = self.get_current_tab()
-        return tab.text.get('1.0', 'end-1c') if (tab is not None) else None
+        return tab.get_content() if (tab is not None) else None
 
     def get_content(self, idx):
         """Method gets content of given tab
@@ -213,7 +217,7 @@ class CustomNotebook(ttk.Notebook):
 
         """
 
-        return self._tab_refs[idx].text.get('1.0', 'end-1c')
+        return self._tab_refs[idx].get_content()
 
     def get_marked_content(self):
         """Method gets marked content
@@ -232,20 +236,22 @@ class CustomNotebook(ttk.Notebook):
         except tk.TclError:
             return None
 
-    def set_current_tab(self, name, path, modified):
+    def set_current_tab(self, name, path, modified, idx=None):
         """Method sets various tab parameters
 
         Args:
             name (str): file name
             path (str): file path
             modified (bool): modified flag
+            idx (int): tab index, current tab if None
 
         Returns:
             void
 
         """
 
-        idx = self._get_current_index()
+        if (idx is None):
+            idx = self._get_current_index()
         self.tab(idx, text=name)
         self._tab_refs[idx].name = name
         self._tab_refs[idx].path = path
@@ -276,9 +282,12 @@ class CustomNotebook(ttk.Notebook):
         menu.entryconfig(5, state=state)
         menu.entryconfig(6, state=state)
         menu.entryconfig(7, state=state)
-        menu.entryconfig(9, state=state)
+        menu.entryconfig(8, state=state)
         menu.entryconfig(10, state=state)
         menu.entryconfig(11, state=state)
+        menu.entryconfig(12, state=state)
+        menu.entryconfig(14, state=state)
+        menu.entryconfig(15, state=state)
 
         menu = self.editor.root.menus['view']
         menu.entryconfig(3, state=state)
@@ -334,6 +343,7 @@ class CustomNotebook(ttk.Notebook):
                 if (res):
                     self.editor.save_file(path=tab.path)
 
+            tab.close()
             self.forget(index)
             self.editor.yoda_tree.delete_test(tab.path)
             del self._tab_refs[index]
@@ -12,6 +12,7 @@ import os
 from importlib import import_module
 
 from hydratk.extensions.client.core.tkimport import tk
+from hydratk.extensions.client.core.colorizer import Colorizer
 
 class Plugin(object):
     """Class Plugin
@@ -238,3 +239,17 @@ class Plugin(object):
             menu.add_command(label=self.trn.msg(label), accelerator=shortcut, command=command, state=state)
             if (event is not None):
                 self.root.bind(event, command)
+
+    def _register_lexer(self, lexer, suffixes):
+        """Method registers lexer for syntax colorizing
+
+        Args:
+            lexer (obj): Lexer instance, see client.core.lexer
+            suffixes (list): file suffixes
+
+        Returns:
+            void
+
+        """
+
+        Colorizer.get_instance().register_lexer(lexer, suffixes)
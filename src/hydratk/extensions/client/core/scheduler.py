@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Update scheduler
+
+.. module:: client.core.scheduler
+   :platform: Windows, Unix
+   :synopsis: Update scheduler
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+class Scheduler(object):
+    """Class Scheduler
+
+    Consumers are marked dirty by events and flushed once when idle,
+    consumers with delay are debounced. Repeated marks are coalesced.
+
+    """
+
+    # references
+    _widget = None
+
+    # consumers
+    _consumers = None
+    _order = None
+    _dirty = None
+    _idle_job = None
+    _jobs = None
+
+    def __init__(self, widget):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           widget (obj): widget used for scheduling
+
+        """
+
+        self._widget = widget
+        self._consumers = {}
+        self._order = []
+        self._dirty = set()
+        self._jobs = {}
+
+    @property
+    def widget(self):
+        """ widget property getter """
+
+        return self._widget
+
+    def register(self, key, callback, delay=0):
+        """Method registers consumer
+
+        Args:
+            key (str): consumer key
+            callback (callable): called without arguments on flush
+            delay (int): debounce delay in ms, flushed when idle if 0
+
+        Returns:
+            void
+
+        """
+
+        if (key not in self._consumers):
+            self._order.append(key)
+        self._consumers[key] = (callback, delay)
+
+    def mark(self, key):
+        """Method marks consumer dirty
+
+        Args:
+            key (str): consumer key
+
+        Returns:
+            void
+
+        """
+
+        delay = self._consumers[key][1]
+        if (delay > 0):
+            if (key in self._jobs):
+                self.widget.after_cancel(self._jobs[key])
+            self._jobs[key] = self.widget.after(delay, lambda: self._flush_delayed(key))
+        else:
+            self._dirty.add(key)
+            if (self._idle_job is None):
+                self._idle_job = self.widget.after_idle(self._flush_idle)
+
+    def is_dirty(self, key):
+        """Method checks if consumer is dirty
+
+        Args:
+            key (str): consumer key
+
+        Returns:
+            bool
+
+        """
+
+        return key in self._dirty or key in self._jobs
+
+    def flush(self, key=None):
+        """Method flushes dirty consumers immediately
+
+        Args:
+            key (str): consumer key, all consumers if None
+
+        Returns:
+            void
+
+        """
+
+        for k in self._order if (key is None) else [key]:
+            if (k in self._jobs):
+                self.widget.after_cancel(self._jobs.pop(k))
+                self._consumers[k][0]()
+            elif (k in self._dirty):
+                self._dirty.discard(k)
+                self._consumers[k][0]()
+
+    def cancel(self, key=None):
+        """Method cancels dirty consumers without flush
+
+        Args:
+            key (str): consumer key, all consumers if None
+
+        Returns:
+            void
+
+        """
+
+        for k in self._order if (key is None) else [key]:
+            if (k in self._jobs):
+                self.widget.after_cancel(self._jobs.pop(k))
+            self._dirty.discard(k)
+
+    def _flush_idle(self):
+        """Method flushes dirty consumers when idle
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._idle_job = None
+        for key in self._order:
+            if (key in self._dirty):
+                self._dirty.discard(key)
+                self._consumers[key][0]()
+
+    def _flush_delayed(self, key):
+        """Method flushes debounced consumer
+
+        Args:
+            key (str): consumer key
+
+        Returns:
+            void
+
+        """
+
+        del self._jobs[key]
+        self._consumers[key][0]()
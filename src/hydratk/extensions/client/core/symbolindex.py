@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+"""Symbol index
+
+.. module:: client.core.symbolindex
+   :platform: Windows, Unix
+   :synopsis: Symbol index
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+from hydratk.extensions.client.core.tkimport import PYTHON_MAJOR_VERSION
+from hydratk.extensions.client.core.worker import Worker
+from hydratk.extensions.client.core.utils import fix_path, get_cache_dir, write_file
+
+import ast
+import multiprocessing
+import os
+
+if (PYTHON_MAJOR_VERSION == 2):
+    import cPickle as pickle
+else:
+    import pickle
+
+def _get_arg(arg):
+    """Method gets argument name
+
+    Args:
+        arg (obj): ast argument
+
+    Returns:
+        str
+
+    """
+
+    if (isinstance(arg, str)):
+        return arg
+
+    return getattr(arg, 'arg', None) or getattr(arg, 'id', '')
+
+def _get_default(node):
+    """Method gets argument default value
+
+    Args:
+        node (obj): ast expression
+
+    Returns:
+        str: literal value, ... otherwise
+
+    """
+
+    try:
+        return repr(ast.literal_eval(node))
+    except (ValueError, TypeError, SyntaxError):
+        return '...'
+
+def _get_params(node, method=False):
+    """Method gets function parameters
+
+    Args:
+        node (obj): ast function
+        method (bool): first parameter is omitted
+
+    Returns:
+        tuple
+
+    """
+
+    args = node.args
+    names = [_get_arg(arg) for arg in getattr(args, 'posonlyargs', []) + args.args]
+    defaults = [None] * (len(names) - len(args.defaults)) + list(args.defaults)
+    params = [name if (default is None) else '{0}={1}'.format(name, _get_default(default)) for name, default in zip(names, defaults)]
+
+    kwonlyargs = getattr(args, 'kwonlyargs', [])
+    if (args.vararg):
+        params.append('*' + _get_arg(args.vararg))
+    elif (len(kwonlyargs) > 0):
+        params.append('*')
+    for arg, default in zip(kwonlyargs, args.kw_defaults if (len(kwonlyargs) > 0) else []):
+        params.append(_get_arg(arg) if (default is None) else '{0}={1}'.format(_get_arg(arg), _get_default(default)))
+    if (args.kwarg):
+        params.append('**' + _get_arg(args.kwarg))
+
+    return tuple(params[1:] if (method and len(names) > 0) else params)
+
+def parse_file(task):
+    """Method parses Python file, executed in pool process
+
+    Args:
+        task (tuple): file path (str), module name (str)
+
+    Returns:
+        tuple: file path (str), symbols (list)
+
+    """
+
+    path, module = task
+    symbols = []
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), path)
+    except Exception:
+        return path, symbols
+
+    functions = tuple([ast.FunctionDef] + ([ast.AsyncFunctionDef] if (hasattr(ast, 'AsyncFunctionDef')) else []))
+    for node in tree.body:
+        if (isinstance(node, functions)):
+            symbols.append((node.name, 'function', module, path, node.lineno, _get_params(node), ast.get_docstring(node)))
+        elif (isinstance(node, ast.ClassDef)):
+            params = ()
+            for child in node.body:
+                if (isinstance(child, functions)):
+                    if (child.name == '__init__'):
+                        params = _get_params(child, True)
+                    symbols.append(('{0}.{1}'.format(node.name, child.name), 'function', module, path, child.lineno,
+                                    _get_params(child, True), ast.get_docstring(child)))
+            symbols.append((node.name, 'class', module, path, node.lineno, params, ast.get_docstring(node)))
+
+    return path, symbols
+
+class SymbolIndex(object):
+    """Class SymbolIndex
+
+    Python files of project libraries and helpers are parsed by ast in process pool.
+    Pool processes are spawned, not forked, as pool is created in background thread.
+    Index is persisted, only files with changed modification time or size are parsed again.
+    Symbol is tuple of name, kind (function|class), module, file path, line, parameters, docstring.
+
+    """
+
+    _instance = None
+    _instance_created = False
+
+    # references
+    _root = None
+    _config = None
+    _worker = None
+
+    # index
+    _roots = None
+    _files = None
+    _names = None
+    _modules = None
+    _persist = False
+    _cache_file = None
+    _pool_min = 32
+    _key = ('symbolindex', 'update')
+
+    def __init__(self):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           none
+
+        Raises:
+           error: ValueError
+
+        """
+
+        if (self._instance_created == False):
+            raise ValueError('For creating class instance please use the get_instance method instead!')
+        if (self._instance is not None):
+            raise ValueError('A Class instance already exists, use get_instance method instead!')
+
+        from hydratk.extensions.client.core.gui import Gui
+        self._root = Gui.get_instance()
+        self._config = self.root.cfg
+        self._worker = Worker(self.root)
+        self._roots = []
+        self._names = {}
+        self._modules = {}
+
+        self._parse_config()
+
+    @staticmethod
+    def get_instance():
+        """Method gets SymbolIndex singleton instance
+
+        Args:
+            none
+
+        Returns:
+            obj
+
+        """
+
+        if (SymbolIndex._instance is None):
+            SymbolIndex._instance_created = True
+            SymbolIndex._instance = SymbolIndex()
+
+        return SymbolIndex._instance
+
+    @property
+    def root(self):
+        """ root property getter """
+
+        return self._root
+
+    @property
+    def config(self):
+        """ config property getter """
+
+        return self._config
+
+    def _parse_config(self):
+        """Method parses configuration
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        cfg = self.config.data['Core']['editor']['cache']
+        self._persist = (int(cfg['persist']) == 1)
+        self._cache_file = fix_path(os.path.join(get_cache_dir(cfg['cachedir']), 'symbols.cache'))
+
+    def update(self, roots=None):
+        """Method updates index in background
+
+        Args:
+            roots (list): indexed directories, previous ones if None
+
+        Returns:
+            void
+
+        """
+
+        if (roots is not None):
+            self._roots = list(roots)
+
+        self._worker.submit(self._update, (list(self._roots), self._files, self._cache_file if (self._persist) else None, self._pool_min),
+                            self._apply, key=self._key)
+
+    @staticmethod
+    def _scan(roots):
+        """Method scans directories for Python files
+
+        Args:
+            roots (list): directories
+
+        Returns:
+            dict: file path, module name (str), modification time (float), size (int)
+
+        """
+
+        found = {}
+        for root in roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if (not d.startswith('.') and d != '__pycache__')]
+                for filename in filenames:
+                    if (filename.endswith('.py')):
+                        path = fix_path(os.path.join(dirpath, filename))
+                        if (path in found):
+                            continue
+
+                        module = os.path.relpath(path, root)[:-3].replace('\\', '/').split('/')
+                        if (module[-1] == '__init__'):
+                            module = module[:-1]
+                        stat = os.stat(path)
+                        found[path] = ('.'.join(module), stat.st_mtime, stat.st_size)
+
+        return found
+
+    @staticmethod
+    def _update(roots, files, cache_file, pool_min):
+        """Method updates index, executed in background thread
+
+        Changed files are parsed in process pool if there are enough of them
+        and spawn start method is available. Index write error does not
+        prevent using of index.
+
+        Args:
+            roots (list): indexed directories
+            files (dict): current index, loaded from file if None
+            cache_file (str): index file, index is not persisted if None
+            pool_min (int): minimum count of changed files parsed in pool
+
+        Returns:
+            tuple: index (dict of file path, module name (str), modification time (float), size (int), symbols (list)),
+                   write error (str), None if index was written
+
+        """
+
+        if (files is None):
+            files = {}
+            if (cache_file is not None and os.path.exists(cache_file)):
+                try:
+                    with open(cache_file, 'rb') as f:
+                        files = pickle.load(f)
+                except Exception:
+                    files = {}
+
+        found = SymbolIndex._scan(roots)
+        tasks = [(path, found[path][0]) for path in found
+                 if (path not in files or files[path][:3] != found[path])]
+        changed = len(tasks) > 0 or len(set(files.keys()) - set(found.keys())) > 0
+        files = dict([(path, files[path]) for path in found if (path in files)])
+
+        if (len(tasks) >= pool_min and hasattr(multiprocessing, 'get_context')):
+            try:
+                pool = multiprocessing.get_context('spawn').Pool()
+                try:
+                    results = pool.map(parse_file, tasks, max(len(tasks) // (4 * multiprocessing.cpu_count()), 1))
+                finally:
+                    pool.close()
+                    pool.join()
+            except (OSError, ImportError):
+                results = [parse_file(task) for task in tasks]
+        else:
+            results = [parse_file(task) for task in tasks]
+
+        for path, symbols in results:
+            files[path] = found[path] + (symbols,)
+
+        error = None
+        if (changed and cache_file is not None):
+            try:
+                cachedir = os.path.dirname(cache_file)
+                if (not os.path.exists(cachedir)):
+                    os.makedirs(cachedir, 0o700)
+                write_file(cache_file, pickle.dumps(files, 2), binary=True)
+            except Exception as ex:
+                error = str(ex)
+
+        return files, error
+
+    def _apply(self, result):
+        """Method applies updated index
+
+        Args:
+            result (tuple): index (dict), write error (str)
+
+        Returns:
+            void
+
+        """
+
+        files, error = result
+        if (error is not None):
+            self.root.logger.error(self.root.trn.msg('htk_core_cache_save_error', self._cache_file, error))
+
+        self._files = files
+        self._names, self._modules = {}, {}
+        for module, mtime, size, symbols in files.values():
+            for symbol in symbols:
+                self._names.setdefault(symbol[0], []).append(symbol)
+                if ('.' not in symbol[0]):
+                    self._modules.setdefault(module, []).append(symbol)
+
+    def get_symbols(self, name):
+        """Method gets symbols with given name
+
+        Args:
+            name (str): symbol name, method name is qualified by class name
+
+        Returns:
+            list
+
+        """
+
+        return self._names.get(name, [])
+
+    def get_module_symbols(self, module):
+        """Method gets top level symbols of module
+
+        Args:
+            module (str): module name
+
+        Returns:
+            list
+
+        """
+
+        return self._modules.get(module, [])
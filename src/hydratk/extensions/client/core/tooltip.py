@@ -58,3 +58,89 @@ class ToolTip(object):
         self._win.wm_geometry("+%d+%d" % (x, y))
         label = tk.Label(self._win, text=self._text, justify='left', background='#FFFF00', relief='solid', borderwidth=1)
         label.pack(ipadx=1)
+
+class CallTip(ToolTip):
+    """Class CallTip
+
+    Tooltip displayed on demand below text index, highlighted part is underlined
+
+    """
+
+    _tip = None
+
+    def __init__(self, parent):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           parent (obj): Text widget
+
+        """
+
+        self._parent = parent
+
+    @property
+    def parent(self):
+        """ parent property getter """
+
+        return self._parent
+
+    @property
+    def visible(self):
+        """ visible property getter """
+
+        return self._win is not None
+
+    def show(self, text, index, highlight=None):
+        """Method shows tooltip
+
+        Args:
+            text (str): tooltip text
+            index (str): text index
+            highlight (tuple): start and stop column of highlighted part of first line
+
+        Returns:
+            void
+
+        """
+
+        bbox = self._parent.bbox(index)
+        if (bbox is None):
+            self.hide()
+            return
+
+        x = self._parent.winfo_rootx() + bbox[0]
+        y = self._parent.winfo_rooty() + bbox[1] + bbox[3]
+        if (self._win is None):
+            self._win = tk.Toplevel(self._parent)
+            self._win.wm_overrideredirect(True)
+            self._tip = tk.Text(self._win, background='#FFFF00', relief='solid', borderwidth=1, wrap=tk.NONE,
+                                takefocus=0, font=self._parent.cget('font'))
+            self._tip.tag_configure('highlight', underline=True)
+            self._tip.pack(ipadx=1)
+
+        lines = text.split('\n')
+        self._text = text
+        self._tip.configure(state=tk.NORMAL, width=max([len(line) for line in lines]), height=len(lines))
+        self._tip.delete('1.0', tk.END)
+        self._tip.insert('1.0', text)
+        if (highlight is not None):
+            self._tip.tag_add('highlight', '1.{0}'.format(highlight[0]), '1.{0}'.format(highlight[1]))
+        self._tip.configure(state=tk.DISABLED)
+        self._win.wm_geometry('+%d+%d' % (x, y))
+
+    def hide(self):
+        """Method hides tooltip
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        if (self._win is not None):
+            self._win.destroy()
+            self._win, self._tip = None, None
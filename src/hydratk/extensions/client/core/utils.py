@@ -8,6 +8,16 @@
 
 """
 
+from hydratk.extensions.client.core.tkimport import PYTHON_MAJOR_VERSION
+
+import os
+import shutil
+import tempfile
+
+# process umask applied to new files, read once as os.umask cannot be read without setting it
+_umask = os.umask(0)
+os.umask(_umask)
+
 def fix_path(path):
     """Method fixes Windows path
 
@@ -21,3 +31,64 @@ def fix_path(path):
     
     path = path.replace('\\', '/')
     return path
+
+def get_cache_dir(cachedir='default'):
+    """Method gets cache directory
+
+    Default directory is per user, cache files are not shared between users
+
+    Args:
+        cachedir (str): configured directory
+
+    Returns:
+        str
+
+    """
+
+    if (cachedir == 'default'):
+        cachedir = os.path.join(os.path.expanduser('~'), '.hydratk', 'client', 'cache')
+
+    return fix_path(cachedir)
+
+def write_file(path, content, fsync=False, binary=False):
+    """Method writes file atomically
+
+    Content is written to temporary file in the same directory
+    which replaces target file, target is never truncated
+
+    Args:
+        path (str): file path
+        content (str): file content
+        fsync (bool): flush file to disk before replace
+        binary (bool): content is bytes
+
+    Returns:
+        void
+
+    """
+
+    path = os.path.realpath(path)
+    directory, name = os.path.split(path)
+    fd, tmp = tempfile.mkstemp(prefix='.{0}.'.format(name), suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb' if (binary) else 'w') as f:
+            f.write(content)
+            if (fsync):
+                f.flush()
+                os.fsync(f.fileno())
+
+        if (os.path.exists(path)):
+            shutil.copymode(path, tmp)
+        else:
+            os.chmod(tmp, 0o666 & ~_umask)
+
+        if (PYTHON_MAJOR_VERSION == 2):
+            if (os.name == 'nt' and os.path.exists(path)):
+                os.remove(path)
+            os.rename(tmp, path)
+        else:
+            os.replace(tmp, path)
+    except Exception:
+        if (os.path.exists(tmp)):
+            os.remove(tmp)
+        raise
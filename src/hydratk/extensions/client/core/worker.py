@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Background worker
+
+.. module:: client.core.worker
+   :platform: Windows, Unix
+   :synopsis: Background worker
+.. moduleauthor:: Petr Rašek <bowman@hydratk.org>
+
+"""
+
+from hydratk.extensions.client.core.tkimport import PYTHON_MAJOR_VERSION
+
+import threading
+import traceback
+
+if (PYTHON_MAJOR_VERSION == 2):
+    from Queue import Queue, Empty
+else:
+    from queue import Queue, Empty
+
+class Worker(object):
+    """Class Worker
+
+    Jobs are executed in background threads, Tk is not touched there.
+    Results are passed to callbacks on main thread, polled by after.
+
+    """
+
+    # references
+    _root = None
+
+    # jobs
+    _jobs = None
+    _results = None
+    _threads = None
+    _keys = None
+    _job_id = 0
+    _pending = 0
+    _poll_job = None
+    _poll_interval = 20
+    _lock = None
+
+    def __init__(self, root, threads=1):
+        """Class constructor
+
+        Called when object is initialized
+
+        Args:
+           root (obj): root frame
+           threads (int): count of threads
+
+        """
+
+        self._root = root
+        self._jobs = Queue()
+        self._results = Queue()
+        self._keys = {}
+        self._lock = threading.Lock()
+
+        self._threads = []
+        for i in range(threads):
+            thread = threading.Thread(target=self._run)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def root(self):
+        """ root property getter """
+
+        return self._root
+
+    def submit(self, func, args=(), callback=None, key=None, errback=None):
+        """Method submits job
+
+        Job with same key supersedes pending one, superseded job is skipped
+        and its result is dropped
+
+        Args:
+            func (callable): job, executed in background thread
+            args (tuple): job arguments
+            callback (callable): called with job result on main thread
+            key (obj): job key
+            errback (callable): called with traceback on main thread, error is logged by default
+
+        Returns:
+            int: job id
+
+        """
+
+        with self._lock:
+            self._job_id += 1
+            job_id = self._job_id
+            self._pending += 1
+            if (key is not None):
+                self._keys[key] = job_id
+
+        self._jobs.put((job_id, key, func, args, callback, errback))
+        if (self._poll_job is None):
+            self._poll_job = self.root.after(self._poll_interval, self._poll)
+
+        return job_id
+
+    def cancel(self, key):
+        """Method cancels pending job with given key
+
+        Args:
+            key (obj): job key
+
+        Returns:
+            void
+
+        """
+
+        with self._lock:
+            self._keys.pop(key, None)
+
+    def is_current(self, job_id, key):
+        """Method checks if job was not superseded or cancelled
+
+        Args:
+            job_id (int): job id
+            key (obj): job key
+
+        Returns:
+            bool
+
+        """
+
+        return key is None or self._keys.get(key) == job_id
+
+    def _run(self):
+        """Method executes jobs, thread target
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        while True:
+            job_id, key, func, args, callback, errback = self._jobs.get()
+            if (not self.is_current(job_id, key)):
+                self._results.put((job_id, key, None, None, None, None))
+                continue
+
+            try:
+                result, error = func(*args), None
+            except Exception:
+                result, error = None, traceback.format_exc()
+
+            self._results.put((job_id, key, result, error, callback, errback))
+
+    def wait(self):
+        """Method waits until all jobs are finished
+
+        Results are passed to callbacks, jobs submitted by callbacks are waited too
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        while (self._pending > 0):
+            self._dispatch(self._results.get())
+
+    def _poll(self):
+        """Method passes job results to callbacks on main thread
+
+        Args:
+            none
+
+        Returns:
+            void
+
+        """
+
+        self._poll_job = None
+        while True:
+            try:
+                result = self._results.get_nowait()
+            except Empty:
+                break
+
+            self._dispatch(result)
+
+        if (self._pending > 0 and self._poll_job is None):
+            self._poll_job = self.root.after(self._poll_interval, self._poll)
+
+    def _dispatch(self, result):
+        """Method passes job result to callback
+
+        Args:
+            result (tuple): job id, key, result, error, callback, errback
+
+        Returns:
+            void
+
+        """
+
+        job_id, key, result, error, callback, errback = result
+        with self._lock:
+            self._pending -= 1
+            current = self.is_current(job_id, key)
+            if (current and key is not None):
+                del self._keys[key]
+
+        if (not current):
+            return
+        elif (error is not None):
+            if (errback is not None):
+                errback(error)
+            else:
+                self.root.logger.error(error)
+        elif (callback is not None):
+            callback(result)
@@ -291,12 +291,49 @@ class YodaTree(tk.LabelFrame):
 
         """
 
+        self.update_test(path, self.parse(path, content))
+
+    def parse(self, path, content):
+        """Method parses test content
+
+        Tk is not accessed, method can be executed in background thread
+
+        Args:
+            path (str): file path
+            content (str): file content
+
+        Returns:
+            tuple: result (bool), test (dict)
+
+        """
+
+        result, test = False, {}
         if (path != None and ('.jedi' in path or '.padawan' in path)):
             try:
-                content = safe_load(content)
-                self._tests[path] = {'content': content}
-                self._populate_tree('', content)
+                result, test = True, safe_load(content)
             except (ScannerError, ParserError):
+                pass
+
+        return result, test
+
+    def update_test(self, path, parsed):
+        """Method updates tree with parsed test
+
+        Args:
+            path (str): file path
+            parsed (tuple): result of method parse
+
+        Returns:
+            void
+
+        """
+
+        if (path != None and ('.jedi' in path or '.padawan' in path)):
+            result, test = parsed
+            if (result):
+                self._tests[path] = {'content': test}
+                self._populate_tree('', test)
+            else:
                 self.logger.debug(self.trn.msg('htk_core_invalid_yaml', path))
                 self._tests[path] = {'content': {}}
                 self.clear_tree()
@@ -405,7 +442,7 @@ class YodaTree(tk.LabelFrame):
                 break
 
         if (idx):
-            tab.highlight_line(row=idx.split('.')[0])
+            tab.highlight_line(row=idx.split('.')[0], see=True)
             tab.update_line_numbers()
             tab.update_info_bar(index=idx)
         else:
@@ -498,9 +535,9 @@ class YodaTree(tk.LabelFrame):
 
         tab.text.insert(idx, content)
         tab.text.edit_separator()
+        tab.colorize(idx, '{0}+{1}c'.format(idx, len(content)))
         idx = self._find_item(tab, tree_path)
-        tab.colorize()
-        tab.highlight_line(row=idx.split('.')[0])
+        tab.highlight_line(row=idx.split('.')[0], see=True)
         tab.update_line_numbers()
         tab.update_info_bar(index=idx)
 
@@ -65,19 +65,41 @@ class Plugin(plugin.Plugin):
             path = tab.path
             if (path != None):
                 self.logger.debug(self.trn.msg('htk_syntaxchecker_start', path))
-                res, error = self._check(path, tab)
+                version = tab.version
+                self.root.worker.submit(self._check, (path, tab.name, tab.get_content()),
+                                        lambda res: self._show_result(tab, version, res), key=(str(tab), self.plugin_id))
 
-                if (res):
-                    self.logger.info(self.trn.msg('htk_syntaxchecker_success'))
-                else:
-                    self.logger.warn(self.trn.msg('htk_syntaxchecker_error', error))
+    def _show_result(self, tab, version, res):
+        """Method shows syntax check result
 
-    def _check(self, path, tab):
+        Result is dropped if tab was changed meanwhile
+
+        Args:
+            tab (obj): FileTab reference
+            version (int): tab version of checked content
+            res (tuple): result (bool), error (str)
+
+        Returns:
+            void
+
+        """
+
+        if (tab.version == version):
+            result, error = res
+            if (result):
+                self.logger.info(self.trn.msg('htk_syntaxchecker_success'))
+            else:
+                self.logger.warn(self.trn.msg('htk_syntaxchecker_error', error))
+
+    def _check(self, path, name, content):
         """Method checks syntax
 
+        Tk is not accessed, method is executed in background thread
+
         Args:
             path (str): file path
-            tab (obj): FileTab reference
+            name (str): file name
+            content (str): file content
 
         Returns:
             tuple: result (bool), error (str)
@@ -86,9 +108,9 @@ class Plugin(plugin.Plugin):
 
         suffix = path.split('.')[-1]
         if (suffix == 'py'):
-            result, error = self._check_python(tab.name, tab.text.get('1.0', 'end-1c'))
+            result, error = self._check_python(name, content)
         elif (suffix in ['jedi', 'padawan']):
-            result, error = self._check_jedi(tab.name, tab.text.get('1.0', 'end-1c'))
+            result, error = self._check_jedi(name, content)
         else:
             result, error = True, ''
 
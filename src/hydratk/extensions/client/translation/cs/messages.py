@@ -25,7 +25,15 @@ msg = {
     'htk_core_draft_created' : "Draft {0} vytvořen",
     'htk_core_file_opened': "Soubor {0} otevřen",
     'htk_core_file_saved': "Soubor {0} uložen",
+    'htk_core_file_save_error': "Soubor {0} nemohl být uložen",
     'htk_core_file_deleted': "Soubor {0} smazán",
+    'htk_core_large_file_opened': "Soubor {0} otevřen pouze pro čtení v režimu velkého souboru",
+    'htk_core_file_read_only': "Soubor {0} je pouze pro čtení",
+    'htk_core_file_indexing': "Soubor {0} se indexuje",
+    'htk_core_file_not_found': "Soubor {0} nenalezen",
+    'htk_core_cache_save_error': "Cache {0} nelze uložit: {1}",
+    'htk_core_replaced': "Nahrazeno {0} výskytů v {1}",
+    'htk_core_definition_not_found': "Definice {0} nenalezena",
     'htk_core_directory_created' : "Adresář {0} vytvořen",
     'htk_core_directory_deleted' : "Adresář {0} smazán",
     'htk_core_copied' : "{0} zkopírováno do {1}",
@@ -53,9 +61,12 @@ msg = {
     'htk_gui_menu_edit_paste' : "Vložit",
     'htk_gui_menu_edit_delete' : "Smazat",
     'htk_gui_menu_edit_select_all' : "Vybrat vše",
+    'htk_gui_menu_edit_reformat' : "Formátovat",
     'htk_gui_menu_edit_goto' : "Přejít",
     'htk_gui_menu_edit_find' : "Najít",
     'htk_gui_menu_edit_replace' : "Nahradit",
+    'htk_gui_menu_edit_goto_definition' : "Přejít na definici",
+    'htk_gui_menu_edit_find_usages' : "Najít použití",
     'htk_gui_menu_view' : "Zobrazení",
     'htk_gui_menu_view_show_line_number' : "Čísla řádků",
     'htk_gui_menu_view_show_info_bar' : "Informační řádek",
@@ -90,6 +101,8 @@ msg = {
     'htk_gui_explorer_delete_directory' : "Opravdu chcete smazat adresář {0}?",
     'htk_gui_explorer_delete_project' : "Opravdu chcete smazat projekt {0}?",
 
+    'htk_gui_autocompleter_loading' : "Načítání...",
+
     'htk_gui_editor_label' : "Editor",
     'htk_gui_editor_menu_undo' : "Zpět",
     'htk_gui_editor_menu_redo' : "Vpřed",
@@ -98,20 +111,24 @@ msg = {
     'htk_gui_editor_menu_paste' : "Vložit",
     'htk_gui_editor_menu_delete' : "Smazat",
     'htk_gui_editor_menu_select_all' : "Vybrat vše",
+    'htk_gui_editor_menu_reformat' : "Formátovat",
     'htk_gui_editor_menu_goto' : "Přejít",
     'htk_gui_editor_menu_find' : "Najít",
     'htk_gui_editor_menu_replace' : "Nahradit",
+    'htk_gui_editor_menu_goto_definition' : "Přejít na definici",
+    'htk_gui_editor_menu_find_usages' : "Najít použití",
     'htk_gui_editor_tab_new_text' : "Nový",
     'htk_gui_editor_filetypes' : "všechny soubory",
+    'htk_gui_editor_loading' : "Načítání {0} %, stiskněte Escape pro zrušení",
     'htk_gui_editor_close_save_title' : "Potvrzení",
     'htk_gui_editor_close_save_question' : "Soubor {0} byl změněn, chcete uložit změny?",
     'htk_gui_editor_goto_title' : "Přejít",
     'htk_gui_editor_goto_text' : "Řádek:",
-    'htk_gui_editor_find_title' : "Najít",
     'htk_gui_editor_find_text' : "Najít:",
-    'htk_gui_editor_find_find_all': "Najít vše",
     'htk_gui_editor_find_ignore_case': "Ignorovat velikost písmen",
     'htk_gui_editor_find_regexp': "Regulární výraz",
+    'htk_gui_editor_find_match': "{0} z {1}",
+    'htk_gui_editor_find_not_found': "Žádné shody",
     'htk_gui_editor_replace_title' : "Nahradit",
     'htk_gui_editor_replace_find' : "Najít:",
     'htk_gui_editor_replace_replace' : "Nahradit:",
@@ -119,6 +136,15 @@ msg = {
     'htk_gui_editor_replace_ignore_case' : "Ignorovat velikost písmen",
     'htk_gui_editor_replace_regexp' : "Regulární výraz",
 
+    'htk_gui_navigator_definitions_title' : "Definice {0}",
+    'htk_gui_navigator_usages_title' : "Použití {0}",
+    'htk_gui_navigator_file' : "Soubor",
+    'htk_gui_navigator_line' : "Řádek",
+    'htk_gui_navigator_text' : "Text",
+    'htk_gui_navigator_searching' : "Hledání...",
+    'htk_gui_navigator_searching_found' : "Hledání, nalezeno {0}...",
+    'htk_gui_navigator_found' : "Nalezeno {0}",
+
     'htk_gui_yoda_tree_label' : "Yoda strom",
     'htk_gui_yoda_tree_menu_add_scenario' : "Přidat testovací scénář",
     'htk_gui_yoda_tree_menu_add_case' : "Přidat testovací případ",
@@ -25,7 +25,15 @@ msg = {
     'htk_core_draft_created' : "Draft {0} created",
     'htk_core_file_opened': "File {0} opened",
     'htk_core_file_saved': "File {0} saved",
+    'htk_core_file_save_error': "File {0} could not be saved",
     'htk_core_file_deleted': "File {0} deleted",
+    'htk_core_large_file_opened': "File {0} opened read-only in large file mode",
+    'htk_core_file_read_only': "File {0} is read-only",
+    'htk_core_file_indexing': "File {0} is being indexed",
+    'htk_core_file_not_found': "File {0} not found",
+    'htk_core_cache_save_error': "Cache {0} could not be saved: {1}",
+    'htk_core_replaced': "{0} occurrences replaced in {1}",
+    'htk_core_definition_not_found': "Definition of {0} not found",
     'htk_core_directory_created' : "Directory {0} created",
     'htk_core_directory_deleted' : "Directory {0} deleted",
     'htk_core_copied' : "{0} copied to {1}",
@@ -53,9 +61,12 @@ msg = {
     'htk_gui_menu_edit_paste' : "Paste",
     'htk_gui_menu_edit_delete' : "Delete",
     'htk_gui_menu_edit_select_all' : "Select All",
+    'htk_gui_menu_edit_reformat' : "Reformat",
     'htk_gui_menu_edit_goto' : "Goto",
     'htk_gui_menu_edit_find' : "Find",
     'htk_gui_menu_edit_replace' : "Replace",
+    'htk_gui_menu_edit_goto_definition' : "Goto definition",
+    'htk_gui_menu_edit_find_usages' : "Find usages",
     'htk_gui_menu_view' : "View",
     'htk_gui_menu_view_show_line_number' : "Line numbers",
     'htk_gui_menu_view_show_info_bar' : "Info bar",
@@ -90,6 +101,8 @@ msg = {
     'htk_gui_explorer_delete_directory' : "Do you want to delete directory {0}?",
     'htk_gui_explorer_delete_project' : "Do you want to delete project {0}?",
 
+    'htk_gui_autocompleter_loading' : "Loading...",
+
     'htk_gui_editor_label' : "Editor",
     'htk_gui_editor_menu_undo' : "Undo",
     'htk_gui_editor_menu_redo' : "Redo",
@@ -98,20 +111,24 @@ msg = {
     'htk_gui_editor_menu_paste' : "Paste",
     'htk_gui_editor_menu_delete' : "Delete",
     'htk_gui_editor_menu_select_all' : "Select All",
+    'htk_gui_editor_menu_reformat' : "Reformat",
     'htk_gui_editor_menu_goto' : "Goto",
     'htk_gui_editor_menu_find' : "Find",
     'htk_gui_editor_menu_replace' : "Replace",
+    'htk_gui_editor_menu_goto_definition' : "Goto definition",
+    'htk_gui_editor_menu_find_usages' : "Find usages",
     'htk_gui_editor_tab_new_text' : "New",
     'htk_gui_editor_filetypes' : "all files",
+    'htk_gui_editor_loading' : "Loading {0} %, press Escape to cancel",
     'htk_gui_editor_close_save_title' : "Confirmation",
     'htk_gui_editor_close_save_question' : "File {0} was modified, do you want to save changes?",
     'htk_gui_editor_goto_title' : "Goto",
     'htk_gui_editor_goto_text' : "Row:",
-    'htk_gui_editor_find_title' : "Find",
     'htk_gui_editor_find_text' : "Find:",
-    'htk_gui_editor_find_find_all': "Find all",
     'htk_gui_editor_find_ignore_case': "Ignore case",
     'htk_gui_editor_find_regexp': "Regular expression",
+    'htk_gui_editor_find_match': "{0} of {1}",
+    'htk_gui_editor_find_not_found': "No matches",
     'htk_gui_editor_replace_title' : "Replace",
     'htk_gui_editor_replace_find' : "Find:",
     'htk_gui_editor_replace_replace' : "Replace:",
@@ -119,6 +136,15 @@ msg = {
     'htk_gui_editor_replace_ignore_case' : "Ignore case",
     'htk_gui_editor_replace_regexp' : "Regular expression",
 
+    'htk_gui_navigator_definitions_title' : "Definitions of {0}",
+    'htk_gui_navigator_usages_title' : "Usages of {0}",
+    'htk_gui_navigator_file' : "File",
+    'htk_gui_navigator_line' : "Row",
+    'htk_gui_navigator_text' : "Text",
+    'htk_gui_navigator_searching' : "Searching...",
+    'htk_gui_navigator_searching_found' : "Searching, found {0}...",
+    'htk_gui_navigator_found' : "Found {0}",
+
     'htk_gui_yoda_tree_label' : "Yoda tree",
     'htk_gui_yoda_tree_menu_add_scenario' : "Add test scenario",
     'htk_gui_yoda_tree_menu_add_case' : "Add test case",